@@ -0,0 +1,257 @@
+"""Headless temperature collector.
+
+Samples the sensors, writes the daily logs, samples and rollups, and
+raises alerts (log and email) without importing Tk, matplotlib or plyer:
+
+    python -m app.collector [--interval SECONDS]
+
+SIGINT/SIGTERM (Ctrl+C, Ctrl+Break on Windows) stop it cleanly; SIGHUP
+re-reads the settings file. It holds the writer lock on the daily logs
+directory, so it refuses to start while a monitor window is writing there,
+and a window started while it runs opens as a viewer of the data it writes. With 'metrics_port' in the settings file it also
+serves OpenMetrics on http://127.0.0.1:<port>/metrics.
+"""
+import argparse
+import os
+import signal
+import sys
+import threading
+import time
+
+import psutil
+
+from app.config.settings import EMAIL_CONFIG, read_settings
+from app.core.logger import LogManager
+from app.core.writer_lock import WriterLock
+from app.services.storage_reader import StorageTemperatureReader
+
+PID_FILE = "collector.pid"
+DEFAULT_COLLECTOR_INTERVAL = 2.0
+REPORT_INTERVAL = 3600
+
+
+def running_collector_pid(logs_dir):
+    """PID of a running collector that uses logs_dir, or None"""
+    try:
+        with open(os.path.join(logs_dir, PID_FILE), 'r') as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+    try:
+        cmdline = " ".join(psutil.Process(pid).cmdline())
+    except psutil.NoSuchProcess:
+        return None
+    except psutil.Error:
+        # Exists but cannot be inspected; assume it is ours
+        return pid
+    # A stale file may name a PID that has since been reused
+    return pid if "collector" in cmdline else None
+
+
+class Collector:
+    """Samples, logs and evaluates alert rules every interval seconds until stopped"""
+
+    def __init__(self, interval=DEFAULT_COLLECTOR_INTERVAL):
+        self.interval = interval
+        self.temp_reader = StorageTemperatureReader()
+        # Imported here: the GUI imports this module for running_collector_pid()
+        # and loads the mail modules only after its first reading
+        from app.services.alerting import AlertService
+        
+        self.log_manager = LogManager()
+        self.alerts = AlertService(self.log_manager, dict(EMAIL_CONFIG))
+        self.pid_path = os.path.join(self.log_manager.daily_logs_dir, PID_FILE)
+        self.min_temp = float('inf')
+        self.max_temp = float('-inf')
+        self.last_temp = None
+        self.last_source = None
+        self.last_report = time.time()
+        self.metrics = None
+        self._stop = threading.Event()
+        self._reload = threading.Event()
+        self.load_settings()
+
+    def load_settings(self):
+        """Thresholds, adjustment and alert rules, with the same defaults as the GUI"""
+        try:
+            settings = read_settings()
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            settings = {}
+
+        if settings is None:
+            settings = {}
+            self.temperature_adjustment = 20.0
+        else:
+            self.temperature_adjustment = settings.get('temperature_adjustment', 23.0)
+        self.warning_temp = settings.get('warning_temp', 25)
+        self.critical_temp = settings.get('critical_temp', 30)
+        self.metrics_port = settings.get('metrics_port')
+        self.metrics_host = settings.get('metrics_host', "127.0.0.1")
+        self.alerts.configure(self.warning_temp, self.critical_temp,
+                              settings.get('alert_hysteresis', 0.5),
+                              settings.get('alert_rules', []))
+
+    def stop(self, signum=None, frame=None):
+        """Signal handler: finish the current sample and shut down"""
+        self._stop.set()
+
+    def reload(self, signum=None, frame=None):
+        """Signal handler: re-read the settings before the next sample"""
+        self._reload.set()
+
+    def get_temperature_status(self, adjusted_temp):
+        if adjusted_temp >= self.critical_temp:
+            return "Critical"
+        elif adjusted_temp >= self.warning_temp:
+            return "Warning"
+        return "Normal"
+
+    def start_sensors(self):
+        backend = self.temp_reader.backend
+        if not backend.requires_openhardware_monitor:
+            # hwmon and psutil need no helper process or warm-up
+            if backend.is_available():
+                self.log_manager.log_system_event("Sensors Ready", backend.name)
+            return
+        
+        print("🚀 Initializing OHM...")
+        if self.temp_reader.run_openhardware_monitor():
+            self.temp_reader.start_readiness_probe(
+                on_ready=lambda probe: self.log_manager.log_system_event("Sensors Ready", self.temp_reader.backend.name),
+                on_failed=lambda probe: self.log_manager.log_system_event("Sensor Startup", f"Failed: {probe.failure_reason}")
+            )
+        else:
+            self.log_manager.log_system_event("Sensor Startup", "Failed: OpenHardwareMonitor.exe could not be launched")
+    
+    def start_metrics(self):
+        """Serve metrics if 'metrics_port' is set; a changed port applies on restart"""
+        if not self.metrics_port:
+            return
+        from app.services.metrics import MetricsExporter
+        
+        try:
+            self.metrics = MetricsExporter(self.metrics_port, self.metrics_host)
+        except OSError as e:
+            print(f"❌ Could not start metrics endpoint: {e}")
+            self.log_manager.log_system_event("Metrics Error", f"Port {self.metrics_port}: {e}")
+
+    def sample_once(self):
+        """Read, log and evaluate one sample"""
+        started = time.perf_counter()
+        try:
+            raw_temp = self.temp_reader.get_primary_temperature()
+            source = self.temp_reader.get_temperature_source()
+            read_seconds = time.perf_counter() - started
+
+            if raw_temp is None:
+                if not self.temp_reader.is_warming_up:
+                    self.log_manager.log_system_event("Sensor Error", "No temperature data available")
+                self.record_metrics(started, read_seconds, None, source)
+                return
+
+            adjusted_temp = raw_temp - self.temperature_adjustment
+            self.min_temp = min(self.min_temp, adjusted_temp)
+            self.max_temp = max(self.max_temp, adjusted_temp)
+            self.last_temp = adjusted_temp
+            self.last_source = source
+
+            self.log_manager.log_temperature(temp=adjusted_temp, source=source,
+                                             status=self.get_temperature_status(adjusted_temp))
+            self.alerts.evaluate(adjusted_temp, source)
+            self.record_metrics(started, read_seconds, adjusted_temp, source)
+
+        except Exception as e:
+            print(f"Monitoring error: {e}")
+            self.log_manager.log_system_event("Monitoring Error", str(e))
+
+    def record_metrics(self, started, read_seconds, adjusted_temp, source):
+        """Time this sample and render a new metrics snapshot"""
+        if self.metrics is None:
+            return
+        self.metrics.observe("read", read_seconds)
+        self.metrics.observe("total", time.perf_counter() - started)
+        status = None if adjusted_temp is None else self.get_temperature_status(adjusted_temp)
+        self.metrics.update(adjusted_temp, source, status, self.temp_reader.last_sensors, self.alerts)
+
+    def send_report(self):
+        """Hourly report over the last reading and the hour's min/max"""
+        if self.last_temp is not None:
+            self.alerts.send_report(self.last_temp, self.last_source,
+                                    self.get_temperature_status(self.last_temp),
+                                    self.min_temp, self.max_temp)
+        self.last_report = time.time()
+        self.min_temp = float('inf')
+        self.max_temp = float('-inf')
+
+    def run(self):
+        """Collect until stop() is called, then shut down"""
+        with open(self.pid_path, 'w') as f:
+            f.write(str(os.getpid()))
+
+        try:
+            self.log_manager.log_system_event("System Start", "Headless collector initialized")
+            self.log_manager.log_system_event("Temperature Adjustment",
+                                              f"Adjustment value: -{self.temperature_adjustment}°C")
+            self.start_sensors()
+            self.start_metrics()
+
+            while not self._stop.is_set():
+                if self._reload.is_set():
+                    self._reload.clear()
+                    self.load_settings()
+                    self.log_manager.log_system_event("Settings Update", "Settings reloaded")
+
+                self.sample_once()
+                if time.time() - self.last_report >= REPORT_INTERVAL:
+                    self.send_report()
+
+                self._stop.wait(self.interval)
+        finally:
+            self.close()
+
+    def close(self):
+        self.log_manager.log_system_event("System Shutdown", "Headless collector shutting down")
+        if self.metrics is not None:
+            self.metrics.close()
+        self.alerts.close()
+        self.log_manager.close()
+        try:
+            os.remove(self.pid_path)
+        except OSError:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.collector",
+                                     description="Collect temperatures, logs and alerts without the GUI.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_COLLECTOR_INTERVAL,
+                        help="seconds between samples (default: 2, minimum: 1)")
+    args = parser.parse_args(argv)
+
+    writer_lock = WriterLock(LogManager.DAILY_LOGS_DIR)
+    if not writer_lock.acquire():
+        pid = running_collector_pid(LogManager.DAILY_LOGS_DIR)
+        if pid is not None:
+            print(f"❌ A collector is already running (PID {pid})")
+        else:
+            print("❌ A monitor window is writing the daily logs; close it first")
+        return 1
+
+    try:
+        collector = Collector(interval=max(1.0, args.interval))
+        for name in ("SIGINT", "SIGTERM", "SIGBREAK"):
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), collector.stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, collector.reload)
+
+        collector.run()
+    finally:
+        writer_lock.release()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+import json
+import os
+
+SETTINGS_FILE = 'temperature_monitor_settings.json'
+
+# Email configuration, shared by the GUI and the headless collector
+EMAIL_CONFIG = {
+    'smtp_server': 'smtp.gmail.com',
+    'smtp_port': 587,
+    'sender_email': 'nxpisian@gmail.com',
+    'sender_password': 'aqkz uykr cmfu oqbm',
+    'receiver_email': 'kyosxel@gmail.com',
+    'connect_timeout': 10,  # seconds to open the connection
+    'send_timeout': 30      # seconds to wait for each server reply
+}
+
+
+def read_settings(path=SETTINGS_FILE):
+    """Settings dict from the JSON settings file, or None if there is no file"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
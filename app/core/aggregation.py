@@ -0,0 +1,135 @@
+import datetime
+import re
+
+import numpy as np
+
+# Bucket widths for the graph resolutions
+RESOLUTION_SECONDS = {
+    "10min": 600,
+    "30min": 1800,
+    "1hour": 3600,
+    "1day": 86400,
+}
+
+
+def bucket_temperatures(epochs, temps, bucket_seconds, utc_offset=0):
+    """Aggregate samples into fixed-width time buckets.
+
+    epochs must be sorted ascending. Buckets are aligned to local time by
+    shifting with utc_offset (seconds east of UTC). Returns arrays
+    (bucket_start_epochs, mean, minimum, maximum, count), one entry per
+    non-empty bucket.
+    """
+    epochs = np.asarray(epochs, dtype=np.float64)
+    temps = np.asarray(temps, dtype=np.float64)
+
+    if len(epochs) == 0:
+        empty = np.empty(0)
+        return empty, empty, empty, empty, np.empty(0, dtype=np.int64)
+
+    bucket_ids = np.floor_divide(epochs + utc_offset, bucket_seconds).astype(np.int64)
+
+    # Sorted input means each bucket is one contiguous run
+    starts = np.flatnonzero(np.diff(bucket_ids, prepend=bucket_ids[0] - 1))
+    counts = np.diff(np.append(starts, len(bucket_ids)))
+
+    mean = np.add.reduceat(temps, starts) / counts
+    minimum = np.minimum.reduceat(temps, starts)
+    maximum = np.maximum.reduceat(temps, starts)
+    bucket_epochs = bucket_ids[starts] * bucket_seconds - utc_offset
+
+    return bucket_epochs, mean, minimum, maximum, counts
+
+
+def combine_buckets(epochs, mean, minimum, maximum, counts, bucket_seconds, utc_offset=0):
+    """Merge already-aggregated buckets into coarser fixed-width buckets.
+
+    Same alignment and return value as bucket_temperatures; means are
+    weighted by count. epochs must be sorted ascending.
+    """
+    epochs = np.asarray(epochs, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.int64)
+
+    if len(epochs) == 0:
+        empty = np.empty(0)
+        return empty, empty, empty, empty, np.empty(0, dtype=np.int64)
+
+    bucket_ids = np.floor_divide(epochs + utc_offset, bucket_seconds).astype(np.int64)
+    starts = np.flatnonzero(np.diff(bucket_ids, prepend=bucket_ids[0] - 1))
+
+    total = np.add.reduceat(counts, starts)
+    weighted = np.add.reduceat(np.asarray(mean, dtype=np.float64) * counts, starts)
+    merged_min = np.minimum.reduceat(np.asarray(minimum, dtype=np.float64), starts)
+    merged_max = np.maximum.reduceat(np.asarray(maximum, dtype=np.float64), starts)
+    bucket_epochs = bucket_ids[starts] * bucket_seconds - utc_offset
+
+    return bucket_epochs, weighted / np.maximum(total, 1), merged_min, merged_max, total
+
+
+_TEMPERATURE_PATTERN = re.compile(r'(\d+\.?\d*)\s*°C')
+
+
+def parse_log_temperatures(log_lines):
+    """(epochs, temps) arrays from '[YYYY-MM-DD HH:MM:SS] ... 25.0°C ...' log lines.
+
+    System event lines are skipped; order follows the input.
+    """
+    epochs = []
+    temps = []
+    for log_entry in log_lines:
+        if '🔧' in log_entry:
+            continue
+        temp_match = _TEMPERATURE_PATTERN.search(log_entry)
+        if not temp_match:
+            continue
+        try:
+            timestamp = datetime.datetime.strptime(log_entry[1:20], "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            continue
+        epochs.append(timestamp.timestamp())
+        temps.append(float(temp_match.group(1)))
+    return np.array(epochs, dtype=np.float64), np.array(temps, dtype=np.float64)
+
+
+def local_utc_offset(epoch):
+    """Local UTC offset in seconds at the given epoch"""
+    offset = datetime.datetime.fromtimestamp(epoch).astimezone().utcoffset()
+    return int(offset.total_seconds()) if offset is not None else 0
+
+
+def min_max_indices(x, y, pixel_width):
+    """Indices of a shape-preserving subset of (x, y) for a plot pixel_width wide.
+
+    x must be sorted ascending. The x range is split into one bin per pixel
+    column and the lowest and highest sample of each bin are kept, together
+    with the first and last sample. The line drawn through the result covers
+    the same pixels as the full data, so short spikes stay visible, while at
+    most 2 * pixel_width + 2 points are plotted.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y)
+    count = len(x)
+    pixel_width = max(1, int(pixel_width))
+
+    if count <= 2 * pixel_width + 2:
+        return np.arange(count)
+
+    span = x[-1] - x[0]
+    if span <= 0:
+        bin_ids = np.arange(count) * pixel_width // count
+    else:
+        bin_ids = np.minimum(((x - x[0]) / span * pixel_width).astype(np.int64), pixel_width - 1)
+
+    starts = np.flatnonzero(np.diff(bin_ids, prepend=bin_ids[0] - 1))
+    counts = np.diff(np.append(starts, count))
+
+    def first_per_bin(mask):
+        idx = np.flatnonzero(mask)
+        bins = bin_ids[idx]
+        return idx[np.diff(bins, prepend=bins[0] - 1) != 0]
+
+    lowest = np.repeat(np.minimum.reduceat(y, starts), counts)
+    highest = np.repeat(np.maximum.reduceat(y, starts), counts)
+
+    keep = np.concatenate(([0, count - 1], first_per_bin(y == lowest), first_per_bin(y == highest)))
+    return np.unique(keep)
@@ -0,0 +1,195 @@
+from collections import deque
+
+# Defaults for the rules built from the warning/critical thresholds
+DEFAULT_HYSTERESIS = 0.5
+DEFAULT_REPEAT_SECONDS = 3600
+
+
+def _temperature(spec):
+    """Value source for 'threshold' rules: the temperature itself"""
+    def value(timestamp, temp):
+        return temp
+    return value
+
+
+def _rise(spec):
+    """Value source for 'rate' rules: rise above the lowest reading of the last within_seconds.
+
+    Keeps a monotonic deque of (timestamp, temp) with increasing temps, so
+    its head is the window minimum; each sample is pushed and popped at
+    most once, which makes the update O(1) amortized.
+    """
+    window_seconds = float(spec['within_seconds'])
+    lows = deque()
+
+    def value(timestamp, temp):
+        while lows and lows[-1][1] >= temp:
+            lows.pop()
+        lows.append((timestamp, temp))
+        while lows[0][0] < timestamp - window_seconds:
+            lows.popleft()
+        return temp - lows[0][1]
+    return value
+
+
+# Rule type -> (value source factory, spec key of the raise level)
+RULE_TYPES = {
+    "threshold": (_temperature, 'above'),
+    "rate": (_rise, 'rise'),
+}
+
+
+class AlertRule:
+    """One compiled rule and its state machine (OK <-> FIRING).
+
+    Each sample is reduced to a single value (the temperature, or the rise
+    over a sliding window) and compared with two levels: the rule raises at
+    raise_at and only clears below clear_at (hysteresis). Raising needs
+    debounce_samples consecutive samples and, if for_seconds is set, the
+    condition held that long; clearing needs debounce_samples samples below
+    clear_at. While firing, the alert repeats every repeat_seconds.
+
+    A rule with suppressed_by names a more severe rule; while that one is
+    firing this rule is held in OK silently, so one excursion does not
+    raise both (e.g. Warning and Critical).
+    """
+
+    OK = "ok"
+    FIRING = "firing"
+
+    def __init__(self, name, level, value, raise_at, clear_at, debounce_samples=1,
+                 for_seconds=0, repeat_seconds=DEFAULT_REPEAT_SECONDS, suppressed_by=None):
+        self.name = name
+        self.level = level
+        self.value = value
+        self.raise_at = raise_at
+        self.clear_at = clear_at
+        self.debounce_samples = max(1, int(debounce_samples))
+        self.for_seconds = for_seconds
+        self.repeat_seconds = repeat_seconds
+        self.suppressed_by = suppressed_by
+        self.state = self.OK
+        self.last_fired = None
+        self._streak = 0
+        self._since = None
+
+    @classmethod
+    def compile(cls, spec):
+        """Build a rule from a settings dict, e.g.
+        {"name": "Hot", "type": "threshold", "level": "WARNING", "above": 27, "for_seconds": 300}
+        {"name": "Rising", "type": "rate", "level": "WARNING", "rise": 3, "within_seconds": 600}
+        """
+        rule_type = spec.get('type', "threshold")
+        if rule_type not in RULE_TYPES:
+            raise ValueError(f"Unknown alert rule type: {rule_type}")
+        make_value, raise_key = RULE_TYPES[rule_type]
+        raise_at = float(spec[raise_key])
+
+        if 'clear_below' in spec:
+            clear_at = float(spec['clear_below'])
+        elif rule_type == "rate":
+            clear_at = raise_at / 2
+        else:
+            clear_at = raise_at - float(spec.get('hysteresis', DEFAULT_HYSTERESIS))
+
+        return cls(spec.get('name', f"{rule_type} {raise_at:g}"),
+                   spec.get('level', "WARNING"),
+                   make_value(spec),
+                   raise_at,
+                   clear_at,
+                   debounce_samples=spec.get('debounce_samples', 1),
+                   for_seconds=float(spec.get('for_seconds', 0)),
+                   repeat_seconds=spec.get('repeat_seconds', DEFAULT_REPEAT_SECONDS),
+                   suppressed_by=spec.get('suppressed_by'))
+
+    def evaluate(self, timestamp, temp):
+        """Feed one sample; returns (kind, value) with kind 'alert', 'repeat' or 'recovery', or None"""
+        value = self.value(timestamp, temp)
+
+        if self.state == self.OK:
+            if value < self.raise_at:
+                self._streak = 0
+                self._since = None
+                return None
+            self._streak += 1
+            if self._since is None:
+                self._since = timestamp
+            if self._streak >= self.debounce_samples and timestamp - self._since >= self.for_seconds:
+                self.state = self.FIRING
+                self.last_fired = timestamp
+                self._streak = 0
+                return "alert", value
+            return None
+
+        if value >= self.clear_at:
+            self._streak = 0
+            if self.repeat_seconds and timestamp - self.last_fired >= self.repeat_seconds:
+                self.last_fired = timestamp
+                return "repeat", value
+            return None
+
+        self._streak += 1
+        if self._streak >= self.debounce_samples:
+            self.state = self.OK
+            self._streak = 0
+            self._since = None
+            return "recovery", value
+        return None
+
+    def suppress(self, timestamp, temp):
+        """Feed a sample while the suppressing rule fires: stay in OK without notifying"""
+        self.value(timestamp, temp)
+        self.state = self.OK
+        self._streak = 0
+        self._since = None
+
+
+class AlertEngine:
+    """Evaluates every rule on each sample; O(1) per rule per sample"""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self._by_name = {rule.name: rule for rule in rules}
+
+    @classmethod
+    def compile(cls, specs, previous=None):
+        """Compile rule specs; firing state is carried over from previous rules of the same name"""
+        engine = cls([AlertRule.compile(spec) for spec in specs])
+        if previous is not None:
+            old = {rule.name: rule for rule in previous.rules}
+            for rule in engine.rules:
+                if rule.name in old and old[rule.name].state == AlertRule.FIRING:
+                    rule.state = AlertRule.FIRING
+                    rule.last_fired = old[rule.name].last_fired
+        return engine
+
+    def evaluate(self, timestamp, temp):
+        """List of (kind, rule, value) transitions caused by this sample"""
+        transitions = []
+        # Suppressing rules first, so suppression uses this sample's state
+        for rule in sorted(self.rules, key=lambda rule: rule.suppressed_by is not None):
+            suppressor = self._by_name.get(rule.suppressed_by)
+            if suppressor is not None and suppressor.state == AlertRule.FIRING:
+                rule.suppress(timestamp, temp)
+                continue
+            result = rule.evaluate(timestamp, temp)
+            if result is not None:
+                transitions.append((result[0], rule, result[1]))
+        return transitions
+
+    def firing(self):
+        """Rules currently in the FIRING state"""
+        return [rule for rule in self.rules if rule.state == AlertRule.FIRING]
+
+
+def threshold_rules(warning_temp, critical_temp, hysteresis=DEFAULT_HYSTERESIS,
+                    debounce_samples=1, repeat_seconds=DEFAULT_REPEAT_SECONDS):
+    """Specs for the standard Warning and Critical threshold rules; Warning is quiet while Critical fires"""
+    return [
+        {'name': "Critical", 'type': "threshold", 'level': "CRITICAL", 'above': critical_temp,
+         'hysteresis': hysteresis, 'debounce_samples': debounce_samples,
+         'repeat_seconds': repeat_seconds},
+        {'name': "Warning", 'type': "threshold", 'level': "WARNING", 'above': warning_temp,
+         'hysteresis': hysteresis, 'debounce_samples': debounce_samples,
+         'repeat_seconds': repeat_seconds, 'suppressed_by': "Critical"},
+    ]
@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import deque
+
+
+class Event:
+    """Something that happened, e.g. an alert; data holds the details"""
+    __slots__ = ('topic', 'timestamp', 'data')
+
+    def __init__(self, topic, **data):
+        self.topic = topic
+        self.timestamp = time.time()
+        self.data = data
+
+    def __repr__(self):
+        return f"Event({self.topic!r}, {self.data!r})"
+
+
+class Sink:
+    """One subscriber: a bounded queue drained by its own worker thread.
+
+    When the queue is full the oldest event is dropped, so a stuck sink
+    keeps the newest events. Events that waited longer than deadline
+    seconds are skipped as expired; handlers that finish after the deadline
+    are counted as late.
+    """
+
+    def __init__(self, name, handler, topics=None, queue_size=100, deadline=None):
+        self.name = name
+        self.handler = handler
+        self.topics = set(topics) if topics else None
+        self.deadline = deadline
+        self.delivered = 0
+        self.dropped = 0
+        self.expired = 0
+        self.failed = 0
+        self.late = 0
+        self.max_latency = 0.0
+        self._items = deque(maxlen=queue_size)
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"Sink-{name}", daemon=True)
+        self._thread.start()
+
+    def accepts(self, event):
+        return self.topics is None or event.topic in self.topics
+
+    def put(self, event):
+        """Queue an event without blocking"""
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append((event, time.monotonic()))
+            self._cond.notify()
+
+    def close(self, timeout=None):
+        """Deliver what is queued, then stop the worker"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def stats(self):
+        with self._cond:
+            queued = len(self._items)
+        return {
+            'queued': queued,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'expired': self.expired,
+            'failed': self.failed,
+            'late': self.late,
+            'max_latency': self.max_latency,
+        }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._items and not self._closed:
+                    self._cond.wait()
+                if not self._items:
+                    return
+                event, queued_at = self._items.popleft()
+
+            if self.deadline is not None and time.monotonic() - queued_at > self.deadline:
+                self.expired += 1
+                continue
+
+            try:
+                self.handler(event)
+            except Exception as e:
+                self.failed += 1
+                print(f"❌ {self.name} sink failed on {event.topic}: {e}")
+            else:
+                self.delivered += 1
+
+            latency = time.monotonic() - queued_at
+            self.max_latency = max(self.max_latency, latency)
+            if self.deadline is not None and latency > self.deadline:
+                self.late += 1
+
+
+class EventBus:
+    """In-process publish/subscribe.
+
+    publish() only appends to each matching sink's queue, so the publisher
+    (the sampling loop) never waits on a slow sink. Every sink runs its
+    handler on its own thread, so a hung mail server cannot delay desktop
+    notifications either.
+    """
+
+    def __init__(self):
+        self.sinks = []
+        self.published = 0
+
+    def subscribe(self, name, handler, topics=None, queue_size=100, deadline=None):
+        """Add a sink that calls handler(event) for events of the given topics (all if None)"""
+        sink = Sink(name, handler, topics, queue_size, deadline)
+        self.sinks.append(sink)
+        return sink
+
+    def publish(self, topic, **data):
+        """Hand an event to every interested sink; returns the event"""
+        event = Event(topic, **data)
+        self.published += 1
+        for sink in self.sinks:
+            if sink.accepts(event):
+                sink.put(event)
+        return event
+
+    def stats(self):
+        """Per-sink counters: queued, delivered, dropped, expired, failed, late, max_latency"""
+        return {sink.name: sink.stats() for sink in self.sinks}
+
+    def close(self, timeout=2.0):
+        """Stop every sink, giving each up to timeout seconds to drain"""
+        for sink in self.sinks:
+            sink.close(timeout)
@@ -0,0 +1,125 @@
+import math
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class TemperatureHistory:
+    """Fixed-size ring buffer of (time, temperature) samples.
+
+    Storage is one preallocated numpy structured array (float64 time,
+    float32 temp) sized once from the retention, so memory never grows.
+    Every sample is written twice, at slot i and at slot i + size, so the
+    newest ``capacity`` samples are always one contiguous slice. ``times``
+    and ``temps`` are ordered, zero-copy views of it. A few spare slots
+    beyond ``capacity`` keep a view intact while up to SPARE_SLOTS more
+    samples are appended. Callers that keep data longer should copy it.
+    The running min/max over the retained window is kept with monotonic
+    queues, so append and min/max are O(1) (amortised). append() runs on the
+    monitor thread while the Tk thread reads min/max, so the queues are only
+    touched under a lock.
+    """
+
+    DTYPE = np.dtype([('time', '<f8'), ('temp', '<f4')])
+    SPARE_SLOTS = 64
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        self.capacity = int(capacity)
+        self._size = self.capacity + self.SPARE_SLOTS
+        self._data = np.zeros(2 * self._size, dtype=self.DTYPE)
+        self._total = 0
+        # (sequence number, temp) pairs; values decrease / increase from the front
+        self._max_queue = deque()
+        self._min_queue = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_retention(cls, retention_seconds, sample_interval):
+        """History long enough to hold retention_seconds of samples taken every sample_interval seconds"""
+        return cls(max(1, math.ceil(retention_seconds / sample_interval)))
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def __len__(self):
+        return min(self._total, self.capacity)
+
+    def __bool__(self):
+        return self._total > 0
+
+    def append(self, timestamp, temp):
+        slot = self._total % self._size
+        self._data[slot] = (timestamp, temp)
+        self._data[slot + self._size] = (timestamp, temp)
+
+        # Compare the stored float32 so min/max match what the views return
+        temp = self._data['temp'][slot]
+        with self._lock:
+            seq = self._total
+            while self._max_queue and self._max_queue[-1][1] <= temp:
+                self._max_queue.pop()
+            self._max_queue.append((seq, temp))
+            while self._min_queue and self._min_queue[-1][1] >= temp:
+                self._min_queue.pop()
+            self._min_queue.append((seq, temp))
+
+            self._total += 1
+
+            oldest = self._total - self.capacity
+            while self._max_queue[0][0] < oldest:
+                self._max_queue.popleft()
+            while self._min_queue[0][0] < oldest:
+                self._min_queue.popleft()
+
+    def clear(self):
+        with self._lock:
+            self._total = 0
+            self._max_queue.clear()
+            self._min_queue.clear()
+
+    def view(self):
+        """Structured view of the retained samples, oldest first (fields time, temp)"""
+        # Read the counter once; the monitor thread may append meanwhile
+        total = self._total
+        count = min(total, self.capacity)
+        end = total % self._size
+        if end < count:
+            end += self._size
+        return self._data[end - count:end]
+
+    @property
+    def times(self):
+        """Sample times (epoch seconds), oldest first"""
+        return self.view()['time']
+
+    @property
+    def temps(self):
+        """Temperatures, oldest first"""
+        return self.view()['temp']
+
+    @property
+    def min(self):
+        return self.range()[0]
+
+    @property
+    def max(self):
+        return self.range()[1]
+
+    def range(self):
+        """(min, max) of the retained samples from one consistent snapshot, or (None, None)"""
+        with self._lock:
+            if not self._min_queue:
+                return None, None
+            return float(self._min_queue[0][1]), float(self._max_queue[0][1])
+
+    @property
+    def latest(self):
+        """(time, temp) of the newest sample, or None"""
+        if not self._total:
+            return None
+        record = self._data[(self._total - 1) % self._size]
+        return float(record['time']), float(record['temp'])
@@ -0,0 +1,157 @@
+import bisect
+import os
+import struct
+
+
+class LogIndex:
+    """Sidecar minute index for a daily .logs file.
+
+    The sidecar (``<log file>.idx``) is an append-only list of packed
+    (minute_of_day, byte_offset) records: the byte position of the first
+    line logged in each minute. The writer appends a record whenever a new
+    minute starts, and range queries bisect it to seek straight to the
+    wanted slice of the log instead of parsing the whole day.
+
+    If a line goes back in time (the clock was set back), a record with
+    minute UNORDERED is appended and byte_range() covers the whole file
+    from then on, since the minutes no longer bisect.
+    """
+
+    SUFFIX = ".idx"
+    RECORD = struct.Struct("<Hq")
+    UNORDERED = 0xFFFF
+    # Bytes read from the end of the log to check the index against its last line
+    TAIL_BYTES = 4096
+
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self.index_path = log_path + self.SUFFIX
+        self.minutes = []
+        self.offsets = []
+        self.ordered = True
+        self._unsaved = []
+
+    @staticmethod
+    def minute_of(log_line):
+        """Minute of day from a '[YYYY-MM-DD HH:MM:SS] ...' line, or None"""
+        if isinstance(log_line, bytes):
+            log_line = log_line[:21].decode('ascii', errors='replace')
+        if len(log_line) < 21 or log_line[0] != '[' or log_line[20] != ']':
+            return None
+        try:
+            return int(log_line[12:14]) * 60 + int(log_line[15:17])
+        except ValueError:
+            return None
+
+    @classmethod
+    def load(cls, log_path):
+        """Load the sidecar for log_path, (re)building it if missing or stale"""
+        index = cls(log_path)
+        try:
+            with open(index.index_path, 'rb') as f:
+                data = f.read()
+            usable = len(data) - len(data) % cls.RECORD.size
+            for minute, offset in cls.RECORD.iter_unpack(data[:usable]):
+                if minute == cls.UNORDERED:
+                    index.ordered = False
+                    continue
+                index.minutes.append(minute)
+                index.offsets.append(offset)
+        except OSError:
+            pass
+
+        try:
+            log_size = os.path.getsize(log_path)
+        except OSError:
+            log_size = 0
+
+        stale = bool(index.offsets) and index.offsets[-1] > log_size
+        if index.ordered and index.minutes and not stale:
+            # A last line earlier than the last indexed minute means lines were
+            # skipped as out of order by an older writer; rebuild to catch it
+            last_minute = cls._last_minute(log_path, log_size)
+            stale = last_minute is not None and last_minute < index.minutes[-1]
+        if (log_size and not index.offsets) or stale:
+            index.build()
+        return index
+
+    @classmethod
+    def _last_minute(cls, log_path, log_size):
+        """Minute of the last complete line in the log, or None"""
+        try:
+            with open(log_path, 'rb') as f:
+                f.seek(max(0, log_size - cls.TAIL_BYTES))
+                tail = f.read(cls.TAIL_BYTES)
+        except OSError:
+            return None
+        for line in reversed(tail.splitlines()):
+            minute = cls.minute_of(line)
+            if minute is not None:
+                return minute
+        return None
+
+    def build(self):
+        """Rebuild the sidecar by scanning the log file once"""
+        self.minutes = []
+        self.offsets = []
+        self.ordered = True
+        self._unsaved = []
+
+        offset = 0
+        try:
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    self.add(self.minute_of(line), offset)
+                    offset += len(line)
+        except OSError:
+            return
+
+        self._unsaved = []
+        records = [self.RECORD.pack(m, o) for m, o in zip(self.minutes, self.offsets)]
+        if not self.ordered:
+            records.append(self.RECORD.pack(self.UNORDERED, 0))
+        with open(self.index_path, 'wb') as f:
+            f.write(b"".join(records))
+
+    def add(self, minute, offset):
+        """Record where a line starts; only the first line of each new minute is kept"""
+        if minute is None or not self.ordered:
+            return
+        if self.minutes and minute <= self.minutes[-1]:
+            if minute < self.minutes[-1]:
+                self.ordered = False
+                self._unsaved.append(self.RECORD.pack(self.UNORDERED, offset))
+            return
+        self.minutes.append(minute)
+        self.offsets.append(offset)
+        self._unsaved.append(self.RECORD.pack(minute, offset))
+
+    def save(self):
+        """Append records added since the last save to the sidecar"""
+        if not self._unsaved:
+            return
+        with open(self.index_path, 'ab') as f:
+            f.write(b"".join(self._unsaved))
+        self._unsaved = []
+
+    def byte_range(self, start_minute=None, end_minute=None):
+        """Byte span (start, end) covering minutes start..end; end None means EOF"""
+        if not self.ordered:
+            return 0, None
+        start = 0
+        if start_minute is not None:
+            i = bisect.bisect_left(self.minutes, start_minute)
+            if i >= len(self.minutes):
+                # Nothing indexed at or after start; only unindexed tail lines remain
+                start = self.offsets[-1] if self.offsets else 0
+            else:
+                start = self.offsets[i]
+
+        end = None
+        if end_minute is not None:
+            # One extra minute absorbs lines stamped just before a boundary
+            # but written just after it
+            i = bisect.bisect_right(self.minutes, end_minute + 1)
+            if i < len(self.minutes):
+                end = self.offsets[i]
+        return start, end
@@ -0,0 +1,189 @@
+import bisect
+import os
+from array import array
+
+import numpy as np
+
+
+class LogLineIndex:
+    """Sparse line index over all daily .logs files, oldest line first.
+
+    For every file it keeps the line count and the byte offset of every
+    STRIDE-th line, so memory stays small (8 bytes per STRIDE lines) no matter
+    how many lines there are. get_lines() seeks to the nearest checkpoint and
+    reads forward. refresh() scans only bytes appended since the last call,
+    so following the live tail is cheap. A trailing partial line is counted
+    once its newline is written.
+    """
+
+    STRIDE = 256
+    SCAN_CHUNK = 1 << 20
+
+    def __init__(self, logs_dir, prefix="temperature_logs_", suffix=".logs"):
+        self.logs_dir = logs_dir
+        self.prefix = prefix
+        self.suffix = suffix
+        self.line_count = 0
+        # Per file: path, line count, bytes scanned, checkpoint offsets
+        self._paths = []
+        self._counts = []
+        self._scanned = []
+        self._checkpoints = []
+        # Global index of each file's first line
+        self._starts = []
+
+    def refresh(self, end=None):
+        """Pick up new files and appended lines; returns True if the line count changed.
+
+        end is an optional (log_file, offset) position: nothing past that byte
+        of log_file, and no later file, is indexed.
+        """
+        end_name = os.path.basename(end[0]) if end and end[0] else None
+        try:
+            names = sorted(name for name in os.listdir(self.logs_dir)
+                           if name.startswith(self.prefix) and name.endswith(self.suffix)
+                           and (end_name is None or name <= end_name))
+        except OSError:
+            names = []
+
+        known = set(self._paths)
+        first_new = len(self._paths)
+        for name in names:
+            path = os.path.join(self.logs_dir, name)
+            if path not in known:
+                self._paths.append(path)
+                self._counts.append(0)
+                self._scanned.append(0)
+                self._checkpoints.append(array('q'))
+
+        # Older days are complete; only the newest known file and new ones grow
+        previous_total = self.line_count
+        for i in range(max(0, first_new - 1), len(self._paths)):
+            limit = end[1] if end_name and os.path.basename(self._paths[i]) == end_name else None
+            self._scan(i, limit)
+
+        self._starts = []
+        total = 0
+        for count in self._counts:
+            self._starts.append(total)
+            total += count
+        self.line_count = total
+        return self.line_count != previous_total
+
+    def _scan(self, i, limit=None):
+        path = self._paths[i]
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        if limit is not None:
+            size = min(size, limit)
+
+        if size < self._scanned[i]:
+            # Truncated or replaced: index it again from the start
+            self._counts[i] = 0
+            self._scanned[i] = 0
+            self._checkpoints[i] = array('q')
+        if size == self._scanned[i]:
+            return
+
+        with open(path, 'rb') as f:
+            f.seek(self._scanned[i])
+            while self._scanned[i] < size:
+                data = f.read(min(self.SCAN_CHUNK, size - self._scanned[i]))
+                newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10)
+                if len(newlines) == 0:
+                    break
+
+                offset = self._scanned[i]
+                line_starts = np.concatenate(([0], newlines[:-1] + 1)) + offset
+                line_numbers = self._counts[i] + np.arange(len(newlines))
+                self._checkpoints[i].extend(line_starts[line_numbers % self.STRIDE == 0].tolist())
+
+                self._counts[i] += len(newlines)
+                self._scanned[i] = offset + int(newlines[-1]) + 1
+                f.seek(self._scanned[i])
+
+    def get_lines(self, first, count):
+        """Up to count lines starting at global line number first"""
+        lines = []
+        if first < 0 or first >= self.line_count:
+            return lines
+
+        i = bisect.bisect_right(self._starts, first) - 1
+        local = first - self._starts[i]
+
+        while len(lines) < count and i < len(self._paths):
+            if local < self._counts[i]:
+                checkpoint = local // self.STRIDE
+                with open(self._paths[i], 'rb') as f:
+                    f.seek(self._checkpoints[i][checkpoint])
+                    for _ in range(local - checkpoint * self.STRIDE):
+                        f.readline()
+                    while len(lines) < count and local < self._counts[i]:
+                        lines.append(f.readline().decode('utf-8', errors='replace').rstrip('\r\n'))
+                        local += 1
+            i += 1
+            local = 0
+
+        return lines
+
+
+class LiveLogSource:
+    """Line source for the live log: file history plus the in-memory tail.
+
+    Lines already on disk when the source was (re)based come from a
+    LogLineIndex cut at LogManager.written_position(); everything logged
+    after that comes straight from LogManager.log_buffer, so following the
+    live tail never touches the files. Before the ring could drop records
+    the source has not seen, it rebases onto the files again. A read-only
+    LogManager does not write the files, so then they are followed directly.
+    """
+
+    def __init__(self, log_manager):
+        self.log_manager = log_manager
+        self.index = LogLineIndex(log_manager.daily_logs_dir)
+        self.records = []
+        self.base_seq = 0
+        self.line_count = 0
+        self.rebase()
+
+    def rebase(self):
+        """Re-read the file index up to what the writer has written and restart the tail there"""
+        if self.log_manager.read_only:
+            self.index.refresh()
+            self.line_count = self.index.line_count
+            return
+
+        seq, log_file, offset = self.log_manager.written_position()
+        self.index.refresh(end=(log_file, offset))
+        self.base_seq = seq
+        self.records, complete = self.log_manager.log_buffer.since(seq)
+        self.line_count = self.index.line_count + len(self.records)
+
+    def refresh(self):
+        """Pick up newly logged records; returns True if the line count changed"""
+        previous_total = self.line_count
+        if self.log_manager.read_only:
+            self.rebase()
+            return self.line_count != previous_total
+
+        ring = self.log_manager.log_buffer
+        new, complete = ring.since(self.base_seq + len(self.records))
+        if not complete or len(self.records) + len(new) > ring.capacity // 2:
+            self.rebase()
+        else:
+            self.records.extend(new)
+            self.line_count = self.index.line_count + len(self.records)
+        return self.line_count != previous_total
+
+    def get_lines(self, first, count):
+        """Up to count lines starting at global line number first"""
+        if first < 0:
+            return []
+        lines = self.index.get_lines(first, count)
+        tail_first = max(0, first - self.index.line_count)
+        remaining = count - len(lines)
+        if remaining > 0:
+            lines.extend(record.format() for record in self.records[tail_first:tail_first + remaining])
+        return lines
@@ -0,0 +1,76 @@
+import datetime
+import threading
+from collections import deque
+from itertools import islice
+
+
+class LogRecord:
+    """One log event, kept structured and only formatted to text when shown or written"""
+    __slots__ = ('timestamp', 'kind', 'temp', 'source', 'status', 'message')
+
+    TEMPERATURE = "temperature"
+    ALERT = "alert"
+    SYSTEM = "system"
+
+    def __init__(self, timestamp, kind, temp=None, source=None, status=None, message=None):
+        # For SYSTEM records source holds the event type
+        self.timestamp = timestamp
+        self.kind = kind
+        self.temp = temp
+        self.source = source
+        self.status = status
+        self.message = message
+
+    def format(self):
+        """The log line as written to the daily .logs file"""
+        timestamp = datetime.datetime.fromtimestamp(self.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        if self.kind == self.ALERT:
+            return f"[{timestamp}] ⚠️ {self.status}: {self.temp:.1f}°C (Source: {self.source})"
+        if self.kind == self.TEMPERATURE:
+            return f"[{timestamp}] 📊 {self.temp:.1f}°C (Source: {self.source}, Status: {self.status})"
+        return f"[{timestamp}] 🔧 {self.source}: {self.message}"
+
+    __str__ = format
+
+    def __repr__(self):
+        return f"LogRecord({self.format()!r})"
+
+
+class LogRing:
+    """Fixed-capacity ring of the most recent LogRecords.
+
+    Every record gets a sequence number (0, 1, 2, ...). Readers remember the
+    next number they want and call since() to get only newer records. Once
+    more than capacity records have been added, the oldest are dropped.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.total = 0
+        self._records = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._records)
+
+    def append(self, record):
+        """Add a record; returns its sequence number"""
+        with self._lock:
+            self._records.append(record)
+            self.total += 1
+            return self.total - 1
+
+    def since(self, seq):
+        """(records with sequence number >= seq, complete); complete is False if some were dropped"""
+        with self._lock:
+            wanted = self.total - seq
+            if wanted <= 0:
+                return [], True
+            held = len(self._records)
+            return list(islice(self._records, max(0, held - wanted), held)), wanted <= held
+
+    def latest(self, count):
+        """The newest count records, oldest first"""
+        with self._lock:
+            held = len(self._records)
+            return list(islice(self._records, max(0, held - count), held))
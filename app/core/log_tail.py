@@ -0,0 +1,72 @@
+import os
+
+
+class LogTailer:
+    """Follows the daily log files by byte offset.
+
+    Remembers which daily file it is reading and how far into it, so each
+    call only reads bytes appended since the previous call. When the day
+    rolls over, the rest of yesterday's file is read before moving on to
+    the new one. A trailing partial line is left for the next call.
+    """
+
+    def __init__(self, current_file_func):
+        # current_file_func() -> path of today's log file
+        self._current_file_func = current_file_func
+        self.path = None
+        self.offset = 0
+
+    def seek_to_end(self):
+        """Skip everything already written; only later lines are returned"""
+        self.path = self._current_file_func()
+        try:
+            self.offset = os.path.getsize(self.path)
+        except OSError:
+            self.offset = 0
+
+    def read_new(self):
+        """Return complete lines appended since the last call"""
+        current_file = self._current_file_func()
+        lines = []
+
+        if self.path is None:
+            self.path = current_file
+            self.offset = 0
+
+        if self.path != current_file:
+            # Midnight rollover: finish the old file, then start the new one
+            lines.extend(self._read_appended(final=True))
+            self.path = current_file
+            self.offset = 0
+
+        lines.extend(self._read_appended())
+        return lines
+
+    def _read_appended(self, final=False):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return []
+
+        if size < self.offset:
+            # File was truncated or replaced
+            self.offset = 0
+        if size == self.offset:
+            return []
+
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read(size - self.offset)
+        except OSError:
+            return []
+
+        if not final:
+            end = data.rfind(b"\n")
+            if end < 0:
+                return []
+            data = data[:end + 1]
+
+        self.offset += len(data)
+        text = data.decode('utf-8', errors='replace')
+        return [line.strip() for line in text.splitlines() if line.strip()]
@@ -1,21 +1,83 @@
 import os
 import datetime
+import queue
 import threading
 import time
-from tkinter import messagebox
+
+from app.core.log_tail import LogTailer
+from app.core.log_index import LogIndex
+from app.core.log_record import LogRecord, LogRing
+from app.core.sample_store import SampleStore
+from app.core.rollups import RollupStore
+
+_STOP = object()
 
 class LogManager:
-    """Enhanced logger with intelligent logging"""
+    """Enhanced logger with intelligent logging
+
+    With read_only=True another process (the collector) owns the files: no
+    writer or rollup thread is started and log calls only reach the
+    console and the in-memory buffer.
+    """
     
-    def __init__(self):
-        self.daily_logs_dir = "Daily logs"
+    # Data directory, shared by the GUI and the collector
+    DAILY_LOGS_DIR = "Daily logs"
+    # Writer policy: flush after this many lines or this many seconds
+    FLUSH_BATCH_SIZE = 64
+    FLUSH_INTERVAL = 1.0
+    QUEUE_SIZE = 10000
+    ENQUEUE_TIMEOUT = 0.5
+    # Seconds between background rollup updates
+    ROLLUP_INTERVAL = 60
+    # Most recent records kept in memory for the live log
+    LOG_BUFFER_SIZE = 5000
+    
+    def __init__(self, read_only=False):
+        self.daily_logs_dir = self.DAILY_LOGS_DIR
+        self.read_only = read_only
         self.current_log_file = None
-        self.log_buffer = []
-        self.last_log_index = 0
+        self.log_buffer = LogRing(self.LOG_BUFFER_SIZE)
+        self.log_tailer = LogTailer(self.get_current_log_file)
         self.last_log_time = 0
-        self.last_alert_time = {}
-        self.alert_email_sent = {}
+        self.dropped_lines = 0
+        self._write_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._log_handle = None
+        self._log_index = None
+        self._log_offset = 0
+        self._closing = False
+        self._closed = False
+        self._log_lock = threading.Lock()
+        # Serializes file writes; held by the writer thread and by direct writes after close()
+        self._file_lock = threading.RLock()
+        self._position_lock = threading.Lock()
         self.setup_logging()
+        try:
+            start_offset = os.path.getsize(self.current_log_file)
+        except OSError:
+            start_offset = 0
+        self._written_position = (0, self.current_log_file, start_offset)
+        self.sample_store = SampleStore(os.path.join(self.daily_logs_dir, "samples"))
+        self._writer_thread = None
+        self._rollup_thread = None
+        self._rollup_stop = threading.Event()
+        
+        if read_only:
+            self.rollups = None
+            return
+        
+        self.rollups = RollupStore(os.path.join(self.daily_logs_dir, "rollups"), self.sample_store)
+        
+        # Single writer thread; log calls only enqueue
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               name="LogWriter",
+                                               daemon=True)
+        self._writer_thread.start()
+        
+        # Rollups are kept current in the background
+        self._rollup_thread = threading.Thread(target=self._rollup_loop,
+                                               name="RollupUpdater",
+                                               daemon=True)
+        self._rollup_thread.start()
     
     def setup_logging(self):
         """Setup logging infrastructure"""
@@ -28,84 +90,242 @@ class LogManager:
     
     def get_current_log_file(self):
         """Get the current log file path based on current date"""
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        return os.path.join(self.daily_logs_dir, f"temperature_logs_{current_date}.logs")
+        return self.log_file_for(time.time())
+    
+    def log_file_for(self, timestamp):
+        """Daily log file for a Unix timestamp"""
+        date = datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+        return os.path.join(self.daily_logs_dir, f"temperature_logs_{date}.logs")
     
     def log_temperature(self, temp, source, status="Normal", is_alert=False):
         """
         Intelligent temperature logging:
         - Logs every minute during normal operation
-        - Logs immediately for alerts
-        - 1-hour cooldown for same alerts
+        - Logs immediately for alerts (the alert rules decide when to raise one)
         """
         current_time = time.time()
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Every sample goes to the binary store; the text log stays throttled
+        try:
+            self.sample_store.append(temp, source, status, current_time)
+        except Exception as e:
+            print(f"Error writing temperature sample: {e}")
         
         if is_alert:
-            log_entry = f"[{timestamp}] ⚠️ {status}: {temp:.1f}°C (Source: {source})"
-            
-            # Check 1-hour cooldown for same alert
-            alert_key = f"{status}_{temp:.0f}"
-            if alert_key in self.last_alert_time:
-                time_since_last = current_time - self.last_alert_time[alert_key]
-                if time_since_last < 3600:
-                    print(f"⚠️ Alert suppressed (1-hour cooldown): {status} - {temp:.1f}°C")
-                    return
-            
-            self.last_alert_time[alert_key] = current_time
+            kind = LogRecord.ALERT
         else:
             # Normal logging - only log once per minute
             if current_time - self.last_log_time < 60:
                 return
-            log_entry = f"[{timestamp}] 📊 {temp:.1f}°C (Source: {source}, Status: {status})"
             self.last_log_time = current_time
+            kind = LogRecord.TEMPERATURE
         
-        # Add to buffer and persist
-        self.log_buffer.append(log_entry)
-        
-        # Persist to file
-        threading.Thread(target=self._write_to_file, 
-                        args=(log_entry,),
-                        daemon=True).start()
-        
-        print(log_entry)
+        self._log(LogRecord(current_time, kind, temp=temp, source=source, status=status))
+    
+    def log_alert(self, temp, source, status):
+        """Log an alert line without recording a sample"""
+        self._log(LogRecord(time.time(), LogRecord.ALERT, temp=temp, source=source, status=status))
     
     def log_system_event(self, event_type, message):
         """Log system events"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] 🔧 {event_type}: {message}"
+        self._log(LogRecord(time.time(), LogRecord.SYSTEM, source=event_type, message=message))
+    
+    def _log(self, record):
+        """Add a record to the in-memory ring and persist it"""
+        # Queue order must match sequence order for written_position()
+        with self._log_lock:
+            seq = self.log_buffer.append(record)
+            self._enqueue(record, seq)
+        
+        print(record.format())
+    
+    def _enqueue(self, record, seq):
+        """Hand a record to the writer thread; it is formatted there"""
+        # The daily file follows the record's own timestamp, so a line
+        # stamped 23:59:59 stays in its day even if it is queued after midnight
+        if self.read_only:
+            return
         
-        self.log_buffer.append(log_entry)
-        threading.Thread(target=self._write_to_file, 
-                        args=(log_entry,),
-                        daemon=True).start()
+        item = (self.log_file_for(record.timestamp), record, seq)
         
-        print(log_entry)
+        if self._closed:
+            self._write_batch([item])
+            self._close_handle()
+            return
+        
+        try:
+            self._write_queue.put(item, timeout=self.ENQUEUE_TIMEOUT)
+        except queue.Full:
+            self.dropped_lines += 1
+            print(f"⚠️ Log queue full, dropped line ({self.dropped_lines} total)")
     
-    def should_send_alert_email(self, alert_type, temp):
-        """Check if we should send email for this alert (1-hour cooldown)"""
-        alert_key = f"{alert_type}_{temp:.0f}"
-        current_time = time.time()
+    def _writer_loop(self):
+        """Drain the queue, batching lines into the open daily file"""
+        pending = []
+        last_flush = time.monotonic()
         
-        if alert_key in self.alert_email_sent:
-            time_since_last = current_time - self.alert_email_sent[alert_key]
-            if time_since_last < 3600:
-                return False
+        while True:
+            if pending:
+                timeout = max(0, self.FLUSH_INTERVAL - (time.monotonic() - last_flush))
+            else:
+                timeout = None
+            
+            try:
+                item = self._write_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is _STOP:
+                self._write_batch(pending)
+                self._close_handle()
+                return
+            
+            if isinstance(item, threading.Event):
+                # flush() request
+                self._write_batch(pending)
+                pending = []
+                last_flush = time.monotonic()
+                item.set()
+                continue
+            
+            if item is not None:
+                pending.append(item)
+            
+            if (len(pending) >= self.FLUSH_BATCH_SIZE or
+                    (pending and time.monotonic() - last_flush >= self.FLUSH_INTERVAL)):
+                self._write_batch(pending)
+                pending = []
+                last_flush = time.monotonic()
+    
+    def _write_batch(self, items):
+        """Write queued (log_file, record, seq) items, switching files at midnight"""
+        if not items:
+            return
         
-        self.alert_email_sent[alert_key] = current_time
-        return True
+        with self._file_lock:
+            self._write_items(items)
     
-    def _write_to_file(self, log_entry):
-        """Write log entry to file"""
+    def _write_items(self, items):
         try:
-            current_file = self.get_current_log_file()
-            if current_file != self.current_log_file:
-                self.current_log_file = current_file
-            
-            with open(self.current_log_file, 'a', encoding='utf-8', errors='replace') as f:
-                f.write(log_entry + "\n")
+            records = []
+            for log_file, record, seq in items:
+                if log_file != self.current_log_file or self._log_handle is None:
+                    self._write_lines(records)
+                    records = []
+                    self._open_handle(log_file)
+                records.append((record, seq))
+            self._write_lines(records)
         except Exception as e:
             print(f"Error writing to log file: {e}")
+            self._close_handle()
+    
+    def _write_lines(self, records):
+        """Append (record, seq) pairs to the open file and extend its minute index"""
+        if not records or self._log_handle is None:
+            return
+        
+        chunks = []
+        for record, seq in records:
+            log_entry = record.format()
+            data = (log_entry + "\n").encode('utf-8', errors='replace')
+            self._log_index.add(LogIndex.minute_of(log_entry), self._log_offset)
+            self._log_offset += len(data)
+            chunks.append(data)
+        
+        self._log_handle.write(b"".join(chunks))
+        self._log_handle.flush()
+        self._log_index.save()
+        
+        with self._position_lock:
+            self._written_position = (records[-1][1] + 1, self.current_log_file, self._log_offset)
+    
+    def written_position(self):
+        """(seq, log_file, offset): records before seq end at offset in log_file.
+
+        Everything up to that byte is on disk and everything after it is
+        still in log_buffer at seq or later, so a reader can combine the two
+        without missing or repeating a line.
+        """
+        with self._position_lock:
+            return self._written_position
+    
+    def _open_handle(self, log_file):
+        self._close_handle()
+        self.current_log_file = log_file
+        self._log_index = LogIndex.load(log_file)
+        self._log_handle = open(log_file, 'ab')
+        self._log_offset = self._log_handle.seek(0, os.SEEK_END)
+    
+    def _close_handle(self):
+        with self._file_lock:
+            if self._log_handle is not None:
+                try:
+                    self._log_handle.close()
+                except Exception:
+                    pass
+                self._log_handle = None
+                self._log_index = None
+    
+    def _rollup_loop(self):
+        """Roll up completed minutes every ROLLUP_INTERVAL seconds"""
+        while True:
+            try:
+                self.rollups.update()
+            except Exception as e:
+                print(f"Error updating rollups: {e}")
+            if self._rollup_stop.wait(self.ROLLUP_INTERVAL):
+                return
+    
+    def flush(self, timeout=5.0):
+        """Block until every line logged so far is on disk; False if that takes over timeout seconds"""
+        self.sample_store.flush()
+        if self._closing or self._writer_thread is None or not self._writer_thread.is_alive():
+            return True
+        
+        # The queue is bounded: waiting for room counts against the timeout
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._write_queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(max(0.0, deadline - time.monotonic()))
+    
+    def close(self, timeout=5.0):
+        """Flush pending lines and stop the writer thread"""
+        if self._closing:
+            return
+        
+        self._closing = True
+        self.sample_store.close()
+        if self.read_only:
+            self._closed = True
+            return
+        
+        self._rollup_stop.set()
+        self._rollup_thread.join(timeout)
+        self._write_queue.put(_STOP)
+        self._writer_thread.join(timeout)
+        
+        # From here on log calls write directly (under _file_lock, in case
+        # the writer did not stop in time). _enqueue runs under _log_lock,
+        # so every line is either still queued below or written directly.
+        with self._log_lock:
+            self._closed = True
+        
+        # Lines that raced with close() are written directly
+        leftovers = []
+        while True:
+            try:
+                item = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                leftovers.append(item)
+            elif isinstance(item, threading.Event):
+                item.set()
+        self._write_batch(leftovers)
+        self._close_handle()
     
     def get_all_logs(self):
         """Get all logs from all .logs files"""
@@ -155,43 +375,69 @@ class LogManager:
         return []
     
     def get_new_logs(self):
-        """Get new logs since last check"""
-        current_logs = self.get_all_logs()
-        new_logs = current_logs[self.last_log_index:]
-        self.last_log_index = len(current_logs)
-        return new_logs
+        """Get new logs since last check (reads only appended bytes)"""
+        return self.log_tailer.read_new()
+    
+    def mark_logs_read(self):
+        """Make get_new_logs() return only lines written after this call"""
+        self.flush()
+        self.log_tailer.seek_to_end()
     
     def get_logs_for_time_range(self, start_datetime, end_datetime):
         """Get logs for a specific time range"""
         logs = []
         
         try:
-            if not os.path.exists(self.daily_logs_dir):
-                return logs
-            
-            current_date = start_datetime.date()
-            end_date = end_datetime.date()
-            
-            while current_date <= end_date:
-                log_file = os.path.join(self.daily_logs_dir, 
-                                      f"temperature_logs_{current_date.strftime('%Y-%m-%d')}.logs")
-                
-                if os.path.exists(log_file):
-                    file_logs = self._read_log_file_with_encoding(log_file)
-                    if file_logs:
-                        for log_entry in file_logs:
-                            try:
-                                timestamp_str = log_entry.split(']')[0][1:]
-                                log_datetime = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                                
-                                if start_datetime <= log_datetime <= end_datetime:
-                                    logs.append(log_entry)
-                            except ValueError:
-                                continue
-                
-                current_date += datetime.timedelta(days=1)
-                
+            for day, day_logs in self.iter_logs_for_time_range(start_datetime, end_datetime):
+                logs.extend(day_logs)
         except Exception as e:
             print(f"❌ Error reading logs for time range: {e}")
         
+        return logs
+    
+    def iter_logs_for_time_range(self, start_datetime, end_datetime):
+        """Yield (date, logs) for each day of the range, oldest first; days without a file yield []"""
+        if not os.path.exists(self.daily_logs_dir):
+            return
+        
+        current_date = start_datetime.date()
+        end_date = end_datetime.date()
+        
+        while current_date <= end_date:
+            log_file = os.path.join(self.daily_logs_dir, 
+                                  f"temperature_logs_{current_date.strftime('%Y-%m-%d')}.logs")
+            
+            if os.path.exists(log_file):
+                yield current_date, self._read_indexed_range(log_file, current_date,
+                                                             start_datetime, end_datetime)
+            else:
+                yield current_date, []
+            
+            current_date += datetime.timedelta(days=1)
+    
+    def _read_indexed_range(self, log_file, day, start_datetime, end_datetime):
+        """Read the lines of one daily file within [start, end] using its minute index"""
+        if log_file == self.current_log_file:
+            # Make sure the writer's buffered lines and index records are on disk
+            self.flush()
+        
+        index = LogIndex.load(log_file)
+        start_minute = start_datetime.hour * 60 + start_datetime.minute if day == start_datetime.date() else None
+        end_minute = end_datetime.hour * 60 + end_datetime.minute if day == end_datetime.date() else None
+        start_offset, end_offset = index.byte_range(start_minute, end_minute)
+        
+        with open(log_file, 'rb') as f:
+            f.seek(start_offset)
+            data = f.read() if end_offset is None else f.read(end_offset - start_offset)
+        
+        # Timestamps are fixed-width, so string comparison orders them correctly
+        start_str = start_datetime.strftime("%Y-%m-%d %H:%M:%S")
+        end_str = end_datetime.strftime("%Y-%m-%d %H:%M:%S")
+        
+        logs = []
+        for line in data.decode('utf-8', errors='replace').splitlines():
+            log_entry = line.strip()
+            if len(log_entry) > 20 and log_entry[0] == '[' and log_entry[20] == ']':
+                if start_str <= log_entry[1:20] <= end_str:
+                    logs.append(log_entry)
         return logs
\ No newline at end of file
@@ -0,0 +1,340 @@
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from app.core.aggregation import combine_buckets, local_utc_offset, parse_log_temperatures
+from app.core.sample_store import SampleStore
+from app.core.writer_lock import WriterLock
+
+
+class RollupStore:
+    """Pre-aggregated temperature rollups at 1-minute, 10-minute, 1-hour and 1-day levels.
+
+    Each level is an append-only file of packed rows
+    (bucket_epoch: uint32, mean, min, max: float32, count: uint32), sorted by
+    time. update() rolls completed minutes from the SampleStore into the
+    1-minute level, then cascades completed buckets up the pyramid.
+    state.json records how far each level is complete, so rows after a crash
+    are discarded and rebuilt on the next update.
+
+    Queries cover a range with the coarsest rows that fit it, use finer rows
+    for the ragged edges, and read raw samples for partial minutes at either
+    end and for the last minutes that are not rolled up yet, so no sample
+    outside the range is counted. Days rebuilt from the text logs have no
+    raw samples; their partial edge minutes are counted whole. Buckets are aligned to the local UTC offset recorded
+    when the store was created (or rebuilt).
+    """
+
+    LEVELS = (("1min", 60), ("10min", 600), ("1hour", 3600), ("1day", 86400))
+    DTYPE = np.dtype([('epoch', '<u4'), ('mean', '<f4'), ('min', '<f4'), ('max', '<f4'), ('count', '<u4')])
+
+    def __init__(self, rollups_dir, sample_store):
+        self.rollups_dir = rollups_dir
+        self.sample_store = sample_store
+        self.state_path = os.path.join(rollups_dir, "state.json")
+        self.utc_offset = local_utc_offset(time.time())
+        self.covered_from = None
+        self.processed_until = {name: 0 for name, _ in self.LEVELS}
+        self._lock = threading.RLock()
+
+        os.makedirs(rollups_dir, exist_ok=True)
+        self._load_state()
+
+    def file_for_level(self, name):
+        return os.path.join(self.rollups_dir, f"rollup_{name}.bin")
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.utc_offset = int(state['utc_offset'])
+            self.covered_from = state['covered_from']
+            self.processed_until.update({name: int(epoch) for name, epoch in state['processed_until'].items()})
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        # Drop rows written after the last saved state (e.g. a crash mid-update)
+        for name, _ in self.LEVELS:
+            rows = self._read(name)
+            keep = int(np.searchsorted(rows['epoch'], self.processed_until[name], side='left'))
+            if keep < len(rows):
+                with open(self.file_for_level(name), 'r+b') as f:
+                    f.truncate(keep * self.DTYPE.itemsize)
+
+    def _save_state(self):
+        state = {
+            'utc_offset': self.utc_offset,
+            'covered_from': self.covered_from,
+            'processed_until': self.processed_until,
+        }
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _align(self, epoch, width):
+        """Start of the bucket containing epoch"""
+        return int((epoch + self.utc_offset) // width * width - self.utc_offset)
+
+    def _read(self, name, start_epoch=None, end_epoch=None):
+        """Rows of one level with start <= epoch < end, as an in-memory array"""
+        path = self.file_for_level(name)
+        try:
+            count = os.path.getsize(path) // self.DTYPE.itemsize
+        except OSError:
+            count = 0
+        if count == 0:
+            return np.empty(0, dtype=self.DTYPE)
+
+        rows = np.memmap(path, dtype=self.DTYPE, mode='r', shape=(count,))
+        lo = 0 if start_epoch is None else np.searchsorted(rows['epoch'], start_epoch, side='left')
+        hi = count if end_epoch is None else np.searchsorted(rows['epoch'], end_epoch, side='left')
+        # Copy so the map is released straight away
+        return np.array(rows[lo:hi])
+
+    def _append(self, name, rows):
+        if len(rows):
+            with open(self.file_for_level(name), 'ab') as f:
+                f.write(rows.tobytes())
+
+    @classmethod
+    def _to_rows(cls, epochs, mean, minimum, maximum, counts):
+        rows = np.empty(len(epochs), dtype=cls.DTYPE)
+        rows['epoch'] = epochs
+        rows['mean'] = mean
+        rows['min'] = minimum
+        rows['max'] = maximum
+        rows['count'] = counts
+        return rows
+
+    @classmethod
+    def _rows_from_samples(cls, epochs, temps):
+        """Raw samples as one-sample rows"""
+        return cls._to_rows(epochs, temps, temps, temps, np.ones(len(epochs), dtype=np.int64))
+
+    def _combine(self, rows, width):
+        return self._to_rows(*combine_buckets(rows['epoch'], rows['mean'], rows['min'], rows['max'],
+                                              rows['count'], width, self.utc_offset))
+
+    def _load_samples(self, start_epoch, end_epoch):
+        """Raw (epochs, temps) from the sample store with start <= epoch < end"""
+        samples = self.sample_store.load_range(datetime.datetime.fromtimestamp(start_epoch),
+                                               datetime.datetime.fromtimestamp(end_epoch - 1))
+        return samples['epoch'].astype(np.float64), samples['temp'].astype(np.float64)
+
+    def update(self, now=None):
+        """Roll up every minute completed since the last update; returns rows written"""
+        with self._lock:
+            if self.covered_from is None:
+                dates = self.sample_store.dates()
+                if not dates:
+                    return 0
+                self._start_at(datetime.datetime.combine(dates[0], datetime.time()).timestamp())
+        return self._catch_up(self._load_samples, now)
+
+    def _start_at(self, epoch):
+        self.covered_from = self._align(epoch, 86400)
+        self.processed_until = {name: self.covered_from for name, _ in self.LEVELS}
+
+    def _catch_up(self, load_samples, now=None):
+        """Process raw data one day at a time up to the last completed minute"""
+        now = time.time() if now is None else now
+        target = self._align(now, 60)
+        written = 0
+
+        while self.processed_until["1min"] < target:
+            written += self._roll_up_chunk(load_samples, target)
+        return written
+
+    def _roll_up_chunk(self, load_samples, target):
+        """Roll up at most one day of raw data; the lock is held per chunk so queries can interleave"""
+        written = 0
+        with self._lock:
+            chunk_start = self.processed_until["1min"]
+            chunk_end = min(target, self._align(chunk_start, 86400) + 86400)
+
+            epochs, temps = load_samples(chunk_start, chunk_end)
+            rows = self._combine(self._rows_from_samples(epochs, temps), 60)
+            self._append("1min", rows)
+            self.processed_until["1min"] = chunk_end
+            written += len(rows)
+
+            for (finer, _), (name, width) in zip(self.LEVELS, self.LEVELS[1:]):
+                complete_until = self._align(self.processed_until[finer], width)
+                if complete_until <= self.processed_until[name]:
+                    continue
+                rows = self._combine(self._read(finer, self.processed_until[name], complete_until), width)
+                self._append(name, rows)
+                self.processed_until[name] = complete_until
+                written += len(rows)
+
+            self._save_state()
+
+        return written
+
+    def rebuild(self, daily_logs_dir, now=None):
+        """Recreate every level from the sample store and, for older days, the text logs"""
+        with self._lock:
+            for name, _ in self.LEVELS:
+                try:
+                    os.remove(self.file_for_level(name))
+                except OSError:
+                    pass
+
+            log_dates = set()
+            try:
+                for file_name in os.listdir(daily_logs_dir):
+                    if file_name.startswith("temperature_logs_") and file_name.endswith(".logs"):
+                        try:
+                            log_dates.add(datetime.datetime.strptime(file_name[17:27], "%Y-%m-%d").date())
+                        except ValueError:
+                            continue
+            except OSError:
+                pass
+
+            sample_dates = set(self.sample_store.dates())
+            dates = sorted(log_dates | sample_dates)
+
+            self.utc_offset = local_utc_offset(time.time())
+            self.covered_from = None
+            self.processed_until = {name: 0 for name, _ in self.LEVELS}
+            if not dates:
+                self._save_state()
+                return 0
+
+            def load_samples(start_epoch, end_epoch):
+                # Days recorded before the sample store existed come from the logs
+                parts = [self._load_samples(start_epoch, end_epoch)]
+                day = datetime.date.fromtimestamp(start_epoch)
+                while day <= datetime.date.fromtimestamp(end_epoch - 1):
+                    if day in log_dates and day not in sample_dates:
+                        log_path = os.path.join(daily_logs_dir,
+                                                f"temperature_logs_{day.strftime('%Y-%m-%d')}.logs")
+                        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                            epochs, temps = parse_log_temperatures(line.strip() for line in f)
+                        mask = (epochs >= start_epoch) & (epochs < end_epoch)
+                        parts.append((epochs[mask], temps[mask]))
+                    day += datetime.timedelta(days=1)
+
+                epochs = np.concatenate([part[0] for part in parts])
+                temps = np.concatenate([part[1] for part in parts])
+                order = np.argsort(epochs, kind='stable')
+                return epochs[order], temps[order]
+
+            self._start_at(datetime.datetime.combine(dates[0], datetime.time()).timestamp())
+            return self._catch_up(load_samples, now)
+
+    def covers(self, start_epoch):
+        """True if rollups exist from start_epoch onwards"""
+        return self.covered_from is not None and self.covered_from <= start_epoch
+
+    def rows(self, start_epoch, end_epoch, max_width=86400):
+        """Rows covering [start, end) using the coarsest levels up to max_width seconds.
+
+        Rows are sorted by time and may mix levels; the newest minutes that
+        are not rolled up yet are added as one-sample rows.
+        """
+        with self._lock:
+            top = max(i for i, (_, width) in enumerate(self.LEVELS) if width <= max_width)
+            parts = []
+            self._collect(int(start_epoch), int(end_epoch), top, parts)
+
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return np.empty(0, dtype=self.DTYPE)
+        rows = np.concatenate(parts)
+        return rows[np.argsort(rows['epoch'], kind='stable')]
+
+    def _collect(self, start, end, level_index, parts):
+        if start >= end:
+            return
+
+        name, width = self.LEVELS[level_index]
+
+        # Only buckets that lie entirely inside [start, end) are read at this level
+        first = self._align(start, width)
+        if first < start:
+            first += width
+        last = min(self._align(end, width), self.processed_until[name])
+        if first < last:
+            self._collect_finer(start, first, level_index, parts)
+            parts.append(self._read(name, first, last))
+            self._collect_finer(last, end, level_index, parts)
+        else:
+            self._collect_finer(start, end, level_index, parts)
+
+    def _collect_finer(self, start, end, level_index, parts):
+        """Cover [start, end) below a level: with finer rows, or raw samples below the 1-minute level"""
+        if start >= end:
+            return
+        if level_index > 0:
+            self._collect(start, end, level_index - 1, parts)
+        elif self.sample_store.covered_dates(datetime.datetime.fromtimestamp(start),
+                                             datetime.datetime.fromtimestamp(end - 1)):
+            parts.append(self._rows_from_samples(*self._load_samples(start, end)))
+        else:
+            # Rolled up from a text log: only the minute row holds these samples
+            name, width = self.LEVELS[0]
+            parts.append(self._read(name, self._align(start, width), end))
+
+    def buckets(self, start_epoch, end_epoch, bucket_seconds):
+        """(bucket_epochs, mean, min, max, count) for [start, end), like bucket_temperatures"""
+        max_width = max((width for _, width in self.LEVELS if bucket_seconds % width == 0), default=60)
+        rows = self.rows(start_epoch, end_epoch, max_width)
+        return combine_buckets(rows['epoch'], rows['mean'], rows['min'], rows['max'],
+                               rows['count'], bucket_seconds, self.utc_offset)
+
+    def summary(self, start_epoch, end_epoch):
+        """(mean, min, max, sample_count, rows_read) over [start, end), or None without data"""
+        rows = self.rows(start_epoch, end_epoch)
+        counts = rows['count'].astype(np.int64)
+        total = int(counts.sum())
+        if total == 0:
+            return None
+        mean = float((rows['mean'].astype(np.float64) * counts).sum() / total)
+        return mean, float(rows['min'].min()), float(rows['max'].max()), total, len(rows)
+
+
+def main(argv=None):
+    """Command line: python -m app.core.rollups rebuild [--logs-dir DIR]"""
+    parser = argparse.ArgumentParser(prog="python -m app.core.rollups",
+                                     description="Maintain the temperature rollup pyramid")
+    parser.add_argument("command", choices=["rebuild", "update"],
+                        help="rebuild: recreate from raw logs; update: roll up new samples")
+    parser.add_argument("--logs-dir", default="Daily logs", help="daily logs directory")
+    args = parser.parse_args(argv)
+
+    # The monitor or collector writing these logs also writes the rollups
+    writer_lock = WriterLock(args.logs_dir)
+    if not writer_lock.acquire():
+        print(f"❌ A monitor or collector is writing to '{args.logs_dir}'; stop it first")
+        return 1
+
+    try:
+        sample_store = SampleStore(os.path.join(args.logs_dir, "samples"))
+        rollups = RollupStore(os.path.join(args.logs_dir, "rollups"), sample_store)
+
+        start = time.perf_counter()
+        if args.command == "rebuild":
+            written = rollups.rebuild(args.logs_dir)
+        else:
+            written = rollups.update()
+        elapsed = time.perf_counter() - start
+        sample_store.close()
+    finally:
+        writer_lock.release()
+
+    print(f"✅ {args.command}: {written} rollup rows written in {elapsed:.1f}s")
+    for name, _ in RollupStore.LEVELS:
+        print(f"   {name:>6}: {len(rollups._read(name))} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+import datetime
+import json
+import os
+import struct
+import threading
+import time
+
+
+class SampleStore:
+    """Compact binary time series of temperature samples.
+
+    One append-only file per day holds packed little-endian records of
+    (epoch_seconds: uint32, temp: float32, status: uint8, source_id: uint16).
+    Source names are stored once in sources.json and referenced by id.
+    Files can be mapped straight into numpy with numpy.memmap(dtype=DTYPE),
+    or read with struct when numpy is not installed. The .logs text files
+    remain the human-readable record.
+    """
+
+    RECORD = struct.Struct("<IfBH")
+    # numpy dtype matching RECORD (packed, 11 bytes per sample)
+    DTYPE = [('epoch', '<u4'), ('temp', '<f4'), ('status', 'u1'), ('source', '<u2')]
+
+    STATUS_CODES = {"Normal": 0, "Warning": 1, "Critical": 2, "Unknown": 3}
+    STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, samples_dir):
+        self.samples_dir = samples_dir
+        self.sources_path = os.path.join(samples_dir, "sources.json")
+        self._sources = {}
+        self._handle = None
+        self._handle_path = None
+        self._last_flush = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(samples_dir, exist_ok=True)
+        self._load_sources()
+
+    def _load_sources(self):
+        try:
+            with open(self.sources_path, 'r', encoding='utf-8') as f:
+                self._sources = {name: int(source_id) for name, source_id in json.load(f).items()}
+        except (OSError, ValueError):
+            self._sources = {}
+
+    def _save_sources(self):
+        tmp_path = self.sources_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._sources, f, indent=2)
+        os.replace(tmp_path, self.sources_path)
+
+    def source_id(self, source):
+        """Id of a source name, registering it on first use"""
+        source_id = self._sources.get(source)
+        if source_id is None:
+            source_id = len(self._sources)
+            self._sources[source] = source_id
+            self._save_sources()
+        return source_id
+
+    def reload_sources(self):
+        """Re-read sources.json, e.g. after another process registered a source"""
+        self._load_sources()
+
+    def source_names(self):
+        """Map of source id -> source name"""
+        return {source_id: name for name, source_id in self._sources.items()}
+
+    def file_for_date(self, date):
+        return os.path.join(self.samples_dir, f"temperature_samples_{date.strftime('%Y-%m-%d')}.bin")
+
+    def append(self, temp, source, status="Normal", timestamp=None):
+        """Append one sample; buffered and flushed every few seconds"""
+        timestamp = time.time() if timestamp is None else timestamp
+        path = self.file_for_date(datetime.date.fromtimestamp(timestamp))
+
+        with self._lock:
+            record = self.RECORD.pack(int(timestamp), float(temp),
+                                      self.STATUS_CODES.get(status, self.STATUS_CODES["Unknown"]),
+                                      self.source_id(source))
+            if path != self._handle_path:
+                self._close_handle()
+                self._handle = open(path, 'ab')
+                self._handle_path = path
+
+            self._handle.write(record)
+
+            if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+                self._handle.flush()
+                self._last_flush = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+                self._last_flush = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._close_handle()
+
+    def _close_handle(self):
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+            self._handle = None
+            self._handle_path = None
+
+    def covered_dates(self, start_datetime, end_datetime):
+        """Dates in the range that have a sample file"""
+        return {date for date in self._dates(start_datetime, end_datetime)
+                if os.path.exists(self.file_for_date(date))}
+
+    def dates(self):
+        """Sorted dates that have a sample file"""
+        dates = []
+        try:
+            names = os.listdir(self.samples_dir)
+        except OSError:
+            return dates
+        for name in names:
+            if name.startswith("temperature_samples_") and name.endswith(".bin"):
+                try:
+                    dates.append(datetime.datetime.strptime(name[20:30], "%Y-%m-%d").date())
+                except ValueError:
+                    continue
+        return sorted(dates)
+
+    @staticmethod
+    def _dates(start_datetime, end_datetime):
+        date = start_datetime.date()
+        while date <= end_datetime.date():
+            yield date
+            date += datetime.timedelta(days=1)
+
+    def load_day(self, date):
+        """Memory-map one day's samples as a numpy structured array"""
+        import numpy as np
+
+        path = self.file_for_date(date)
+        try:
+            count = os.path.getsize(path) // self.RECORD.size
+        except OSError:
+            count = 0
+        if count == 0:
+            return np.empty(0, dtype=self.DTYPE)
+        return np.memmap(path, dtype=self.DTYPE, mode='r', shape=(count,))
+
+    def read_new(self, date, start=0):
+        """One day's samples from record number start on, as (epoch, temp, status, source_id) tuples"""
+        try:
+            with open(self.file_for_date(date), 'rb') as f:
+                f.seek(start * self.RECORD.size)
+                data = f.read()
+        except OSError:
+            return []
+        usable = len(data) - len(data) % self.RECORD.size
+        return list(self.RECORD.iter_unpack(data[:usable]))
+
+    def record_count(self, date):
+        """Number of complete samples in one day's file"""
+        try:
+            return os.path.getsize(self.file_for_date(date)) // self.RECORD.size
+        except OSError:
+            return 0
+
+    def load_range(self, start_datetime, end_datetime):
+        """Samples within [start, end] as a numpy structured array, sorted by time"""
+        import numpy as np
+
+        if self._handle_path is not None:
+            self.flush()
+
+        start_epoch = start_datetime.timestamp()
+        end_epoch = end_datetime.timestamp()
+
+        parts = []
+        for date in self._dates(start_datetime, end_datetime):
+            day = self.load_day(date)
+            if len(day) == 0:
+                continue
+            # Samples are appended in time order, so each day is sorted
+            lo = np.searchsorted(day['epoch'], start_epoch, side='left')
+            hi = np.searchsorted(day['epoch'], end_epoch, side='right')
+            if hi > lo:
+                parts.append(day[lo:hi])
+
+        if not parts:
+            return np.empty(0, dtype=self.DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def iter_range(self, start_datetime, end_datetime):
+        """Yield (epoch, temp, status, source_id) tuples without numpy"""
+        if self._handle_path is not None:
+            self.flush()
+
+        start_epoch = start_datetime.timestamp()
+        end_epoch = end_datetime.timestamp()
+
+        for date in self._dates(start_datetime, end_datetime):
+            try:
+                with open(self.file_for_date(date), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+            usable = len(data) - len(data) % self.RECORD.size
+            for record in self.RECORD.iter_unpack(data[:usable]):
+                if start_epoch <= record[0] <= end_epoch:
+                    yield record
@@ -0,0 +1,61 @@
+import os
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+
+class WriterLock:
+    """Exclusive lock on 'writer.lock' in the daily logs directory.
+
+    Only the process holding it writes logs, samples and rollups and sends
+    alerts: the GUI, the headless collector and the rollup rebuild all take
+    it first. The lock belongs to the open file, so the OS drops it when
+    the holder exits or crashes and there is never a stale lock to clean up.
+    """
+
+    FILE_NAME = "writer.lock"
+
+    def __init__(self, logs_dir):
+        self.path = os.path.join(logs_dir, self.FILE_NAME)
+        self._handle = None
+
+    @property
+    def held(self):
+        return self._handle is not None
+
+    def acquire(self):
+        """Take the lock without waiting; False if another process holds it"""
+        if self._handle is not None:
+            return True
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        handle = open(self.path, 'a+b')
+        try:
+            if msvcrt is not None:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+
+        self._handle = handle
+        return True
+
+    def release(self):
+        if self._handle is None:
+            return
+        try:
+            if msvcrt is not None:
+                self._handle.seek(0)
+                msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            pass
+        self._handle.close()
+        self._handle = None
@@ -0,0 +1,261 @@
+import datetime
+import os
+import time
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+
+from app.core.alert_rules import AlertEngine, threshold_rules
+from app.core.event_bus import EventBus
+from app.services.mail_outbox import MailOutbox
+
+
+class AlertService:
+    """Alert rules, the event bus and the email and log sinks.
+
+    Shared by the Tk monitor and the headless collector, so neither needs
+    the other to raise alerts or send mail. The GUI subscribes its desktop
+    and sound sinks to event_bus on top of these.
+    """
+
+    def __init__(self, log_manager, email_config):
+        self.log_manager = log_manager
+        self.email_config = email_config
+        self.warning_temp = None
+        self.critical_temp = None
+        self.alert_engine = None
+        # (rule name, transition kind) -> count, for the metrics exporter
+        self.alert_counts = {}
+
+        # All mail goes through one outbox worker; sending never blocks the caller
+        self.mail_outbox = MailOutbox(email_config,
+                                      os.path.join(log_manager.daily_logs_dir, "outbox"),
+                                      on_result=self.on_mail_result)
+
+        # Alerts are published on the bus; each notifier drains its own queue
+        self.event_bus = EventBus()
+        both = ["alert", "recovery"]
+        self.event_bus.subscribe("email", self.email_alert, topics=both, deadline=900)
+        self.event_bus.subscribe("log", self.log_alert, topics=both, deadline=60)
+
+    def configure(self, warning_temp, critical_temp, hysteresis, extra_rules=()):
+        """(Re)compile the alert rules; rules that are firing stay firing."""
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
+        specs = threshold_rules(warning_temp, critical_temp, hysteresis)
+        try:
+            self.alert_engine = AlertEngine.compile(specs + list(extra_rules), previous=self.alert_engine)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Error in alert_rules setting, using thresholds only: {e}")
+            self.alert_engine = AlertEngine.compile(specs, previous=self.alert_engine)
+
+    def evaluate(self, adjusted_temp, source):
+        """Run the alert rules on one sample and publish what changed."""
+        for kind, rule, value in self.alert_engine.evaluate(time.time(), adjusted_temp):
+            self.alert_counts[rule.name, kind] = self.alert_counts.get((rule.name, kind), 0) + 1
+            topic = "recovery" if kind == "recovery" else "alert"
+            self.event_bus.publish(topic, rule=rule.name, level=rule.level,
+                                   temp=adjusted_temp, source=source, repeat=(kind == "repeat"))
+
+    @staticmethod
+    def alert_status(event):
+        """'Warning', or 'Warning - <rule>' for rules other than the threshold ones."""
+        status = event.data['level'].title()
+        if event.data['rule'] != status:
+            status += f" - {event.data['rule']}"
+        return status
+
+    def email_alert(self, event):
+        """Email sink: queue an alert or recovery email."""
+        if event.topic == "recovery":
+            self.send_recovery_email(event.data['rule'], event.data['temp'], event.data['source'])
+        else:
+            self.send_alert_email(event.data['level'], event.data['temp'], event.data['source'],
+                                  rule=event.data['rule'])
+
+    def log_alert(self, event):
+        """Log sink: alert lines and recoveries."""
+        if event.topic == "recovery":
+            self.log_manager.log_system_event(
+                "Alert Cleared",
+                f"{event.data['rule']}: back to {event.data['temp']:.1f}°C (Source: {event.data['source']})"
+            )
+        else:
+            self.log_manager.log_alert(event.data['temp'], event.data['source'], self.alert_status(event))
+
+
+    def send_alert_email(self, alert_type, adjusted_temp, source, rule=None):
+        """Send alert email for critical/warning temperatures."""
+        try:
+            msg = MIMEMultipart()
+            msg['From'] = self.email_config['sender_email']
+            msg['To'] = self.email_config['receiver_email']
+
+            if alert_type == "CRITICAL":
+                msg['Subject'] = f"🚨 CRITICAL Temperature Alert - {adjusted_temp:.1f}°C"
+                color = "🔴"
+                urgency = "IMMEDIATE ACTION REQUIRED"
+            else:
+                msg['Subject'] = f"⚠️ Warning Temperature Alert - {adjusted_temp:.1f}°C"
+                color = "🟡"
+                urgency = "Monitor Closely"
+
+            # Build email body
+            body = f"""
+{color} TEMPERATURE ALERT
+=====================================
+
+Alert Type: {alert_type} {color}
+Rule: {rule or alert_type.title()}
+Temperature: {adjusted_temp:.1f}°C
+Source: SERVER ROOM
+Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+Urgency: {urgency}
+
+Current Thresholds:
+• Warning: {self.warning_temp}°C
+• Critical: {self.critical_temp}°C
+
+Recommended Actions:
+1. Check cooling system
+2. Ensure proper ventilation
+3. Monitor temperature trends
+4. Consider reducing system load
+
+This is an automated alert from the Temperature Monitoring System.
+The system will continue to monitor and send updates every hour if the issue persists.
+
+Device: {os.environ.get('COMPUTERNAME', 'Unknown Device')}
+"""
+
+            msg.attach(MIMEText(body, 'plain'))
+
+            # Queue email; the outbox delivers and logs the result
+            self.mail_outbox.send(msg, f"{alert_type} Alert ({adjusted_temp:.1f}°C)")
+            print(f"📨 {alert_type} alert email queued")
+
+            return True
+
+        except Exception as e:
+            print(f"❌ Error queueing alert email: {e}")
+            self.log_manager.log_system_event("Email Error", f"Failed to queue {alert_type} alert: {e}")
+            return False
+
+    def send_recovery_email(self, rule, adjusted_temp, source):
+        """Send an email when an alert rule has cleared."""
+        try:
+            msg = MIMEMultipart()
+            msg['From'] = self.email_config['sender_email']
+            msg['To'] = self.email_config['receiver_email']
+            msg['Subject'] = f"✅ Temperature Recovered ({rule}) - {adjusted_temp:.1f}°C"
+
+            body = f"""
+✅ TEMPERATURE RECOVERED
+=====================================
+
+Rule: {rule}
+Temperature: {adjusted_temp:.1f}°C
+Source: SERVER ROOM
+Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+The condition that raised this alert has cleared.
+
+Device: {os.environ.get('COMPUTERNAME', 'Unknown Device')}
+"""
+
+            msg.attach(MIMEText(body, 'plain'))
+            self.mail_outbox.send(msg, f"{rule} Recovery")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error queueing recovery email: {e}")
+            self.log_manager.log_system_event("Email Error", f"Failed to queue {rule} recovery: {e}")
+            return False
+
+
+    def send_report(self, adjusted_temp, source, status, min_temp, max_temp):
+        """Send the hourly temperature report email."""
+        try:
+            msg = MIMEMultipart()
+            msg['From'] = self.email_config['sender_email']
+            msg['To'] = self.email_config['receiver_email']
+            msg['Subject'] = f"Temperature Report - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}"
+
+            # Build email body
+            body = f"""        
+            **TEMPERATURE MONITORING REPORT**
+**Nanox Philippines Inc. – Server Room**
+
+==================================================
+
+**TIMESTAMP**
+**{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}**
+
+==================================================
+
+**CURRENT STATUS**
+
+• **Temperature:** {adjusted_temp:.1f}°C *(Adjusted for room temperature)*
+• **Source:** {source} – SERVER ROOM
+• **Status:** **{status}**
+
+==================================================
+
+**TEMPERATURE SUMMARY (PAST 1 HOUR)**
+
+• Minimum Temperature: {min_temp if min_temp != float('inf') else 'N/A':.1f}°C
+• Maximum Temperature: {max_temp if max_temp != float('-inf') else 'N/A':.1f}°C
+
+---
+
+This is an **automated system-generated report** from the Temperature Monitoring System.
+
+No action is required unless a warning or critical status is indicated above.
+
+---
+
+**IT Infrastructure Monitoring**
+Nanox Philippines Inc.
+"""
+
+            msg.attach(MIMEText(body, 'plain'))
+
+            # Queue email; the outbox delivers and logs the result
+            self.mail_outbox.send(msg, "Daily Report")
+            print(f"📨 Daily report queued at {datetime.datetime.now().strftime('%H:%M:%S')}")
+
+            return True
+
+        except Exception as e:
+            print(f"❌ Error queueing daily report: {e}")
+            self.log_manager.log_system_event("Report Error", f"Failed to queue daily report: {e}")
+            return False
+
+    def on_mail_result(self, kind, error, permanent):
+        """Log outbox deliveries; runs on the outbox worker thread."""
+        if error is None:
+            print(f"✅ {kind} email sent")
+            self.log_manager.log_system_event(f"{kind} Email", "Sent")
+        elif permanent:
+            self.log_manager.log_system_event("Email Error", f"{kind} email rejected: {error}")
+        else:
+            self.log_manager.log_system_event("Email Error",
+                                              f"{kind} email not sent yet, retrying: {error}")
+
+
+    def log_alert_sink_stats(self):
+        """Log any alerts the sinks dropped, expired or failed on."""
+        for name, stats in self.event_bus.stats().items():
+            lost = stats['dropped'] + stats['expired'] + stats['failed']
+            if lost:
+                self.log_manager.log_system_event(
+                    "Alert Sink",
+                    f"{name}: {stats['delivered']} delivered, {stats['dropped']} dropped, "
+                    f"{stats['expired']} expired, {stats['failed']} failed"
+                )
+
+    def close(self):
+        """Stop the sinks, log what they lost and stop the outbox."""
+        self.event_bus.close()
+        self.log_alert_sink_stats()
+        self.mail_outbox.close()
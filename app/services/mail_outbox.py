@@ -0,0 +1,265 @@
+import email
+import email.policy
+import itertools
+import os
+import queue
+import smtplib
+import threading
+import time
+
+_STOP = object()
+
+# Seconds; overridable with 'connect_timeout' / 'send_timeout' in the email config
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_SEND_TIMEOUT = 30
+
+SMTP_PHASES = ("connect", "tls", "auth", "send")
+
+
+def open_smtp(config, timings=None):
+    """Connect, upgrade to TLS and log in; returns the ready SMTP connection.
+
+    The connect timeout covers opening the socket, the send timeout every
+    later reply. If timings is a dict, the seconds taken by each finished
+    phase are stored in it, so after a failure the first missing phase is
+    the one that failed.
+    """
+    timings = {} if timings is None else timings
+    send_timeout = config.get('send_timeout', DEFAULT_SEND_TIMEOUT)
+
+    started = time.perf_counter()
+    server = smtplib.SMTP(config['smtp_server'], config['smtp_port'],
+                          timeout=config.get('connect_timeout', DEFAULT_CONNECT_TIMEOUT))
+    timings['connect'] = time.perf_counter() - started
+    try:
+        server.timeout = send_timeout
+        server.sock.settimeout(send_timeout)
+
+        started = time.perf_counter()
+        server.starttls()
+        timings['tls'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        server.login(config['sender_email'], config['sender_password'])
+        timings['auth'] = time.perf_counter() - started
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def timed_send(config, msg):
+    """Send msg over a fresh connection, timing each phase.
+
+    Returns (timings, failed_phase, error); failed_phase and error are None
+    on success.
+    """
+    timings = {}
+    try:
+        server = open_smtp(config, timings)
+        try:
+            started = time.perf_counter()
+            server.send_message(msg)
+            timings['send'] = time.perf_counter() - started
+        finally:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+    except Exception as e:
+        failed_phase = next((phase for phase in SMTP_PHASES if phase not in timings), "send")
+        return timings, failed_phase, e
+    return timings, None, None
+
+
+def format_timings(timings):
+    """'connect 120 ms, tls 85 ms, ...' for the phases that finished"""
+    return ", ".join(f"{phase} {timings[phase] * 1000:.0f} ms"
+                     for phase in SMTP_PHASES if phase in timings)
+
+
+class MailOutbox:
+    """Queue of outgoing mail delivered by one worker over a reused SMTP connection.
+
+    send() writes the message to outbox_dir and returns immediately, so the
+    monitor loop never waits on the mail server. The worker keeps one
+    authenticated connection open, sends NOOP while idle to keep it alive,
+    closes it after IDLE_DISCONNECT seconds without mail and reconnects on
+    demand. Failed deliveries are retried with exponential backoff; mail
+    still queued at shutdown stays on disk and is sent on the next start.
+    Permanent rejections (a 5xx reply, or every recipient refused) are
+    moved to outbox_dir/failed.
+    """
+
+    KEEPALIVE_INTERVAL = 60
+    IDLE_DISCONNECT = 300
+    RETRY_INITIAL = 5
+    RETRY_MAX = 900
+    KIND_HEADER = 'X-Monitor-Kind'
+
+    def __init__(self, config, outbox_dir, on_result=None):
+        self.config = config
+        self.outbox_dir = outbox_dir
+        self.failed_dir = os.path.join(outbox_dir, "failed")
+        self.on_result = on_result
+        self.sent = 0
+        self.failed = 0
+        self.reconnects = 0
+        self._server = None
+        self._last_used = 0
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._counter = itertools.count()
+
+        os.makedirs(self.outbox_dir, exist_ok=True)
+        for name in sorted(os.listdir(self.outbox_dir)):
+            if name.endswith(".eml"):
+                self._queue.put(os.path.join(self.outbox_dir, name))
+        if self._queue.qsize():
+            print(f"📨 {self._queue.qsize()} unsent email(s) found in outbox")
+
+        self._thread = threading.Thread(target=self._run, name="MailOutbox", daemon=True)
+        self._thread.start()
+
+    def pending(self):
+        """Number of messages waiting to be delivered"""
+        return self._queue.qsize()
+
+    def send(self, msg, kind="Email"):
+        """Persist msg and queue it for delivery; kind is reported to on_result"""
+        if self.KIND_HEADER not in msg:
+            msg[self.KIND_HEADER] = kind
+        name = f"{time.time_ns()}-{next(self._counter)}.eml"
+        path = os.path.join(self.outbox_dir, name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(msg.as_bytes())
+        os.replace(tmp_path, path)
+        self._queue.put(path)
+
+    def close(self, timeout=5.0):
+        """Stop the worker; undelivered mail is left in the outbox"""
+        self._stop.set()
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            try:
+                path = self._queue.get(timeout=self.KEEPALIVE_INTERVAL if self._server else None)
+            except queue.Empty:
+                self._keepalive()
+                continue
+
+            if path is _STOP:
+                self._disconnect()
+                return
+
+            if not self._deliver_with_retry(path):
+                # Stopped while retrying; the file stays for the next start
+                self._disconnect()
+                return
+
+    def _deliver_with_retry(self, path):
+        """Deliver one queued file; returns False only if stopped before it was done"""
+        try:
+            with open(path, 'rb') as f:
+                msg = email.message_from_binary_file(f, policy=email.policy.SMTP)
+        except OSError as e:
+            print(f"❌ Could not read queued email {path}: {e}")
+            return True
+
+        # Internal bookkeeping only; never sent to the server
+        kind = msg.get(self.KIND_HEADER, "Email")
+        del msg[self.KIND_HEADER]
+        delay = self.RETRY_INITIAL
+        attempts = 0
+        while not self._stop.is_set():
+            attempts += 1
+            try:
+                self._deliver(msg)
+            except smtplib.SMTPRecipientsRefused as e:
+                # Retrying cannot fix the addresses
+                self._give_up(path, kind, e)
+                return True
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code >= 500:
+                    self._give_up(path, kind, e)
+                    return True
+                error = e
+            except (smtplib.SMTPException, OSError) as e:
+                error = e
+            else:
+                self._remove(path)
+                self.sent += 1
+                self._report(kind, None)
+                return True
+
+            self._disconnect()
+            print(f"⚠️ {kind} email attempt {attempts} failed, retrying in {delay}s: {error}")
+            if attempts == 1:
+                self._report(kind, error)
+            if self._stop.wait(delay):
+                return False
+            delay = min(delay * 2, self.RETRY_MAX)
+        return False
+
+    def _deliver(self, msg):
+        """Send over the pooled connection, reconnecting once if it went stale"""
+        if self._server is not None:
+            try:
+                self._server.send_message(msg)
+                self._last_used = time.monotonic()
+                return
+            except smtplib.SMTPServerDisconnected:
+                self._disconnect()
+                self.reconnects += 1
+
+        self._server = open_smtp(self.config)
+        self._server.send_message(msg)
+        self._last_used = time.monotonic()
+
+    def _keepalive(self):
+        """NOOP an idle connection, or close it once idle for too long"""
+        if self._server is None:
+            return
+        if time.monotonic() - self._last_used >= self.IDLE_DISCONNECT:
+            self._disconnect()
+            return
+        try:
+            self._server.noop()
+        except (smtplib.SMTPException, OSError):
+            self._disconnect()
+
+    def _disconnect(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def _give_up(self, path, kind, error):
+        self.failed += 1
+        os.makedirs(self.failed_dir, exist_ok=True)
+        try:
+            os.replace(path, os.path.join(self.failed_dir, os.path.basename(path)))
+        except OSError:
+            pass
+        print(f"❌ {kind} email rejected by server: {error}")
+        self._report(kind, error, permanent=True)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _report(self, kind, error, permanent=False):
+        if self.on_result is None:
+            return
+        try:
+            self.on_result(kind, error, permanent)
+        except Exception as e:
+            print(f"Error in mail outbox callback: {e}")
@@ -0,0 +1,225 @@
+import bisect
+import http.server
+import math
+import threading
+import time
+
+# Seconds; upper bounds of the sampling-loop duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+STATUSES = ("Normal", "Warning", "Critical", "Unknown")
+
+
+class Histogram:
+    """Duration histogram with fixed bucket bounds (seconds)"""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, labels):
+        """_bucket/_sum/_count samples, buckets cumulative as the format requires"""
+        samples = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            samples.append(("_bucket", dict(labels, le=bound), total))
+        samples.append(("_sum", labels, self.sum))
+        samples.append(("_count", labels, self.count))
+        return samples
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        if not isinstance(value, str):
+            value = _format_value(value)
+        value = value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def render(families, openmetrics=True):
+    """Exposition text for (name, type, help, samples) families; samples are (suffix, labels, value).
+
+    OpenMetrics names a counter family without its _total suffix and ends
+    with '# EOF'; the older Prometheus text format does neither.
+    """
+    lines = []
+    for name, kind, help_text, samples in families:
+        family = name if openmetrics or kind != "counter" else name + "_total"
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+    if openmetrics:
+        lines.append("# EOF")
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    exporter = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        openmetrics, prometheus = self.exporter.snapshot
+        if "application/openmetrics-text" in self.headers.get("Accept", ""):
+            body, content_type = openmetrics, OPENMETRICS_CONTENT_TYPE
+        else:
+            body, content_type = prometheus, PROMETHEUS_CONTENT_TYPE
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # One line per scrape would flood the console
+        pass
+
+
+class MetricsExporter:
+    """OpenMetrics/Prometheus endpoint at http://host:port/metrics.
+
+    The sampling loop calls observe() and update() after each sample;
+    update() renders the complete exposition text up front. A scrape only
+    sends the last rendered bytes, so it never reads sensors (WMI) or waits
+    on the sampling loop. Binds to localhost unless another host is given.
+    """
+
+    PREFIX = "room_temperature"
+
+    def __init__(self, port, host="127.0.0.1"):
+        self.started = time.time()
+        self.durations = {}
+        self.samples = 0
+        self.snapshot = (render([], openmetrics=True), render([], openmetrics=False))
+
+        handler = type("MetricsHandler", (_MetricsHandler,), {'exporter': self})
+        self._server = http.server.ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self.address = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.5},
+                                        name="MetricsExporter", daemon=True)
+        self._thread.start()
+        print(f"📈 Metrics at http://{self.address[0]}:{self.address[1]}/metrics")
+
+    def observe(self, phase, seconds):
+        """Add one duration (seconds) to the histogram of a sampling-loop phase"""
+        if phase not in self.durations:
+            self.durations[phase] = Histogram()
+        self.durations[phase].observe(seconds)
+
+    def update(self, temp, source, status, sensors=None, alerts=None):
+        """Render a new snapshot.
+
+        temp is the adjusted temperature (None without a reading), sensors
+        maps category -> sensor dicts as read by StorageTemperatureReader,
+        and alerts is the AlertService, if any.
+        """
+        self.samples += 1
+        p = self.PREFIX
+        status = status or "Unknown"
+        families = []
+
+        families.append((f"{p}_celsius", "gauge",
+                         "Adjusted room temperature from the preferred sensors.",
+                         [("", {'source': source or ""}, temp)] if temp is not None else []))
+
+        # Names repeat (e.g. two identical drives); the identifier keeps each series unique
+        families.append((f"{p}_sensor_celsius", "gauge",
+                         "Raw reading of each temperature sensor.",
+                         [("", {'sensor': sensor['name'], 'identifier': str(sensor['identifier']),
+                                'parent': str(sensor['parent']), 'category': category}, sensor['value'])
+                          for category, readings in (sensors or {}).items()
+                          for sensor in readings]))
+
+        families.append((f"{p}_status", "gauge",
+                         "1 for the current temperature status.",
+                         [("", {'status': name.lower()}, name == status) for name in STATUSES]))
+
+        families.append((f"{p}_samples", "counter", "Sampling loop iterations.",
+                         [("_total", {}, self.samples)]))
+
+        families.append((f"{p}_last_sample_timestamp_seconds", "gauge",
+                         "Unix time of the last sample.",
+                         [("", {}, time.time())]))
+
+        families.append((f"{p}_start_time_seconds", "gauge",
+                         "Unix time the monitor started.",
+                         [("", {}, self.started)]))
+
+        families.append((f"{p}_sample_duration_seconds", "histogram",
+                         "Time spent per sample: 'read' is the sensor read, 'total' the whole iteration.",
+                         [sample for phase, histogram in sorted(self.durations.items())
+                          for sample in histogram.samples({'phase': phase})]))
+
+        if alerts is not None:
+            families.extend(self._alert_families(alerts))
+
+        self.snapshot = (render(families, openmetrics=True), render(families, openmetrics=False))
+
+    def _alert_families(self, alerts):
+        p = self.PREFIX
+        families = []
+
+        families.append((f"{p}_threshold_celsius", "gauge", "Warning and critical thresholds.",
+                         [("", {'level': "warning"}, alerts.warning_temp),
+                          ("", {'level': "critical"}, alerts.critical_temp)]))
+
+        families.append((f"{p}_alert_firing", "gauge", "1 while an alert rule is firing.",
+                         [("", {'rule': rule.name, 'level': rule.level.lower()},
+                           rule.state == rule.FIRING)
+                          for rule in alerts.alert_engine.rules]))
+
+        families.append((f"{p}_alert_transitions", "counter",
+                         "Alert rule transitions (alert, repeat, recovery).",
+                         [("_total", {'rule': rule, 'kind': kind}, count)
+                          for (rule, kind), count in sorted(alerts.alert_counts.items())]))
+
+        sink_samples = []
+        for sink, stats in sorted(alerts.event_bus.stats().items()):
+            for outcome in ("delivered", "dropped", "expired", "failed", "late"):
+                sink_samples.append(("_total", {'sink': sink, 'outcome': outcome}, stats[outcome]))
+        families.append((f"{p}_notifications", "counter",
+                         "Alert notifications per sink and outcome.", sink_samples))
+
+        outbox = alerts.mail_outbox
+        families.append((f"{p}_emails", "counter", "Emails delivered or rejected by the server.",
+                         [("_total", {'outcome': "sent"}, outbox.sent),
+                          ("_total", {'outcome': "failed"}, outbox.failed)]))
+        families.append((f"{p}_emails_pending", "gauge", "Emails waiting in the outbox.",
+                         [("", {}, outbox.pending())]))
+        return families
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
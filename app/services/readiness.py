@@ -0,0 +1,89 @@
+import threading
+import time
+
+
+class SensorReadinessProbe:
+    """Waits in the background for sensors to come up after launching OpenHardwareMonitor.
+
+    Polls the sensor backend with exponential backoff instead of sleeping a
+    fixed amount up front, and watches the launched process (when its PID is
+    known) so an early exit is reported immediately. The UI and monitor
+    thread keep running meanwhile and show a "warming up" state.
+    """
+
+    WARMING_UP = "warming_up"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(self, reader, process=None, initial_delay=0.25, max_delay=4.0,
+                 timeout=30.0, on_ready=None, on_failed=None):
+        self.reader = reader
+        self.process = process
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.on_ready = on_ready
+        self.on_failed = on_failed
+        self.state = self.WARMING_UP
+        self.failure_reason = None
+        self.attempts = 0
+        self._done = threading.Event()
+        self._thread = None
+
+    @property
+    def is_warming_up(self):
+        return self.state == self.WARMING_UP
+
+    def start(self):
+        """Start probing on a daemon thread and return immediately"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        """Block until the probe finishes; returns True when sensors are ready"""
+        self._done.wait(timeout)
+        return self.state == self.READY
+
+    def _process_exited(self):
+        return self.process is not None and self.process.poll() is not None
+
+    def _run(self):
+        delay = self.initial_delay
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            self.attempts += 1
+            if self.reader.backend.initialize(verbose=False):
+                self._finish(self.READY)
+                return
+
+            if self._process_exited():
+                self._finish(self.FAILED, f"OpenHardwareMonitor exited (code {self.process.returncode})")
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._finish(self.FAILED, f"Sensors not ready after {self.timeout:.0f}s")
+                return
+
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_delay)
+
+    def _finish(self, state, reason=None):
+        self.state = state
+        self.failure_reason = reason
+        self._done.set()
+
+        if state == self.READY:
+            print(f"✅ Sensors ready after {self.attempts} attempt(s)")
+            callback = self.on_ready
+        else:
+            print(f"⚠️ {reason}")
+            callback = self.on_failed
+
+        if callback is not None:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"Readiness callback error: {e}")
@@ -0,0 +1,275 @@
+import errno
+import glob
+import os
+import threading
+import time
+
+from app.services.wmi_session import OpenHardwareMonitorSession
+
+
+class SensorBackend:
+    """Source of raw temperature sensor readings.
+
+    read_sensors() returns a list of dicts with 'name', 'value' (°C),
+    'parent' and 'identifier' keys, the shape StorageTemperatureReader
+    classifies and prioritises.
+    """
+
+    name = "Unknown"
+    requires_openhardware_monitor = False
+
+    def initialize(self, verbose=True):
+        """Prepare the backend; returns True when sensors can be read"""
+        return self.is_available()
+
+    def is_available(self):
+        return False
+
+    def read_sensors(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class WMISensorBackend(SensorBackend):
+    """Windows backend reading OpenHardwareMonitor sensors over WMI"""
+
+    name = "OpenHardwareMonitor (WMI)"
+    requires_openhardware_monitor = True
+
+    def __init__(self, wmi_module=None):
+        self.session = OpenHardwareMonitorSession(wmi_module=wmi_module)
+        self.wmi_available = False
+        self.ohm_available = False
+
+    def initialize(self, verbose=True):
+        """Initialize WMI connection"""
+        try:
+            self.session.load_wmi()
+            self.wmi_available = True
+
+            # Test OpenHardwareMonitor
+            try:
+                self.session.reset()
+                self.session.connect()
+                self.ohm_available = True
+                if verbose:
+                    print("✅ OpenHardwareMonitor detected")
+            except Exception:
+                if verbose:
+                    print("❌ OpenHardwareMonitor not detected")
+
+        except ImportError:
+            if verbose:
+                print("❌ WMI not available")
+
+        return self.ohm_available
+
+    def is_available(self):
+        return self.ohm_available
+
+    def read_sensors(self):
+        """Get all temperature sensors from OpenHardwareMonitor"""
+        sensors = self.session.get_sensor_handles()
+
+        temp_sensors = []
+        for sensor in sensors:
+            value = self.session.current_value(sensor)
+            if (sensor.SensorType == "Temperature" and
+                value is not None and
+                value != 0):
+
+                temp_sensors.append({
+                    'name': sensor.Name if hasattr(sensor, 'Name') else "Unknown",
+                    'value': float(value),
+                    'parent': sensor.Parent if hasattr(sensor, 'Parent') else "Unknown",
+                    'identifier': sensor.Identifier if hasattr(sensor, 'Identifier') else "Unknown",
+                })
+
+        return temp_sensors
+
+    def close(self):
+        self.session.reset()
+
+
+class LinuxHwmonBackend(SensorBackend):
+    """Linux backend reading /sys/class/hwmon/*/temp*_input directly.
+
+    Every temp*_input file is opened once and kept open; a poll is one
+    os.pread() per sensor. The tree is rescanned when a sensor disappears
+    and periodically to pick up hot-plugged devices.
+
+    A rescan builds a complete new descriptor table before taking the lock
+    to swap it in, and closes the old descriptors only after the swap.
+    Reads hold the same lock, so a poll on another thread (the readiness
+    probe initializes while the monitor loop reads) never preads a closed
+    or reused descriptor.
+    """
+
+    name = "Linux hwmon"
+    HWMON_ROOT = "/sys/class/hwmon"
+
+    # Sensors that are asleep or unsupported report these instead of a value
+    SKIPPED_ERRNOS = (errno.EAGAIN, errno.EIO, errno.ENODATA, errno.ENXIO)
+
+    def __init__(self, root=None, rescan_interval=60):
+        self.root = root or self.HWMON_ROOT
+        self.rescan_interval = rescan_interval
+        self._sensors = []  # (fd, name, parent, identifier)
+        self._last_scan = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _read_text(path):
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _scan(self):
+        """Open a descriptor for every temperature input under the hwmon root"""
+        sensors = []
+        for hwmon_dir in sorted(glob.glob(os.path.join(self.root, "hwmon*"))):
+            hwmon_name = os.path.basename(hwmon_dir)
+            chip = self._read_text(os.path.join(hwmon_dir, "name")) or hwmon_name
+
+            # drivetemp/nvme expose the drive model, which helps classification
+            model = self._read_text(os.path.join(hwmon_dir, "device", "model"))
+            parent = f"{model} ({chip})" if model else chip
+
+            for input_path in sorted(glob.glob(os.path.join(hwmon_dir, "temp*_input"))):
+                index = os.path.basename(input_path)[len("temp"):-len("_input")]
+                label = self._read_text(os.path.join(hwmon_dir, f"temp{index}_label"))
+
+                try:
+                    fd = os.open(input_path, os.O_RDONLY)
+                except OSError:
+                    continue
+
+                name = f"{label} Temperature" if label else f"Temperature #{index}"
+                identifier = f"/{hwmon_name}/{chip}/temperature/{index}"
+                sensors.append((fd, name, parent, identifier))
+
+        with self._lock:
+            old_sensors, self._sensors = self._sensors, sensors
+            self._last_scan = time.monotonic()
+            self._close_all(old_sensors)
+
+    def initialize(self, verbose=True):
+        self._scan()
+        if verbose:
+            if self._sensors:
+                print(f"✅ hwmon sensors detected ({len(self._sensors)} temperature inputs)")
+            else:
+                print("❌ No hwmon temperature sensors found")
+        return self.is_available()
+
+    def is_available(self):
+        return bool(self._sensors)
+
+    def read_sensors(self):
+        if not self._sensors or time.monotonic() - self._last_scan >= self.rescan_interval:
+            self._scan()
+
+        temp_sensors = []
+        needs_rescan = False
+
+        with self._lock:
+            for fd, name, parent, identifier in self._sensors:
+                try:
+                    raw = os.pread(fd, 32, 0)
+                except OSError as e:
+                    if e.errno not in self.SKIPPED_ERRNOS:
+                        needs_rescan = True
+                    continue
+
+                try:
+                    value = int(raw) / 1000.0
+                except ValueError:
+                    continue
+
+                if value == 0:
+                    continue
+
+                temp_sensors.append({
+                    'name': name,
+                    'value': value,
+                    'parent': parent,
+                    'identifier': identifier,
+                })
+
+            if needs_rescan:
+                # A device went away; rediscover on the next poll
+                self._last_scan = 0
+
+        return temp_sensors
+
+    @staticmethod
+    def _close_all(sensors):
+        for fd, _, _, _ in sensors:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def close(self):
+        with self._lock:
+            old_sensors, self._sensors = self._sensors, []
+            self._close_all(old_sensors)
+
+
+class PsutilSensorBackend(SensorBackend):
+    """Fallback backend using psutil.sensors_temperatures()"""
+
+    name = "psutil"
+
+    def __init__(self):
+        self._available = False
+
+    def initialize(self, verbose=True):
+        try:
+            import psutil
+            self._available = hasattr(psutil, "sensors_temperatures") and bool(psutil.sensors_temperatures())
+        except Exception:
+            self._available = False
+
+        if verbose:
+            if self._available:
+                print("✅ psutil temperature sensors detected")
+            else:
+                print("❌ psutil temperature sensors not available")
+        return self._available
+
+    def is_available(self):
+        return self._available
+
+    def read_sensors(self):
+        import psutil
+
+        temp_sensors = []
+        for chip, entries in psutil.sensors_temperatures().items():
+            for index, entry in enumerate(entries, start=1):
+                if not entry.current:
+                    continue
+                name = f"{entry.label} Temperature" if entry.label else f"Temperature #{index}"
+                temp_sensors.append({
+                    'name': name,
+                    'value': float(entry.current),
+                    'parent': chip,
+                    'identifier': f"/psutil/{chip}/temperature/{index}",
+                })
+
+        return temp_sensors
+
+
+def create_default_backend(wmi_module=None):
+    """Pick the sensor backend for the current platform"""
+    if os.name == 'nt' or wmi_module is not None:
+        return WMISensorBackend(wmi_module=wmi_module)
+
+    if glob.glob(os.path.join(LinuxHwmonBackend.HWMON_ROOT, "hwmon*", "temp*_input")):
+        return LinuxHwmonBackend()
+
+    return PsutilSensorBackend()
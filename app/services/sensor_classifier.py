@@ -0,0 +1,78 @@
+import re
+
+STORAGE = "storage"
+GPU = "gpu"
+CPU = "cpu"
+OTHER = "other"
+
+
+class SensorClassifier:
+    """Sensor categorisation with precompiled keyword patterns and a per-sensor result cache.
+
+    Each category's keywords are compiled into one alternation, so checking a
+    category is a single regex search of the sensor name and of the parent
+    name instead of one substring test per keyword. Results are memoised by
+    sensor identity, so repeat polls of the same hardware need no string
+    work at all.
+    """
+
+    # Checked in this order; the first matching category wins
+    CATEGORY_KEYWORDS = {
+        STORAGE: [
+            'hdd', 'ssd', 'disk', 'drive', 'nvme', 'sata',
+            'hard disk', 'solid state', 'samsung', 'crucial',
+            'western digital', 'seagate', 'kingston', 'adata',
+            'sandisk', 'intel ssd', 'toshiba', 'hitachi',
+            'm.2', 'pcie', 'usb', 'external'
+        ],
+        GPU: [
+            'gpu', 'graphics', 'nvidia', 'amd', 'radeon',
+            'geforce', 'rtx', 'gtx', 'vega'
+        ],
+        CPU: [
+            'cpu', 'processor', 'core', 'package',
+            'intel', 'amd', 'ryzen', 'i3', 'i5', 'i7', 'i9',
+            # Linux hwmon chip names of AMD CPUs (Tctl/Tdie sensors)
+            'k10temp', 'zenpower'
+        ],
+    }
+
+    # Storage sensors must be named "...temperature..."; GPU/CPU accept "temp"
+    NAME_MARKERS = {
+        STORAGE: 'temperature',
+        GPU: 'temp',
+        CPU: 'temp',
+    }
+
+    def __init__(self):
+        self._cache = {}
+        # (category, name marker, bound search of its keyword pattern), in priority order
+        self._checks = [
+            (category, self.NAME_MARKERS[category],
+             re.compile("|".join(re.escape(keyword) for keyword in keywords)).search)
+            for category, keywords in self.CATEGORY_KEYWORDS.items()
+        ]
+
+    def classify(self, sensor_name, parent_name, identifier=None):
+        """Return the category of a sensor: storage, gpu, cpu or other"""
+        key = (identifier, sensor_name, parent_name)
+        category = self._cache.get(key)
+        if category is not None:
+            return category
+
+        sensor_lower = (sensor_name or "").lower()
+
+        category = OTHER
+        # Every marker contains "temp"; most non-temperature sensors stop here
+        if "temp" in sensor_lower:
+            parent_lower = (parent_name or "").lower()
+            for candidate, marker, search in self._checks:
+                if marker in sensor_lower and (search(sensor_lower) or search(parent_lower)):
+                    category = candidate
+                    break
+
+        self._cache[key] = category
+        return category
+
+    def clear_cache(self):
+        self._cache.clear()
@@ -1,39 +1,63 @@
 import os
-import time
 import traceback
 import subprocess
 import ctypes
 import psutil
 
+from app.services.sensor_backends import create_default_backend
+from app.services.readiness import SensorReadinessProbe
+from app.services.sensor_classifier import SensorClassifier, STORAGE, GPU, CPU, OTHER
+
 class StorageTemperatureReader:
     """Enhanced temperature reader with priority-based fallback"""
     
-    def __init__(self):
-        self.wmi_available = False
-        self.ohm_available = False
+    def __init__(self, wmi_module=None, backend=None, connect=True):
+        """With connect=False the (slow) WMI connection is left to an explicit initialize_wmi()"""
         self.current_temp_source = "Unknown"
-        self.initialize_wmi()
+        self.backend = backend or create_default_backend(wmi_module=wmi_module)
+        self.classifier = SensorClassifier()
+        self.ohm_process = None
+        self.readiness_probe = None
+        # Category -> sensors seen by the last get_primary_temperature()
+        self.last_sensors = {}
+        if connect:
+            self.initialize_wmi()
+    
+    @property
+    def wmi_available(self):
+        return getattr(self.backend, 'wmi_available', False)
+    
+    @property
+    def ohm_available(self):
+        return getattr(self.backend, 'ohm_available', False)
     
     def initialize_wmi(self):
-        """Initialize WMI connection"""
-        try:
-            import wmi
-            self.wmi_available = True
-            
-            # Test OpenHardwareMonitor
-            try:
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                self.ohm_available = True
-                print("✅ OpenHardwareMonitor detected")
-            except Exception:
-                print("❌ OpenHardwareMonitor not detected")
-                
-        except ImportError:
-            print("❌ WMI not available")
+        """Initialize the sensor backend (WMI/OpenHardwareMonitor on Windows)"""
+        return self.backend.initialize()
+    
+    @property
+    def is_warming_up(self):
+        """True while sensors are still coming up after launch"""
+        return self.readiness_probe is not None and self.readiness_probe.is_warming_up
+    
+    def start_readiness_probe(self, on_ready=None, on_failed=None):
+        """Wait for sensors in the background; returns the running probe"""
+        self.readiness_probe = SensorReadinessProbe(
+            self,
+            process=self.ohm_process,
+            on_ready=on_ready,
+            on_failed=on_failed
+        )
+        return self.readiness_probe.start()
     
     def run_openhardware_monitor(self):
-        """Run OpenHardwareMonitor.exe"""
+        """
+        Launch OpenHardwareMonitor.exe without waiting for it.
+        Use start_readiness_probe() to find out when sensors are readable.
+        """
+        if not self.backend.requires_openhardware_monitor:
+            return True
+        
         print("\n" + "="*60)
         print("STARTING OPENHARDWAREMONITOR")
         print("="*60)
@@ -72,32 +96,18 @@ class StorageTemperatureReader:
                 is_admin = ctypes.windll.shell32.IsUserAnAdmin()
                 
                 if is_admin:
-                    process = subprocess.Popen(
+                    # Keep the handle so the readiness probe can track the PID
+                    self.ohm_process = subprocess.Popen(
                         [found_path],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         creationflags=subprocess.CREATE_NO_WINDOW
                     )
-                    print(f"✅ Process started: {process.pid}")
+                    print(f"✅ Process started: {self.ohm_process.pid}")
                 else:
                     os.startfile(found_path)
                     print("✅ Started OpenHardwareMonitor")
                 
-                # Wait for startup
-                time.sleep(5)
-                
-                # Verify running
-                for _ in range(10):
-                    for proc in psutil.process_iter(['name']):
-                        try:
-                            if proc.info['name'] and 'OpenHardwareMonitor' in proc.info['name']:
-                                print("✅ OpenHardwareMonitor is now running")
-                                return True
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue
-                    time.sleep(1)
-                
-                print("⚠️ OpenHardwareMonitor may have started")
                 return True
                     
             except Exception as e:
@@ -109,91 +119,24 @@ class StorageTemperatureReader:
             return False
     
     def _get_all_temperature_sensors(self):
-        """Get all temperature sensors from OpenHardwareMonitor"""
-        if not self.ohm_available:
+        """Get all temperature sensors from the active backend"""
+        if not self.backend.is_available():
             return []
         
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-            sensors = w.Sensor()
-            
-            temp_sensors = []
-            for sensor in sensors:
-                if (sensor.SensorType == "Temperature" and 
-                    sensor.Value is not None and 
-                    sensor.Value != 0):
-                    
-                    sensor_data = {
-                        'name': sensor.Name if hasattr(sensor, 'Name') else "Unknown",
-                        'value': float(sensor.Value),
-                        'parent': sensor.Parent if hasattr(sensor, 'Parent') else "Unknown",
-                        'identifier': sensor.Identifier if hasattr(sensor, 'Identifier') else "Unknown",
-                    }
-                    temp_sensors.append(sensor_data)
-            
-            return temp_sensors
+            return self.backend.read_sensors()
             
         except Exception as e:
             print(f"❌ Error reading sensors: {e}")
             return []
     
-    def _is_storage_sensor(self, sensor_name, parent_name):
-        """Check if sensor belongs to storage"""
-        storage_keywords = [
-            'hdd', 'ssd', 'disk', 'drive', 'nvme', 'sata', 
-            'hard disk', 'solid state', 'samsung', 'crucial',
-            'western digital', 'seagate', 'kingston', 'adata',
-            'sandisk', 'intel ssd', 'toshiba', 'hitachi',
-            'm.2', 'pcie', 'usb', 'external'
-        ]
-        
-        sensor_lower = sensor_name.lower()
-        parent_lower = parent_name.lower() if parent_name else ""
-        
-        if "temperature" in sensor_lower:
-            if any(keyword in parent_lower for keyword in storage_keywords):
-                return True
-            if any(keyword in sensor_lower for keyword in storage_keywords):
-                return True
-        
-        return False
-    
-    def _is_gpu_sensor(self, sensor_name, parent_name):
-        """Check if sensor belongs to GPU"""
-        gpu_keywords = [
-            'gpu', 'graphics', 'nvidia', 'amd', 'radeon',
-            'geforce', 'rtx', 'gtx', 'radeon', 'vega'
-        ]
-        
-        sensor_lower = sensor_name.lower()
-        parent_lower = parent_name.lower() if parent_name else ""
-        
-        if "temperature" in sensor_lower or "temp" in sensor_lower:
-            if any(keyword in parent_lower for keyword in gpu_keywords):
-                return True
-            if any(keyword in sensor_lower for keyword in gpu_keywords):
-                return True
-        
-        return False
-    
-    def _is_cpu_sensor(self, sensor_name, parent_name):
-        """Check if sensor belongs to CPU"""
-        cpu_keywords = [
-            'cpu', 'processor', 'core', 'package',
-            'intel', 'amd', 'ryzen', 'i3', 'i5', 'i7', 'i9'
-        ]
-        
-        sensor_lower = sensor_name.lower()
-        parent_lower = parent_name.lower() if parent_name else ""
-        
-        if "temperature" in sensor_lower or "temp" in sensor_lower:
-            if any(keyword in parent_lower for keyword in cpu_keywords):
-                return True
-            if any(keyword in sensor_lower for keyword in cpu_keywords):
-                return True
-        
-        return False
+    def _categorize_sensors(self, temp_sensors):
+        """Group sensors by category in a single classification pass"""
+        categories = {STORAGE: [], GPU: [], CPU: [], OTHER: []}
+        for sensor in temp_sensors:
+            category = self.classifier.classify(sensor['name'], sensor['parent'], sensor['identifier'])
+            categories[category].append(sensor)
+        return categories
     
     def get_primary_temperature(self):
         """
@@ -206,14 +149,18 @@ class StorageTemperatureReader:
         temp_sensors = self._get_all_temperature_sensors()
         
         if not temp_sensors:
-            self.current_temp_source = "No sensors found"
+            self.last_sensors = {}
+            if self.is_warming_up:
+                self.current_temp_source = "Sensors warming up"
+            else:
+                self.current_temp_source = "No sensors found"
             return None
         
+        categories = self._categorize_sensors(temp_sensors)
+        self.last_sensors = categories
+        
         # Priority 1: Storage temperatures
-        storage_temps = []
-        for sensor in temp_sensors:
-            if self._is_storage_sensor(sensor['name'], sensor['parent']):
-                storage_temps.append(sensor)
+        storage_temps = categories[STORAGE]
         
         if storage_temps:
             avg_temp = sum(s['value'] for s in storage_temps) / len(storage_temps)
@@ -223,10 +170,7 @@ class StorageTemperatureReader:
             return adjusted_temp
         
         # Priority 2: GPU temperatures
-        gpu_temps = []
-        for sensor in temp_sensors:
-            if self._is_gpu_sensor(sensor['name'], sensor['parent']):
-                gpu_temps.append(sensor)
+        gpu_temps = categories[GPU]
         
         if gpu_temps:
             avg_temp = sum(s['value'] for s in gpu_temps) / len(gpu_temps)
@@ -236,10 +180,7 @@ class StorageTemperatureReader:
             return adjusted_temp
         
         # Priority 3: CPU temperatures
-        cpu_temps = []
-        for sensor in temp_sensors:
-            if self._is_cpu_sensor(sensor['name'], sensor['parent']):
-                cpu_temps.append(sensor)
+        cpu_temps = categories[CPU]
         
         if cpu_temps:
             # Try CPU package first
@@ -277,20 +218,11 @@ class StorageTemperatureReader:
         info_lines = ["=== AVAILABLE TEMPERATURE SENSORS ==="]
         
         # Categorize sensors
-        storage_sensors = []
-        gpu_sensors = []
-        cpu_sensors = []
-        other_sensors = []
-        
-        for sensor in temp_sensors:
-            if self._is_storage_sensor(sensor['name'], sensor['parent']):
-                storage_sensors.append(sensor)
-            elif self._is_gpu_sensor(sensor['name'], sensor['parent']):
-                gpu_sensors.append(sensor)
-            elif self._is_cpu_sensor(sensor['name'], sensor['parent']):
-                cpu_sensors.append(sensor)
-            else:
-                other_sensors.append(sensor)
+        categories = self._categorize_sensors(temp_sensors)
+        storage_sensors = categories[STORAGE]
+        gpu_sensors = categories[GPU]
+        cpu_sensors = categories[CPU]
+        other_sensors = categories[OTHER]
         
         info_lines.append(f"\n📊 STORAGE Sensors ({len(storage_sensors)}):")
         for sensor in storage_sensors:
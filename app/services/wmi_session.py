@@ -0,0 +1,131 @@
+import threading
+import time
+
+
+class _ThreadSession:
+    """Connection and cached sensor handles owned by one thread"""
+
+    def __init__(self):
+        self.connection = None
+        self.sensor_handles = None
+        self.topology = ()
+        self.last_topology_check = 0
+
+
+class OpenHardwareMonitorSession:
+    """Long-lived WMI connection to OpenHardwareMonitor with a cached sensor list.
+
+    The connection and the enumerated temperature sensor handles are kept
+    between polls. Each poll only refreshes the cached handles; the sensor
+    list is re-enumerated when a refresh fails or when the periodic topology
+    check finds that sensors were added or removed.
+
+    COM objects belong to the thread that created them, so every thread
+    that reads sensors (monitor loop, report scheduler, readiness probe,
+    Tk) gets its own COM initialisation, connection and handles.
+    """
+
+    NAMESPACE = "root\\OpenHardwareMonitor"
+
+    def __init__(self, wmi_module=None, topology_check_interval=60):
+        # wmi_module can be injected (e.g. a fake module on Linux)
+        self._wmi_module = wmi_module
+        self.topology_check_interval = topology_check_interval
+        self._local = threading.local()
+
+    def load_wmi(self):
+        """Import the wmi module on first use"""
+        if self._wmi_module is None:
+            import wmi
+            self._wmi_module = wmi
+        return self._wmi_module
+
+    def _thread_session(self):
+        """This thread's session, initialising COM for the thread on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            try:
+                import pythoncom
+                pythoncom.CoInitialize()
+            except ImportError:
+                # No pywin32 (fake wmi module); nothing to initialise
+                pass
+            session = self._local.session = _ThreadSession()
+        return session
+
+    @property
+    def is_connected(self):
+        return self._thread_session().connection is not None
+
+    def connect(self):
+        """Open (or reopen) this thread's WMI connection and enumerate sensors"""
+        wmi = self.load_wmi()
+        session = self._thread_session()
+        session.connection = wmi.WMI(namespace=self.NAMESPACE)
+        self._enumerate_sensors(session)
+        return session.connection
+
+    def reset(self):
+        """Drop this thread's connection and cached handles; its next poll reconnects"""
+        self._local.session = _ThreadSession()
+
+    def _enumerate_sensors(self, session):
+        """Enumerate temperature sensors and cache their handles"""
+        sensors = session.connection.Sensor(SensorType="Temperature")
+        session.sensor_handles = list(sensors)
+        session.topology = self._topology_key(session.sensor_handles)
+        session.last_topology_check = time.monotonic()
+
+    @staticmethod
+    def _topology_key(sensors):
+        """Identifiers of the current sensor set, used to detect hardware changes"""
+        return tuple(sorted(str(getattr(sensor, 'Identifier', '')) for sensor in sensors))
+
+    def _check_topology(self, session):
+        """Re-enumerate sensors if the hardware topology may have changed"""
+        if time.monotonic() - session.last_topology_check < self.topology_check_interval:
+            return
+
+        previous = session.topology
+        self._enumerate_sensors(session)
+        if session.topology != previous:
+            print(f"🔄 Sensor topology changed ({len(session.sensor_handles)} temperature sensors)")
+
+    @staticmethod
+    def _refresh_handle(sensor):
+        """Refresh the property values of a cached WMI object in place"""
+        refresh = getattr(sensor, 'Refresh_', None)
+        if refresh is not None:
+            refresh()
+
+    @staticmethod
+    def current_value(sensor):
+        """Value of a refreshed handle.
+
+        The wmi wrapper caches each property the first time it is read and
+        never drops it, so sensor.Value would stay frozen; read the refreshed
+        COM object instead.
+        """
+        ole_object = getattr(sensor, 'ole_object', None)
+        if ole_object is None:
+            return sensor.Value
+        return ole_object.Properties_('Value').Value
+
+    def get_sensor_handles(self):
+        """Return refreshed temperature sensor handles, reconnecting on failure"""
+        session = self._thread_session()
+        try:
+            if session.connection is None or session.sensor_handles is None:
+                self.connect()
+            else:
+                self._check_topology(session)
+
+            for sensor in session.sensor_handles:
+                self._refresh_handle(sensor)
+            return session.sensor_handles
+
+        except Exception:
+            # Stale connection or a sensor disappeared: reconnect once
+            self.reset()
+            self.connect()
+            return self._thread_session().sensor_handles
@@ -2,16 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import time
-import psutil
-import winsound
-from plyer import notification
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
 import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import json
 import os
 
@@ -19,10 +10,20 @@ from app.ui.responsive_bg import ResponsiveGradientBackground
 from app.core.responsive import ResponsiveDesign
 from app.core.theme import ThemeManager
 from app.core.logger import LogManager
-from app.ui.live_log import LiveLogWindow
+from app.core.writer_lock import WriterLock
+from app.core.history import TemperatureHistory
+from app.ui.render_scheduler import RenderScheduler
 from app.services.storage_reader import StorageTemperatureReader
+from app.config.settings import EMAIL_CONFIG, SETTINGS_FILE, read_settings
+from app.collector import DEFAULT_COLLECTOR_INTERVAL, running_collector_pid
+from app.ui.toast import Toast
 
 class TemperatureMonitor:
+    # Startup is staged: the window and the first reading come first; the
+    # graph (matplotlib), alerting (smtplib, email) and the report scheduler
+    # load right after the first reading is shown, or after this many ms
+    STARTUP_DEFER_MS = 1500
+    
     def __init__(self, root):
         """Initialize the Temperature Monitor application."""
         self.root = root
@@ -36,23 +37,34 @@ class TemperatureMonitor:
         self.colors = self.theme_manager.get_theme()
         
         # Monitoring state
+        self.startup_complete = False
         self.is_monitoring = True
         self.alert_monitoring_active = True
         self.monitor_thread = None
         self.email_thread = None
-        
-        # Alert tracking
-        self.last_warning_alert = 0
-        self.last_critical_alert = 0
-        self.warning_cooldown = 3600  # 1 hour cooldown for alerts
+        self.test_email_thread = None
+        
+        # Alert rules: the Warning/Critical thresholds plus any extra rules
+        # from the settings file; each rule repeats hourly while it fires
+        self.alert_hysteresis = 0.5
+        self.alert_rules = []
+        
+        # Only the holder of the writer lock samples, logs and sends alerts;
+        # with a collector or another window holding it, this window only
+        # views the data that process writes
+        self.writer_lock = WriterLock(LogManager.DAILY_LOGS_DIR)
+        self.viewer_mode = not self.writer_lock.acquire()
+        self.collector_pid = running_collector_pid(LogManager.DAILY_LOGS_DIR) if self.viewer_mode else None
+        if self.viewer_mode:
+            self.root.title("Enhanced Temperature Monitor (viewer)")
         
         # Temperature thresholds (using adjusted temperatures)
         self.critical_temp = 30
         self.warning_temp = 25
         
-        # Temperature history (stores adjusted temperatures)
-        self.temp_history = deque(maxlen=100)
-        self.time_history = deque(maxlen=100)
+        # Temperature history (stores adjusted temperatures); one hour by
+        # default, preallocated once for the sample interval
+        self.history_retention = 3600
         
         # For statistics (based on adjusted temperatures)
         self.min_temp = float('inf')
@@ -65,38 +77,73 @@ class TemperatureMonitor:
         # Example: If CPU shows 45°C but room is 22°C, set this to 23.0
         self.temperature_adjustment = 20.0  # Adjust this value as needed
         
-        # Initialize components
-        self.temp_reader = StorageTemperatureReader()
+        # Dashboard redraws are capped at this many frames per second
+        self.max_fps = 4
+        
+        # OpenMetrics endpoint on http://metrics_host:metrics_port/metrics (off without a port)
+        self.metrics_port = None
+        self.metrics_host = "127.0.0.1"
         
-        # Email configuration
-        self.email_config = {
-            'smtp_server': 'smtp.gmail.com',
-            'smtp_port': 587,
-            'sender_email': 'nxpisian@gmail.com',
-            'sender_password': 'aqkz uykr cmfu oqbm',
-            'receiver_email': 'kyosxel@gmail.com'
-        }
+        # Initialize components; the sensor backend connects on the monitor thread
+        self.temp_reader = StorageTemperatureReader(connect=False)
         
-        self.log_manager = LogManager()
+        # Email configuration (see app/config/settings.py)
+        self.email_config = dict(EMAIL_CONFIG)
+        
+        self.log_manager = LogManager(read_only=self.viewer_mode)
+        
+        # Created by finish_startup()
+        self.alerts = None
+        self.metrics = None
+        self.fig = None
+        self.live_graph = None
         
         # Create background and setup UI
         self.setup_background()
         self.setup_modern_styles()
         self.load_settings()
+        self.render_scheduler = RenderScheduler(self.root, self.update_display, self.max_fps)
         self.setup_ui()
         
-        # Start OpenHardwareMonitor
-        self.start_openhardware_monitor()
+        # A viewer receives samples at the writer's rate, not at this window's
+        sample_interval = DEFAULT_COLLECTOR_INTERVAL if self.viewer_mode else self.refresh_interval()
+        self.history = TemperatureHistory.for_retention(self.history_retention, sample_interval)
+        
+        if self.collector_pid is not None:
+            print(f"👀 Collector is running (PID {self.collector_pid}); showing its data")
+        elif self.viewer_mode:
+            print("👀 Another monitor window is writing the logs; showing its data")
         
-        # Start monitoring
+        # Start monitoring; OpenHardwareMonitor is launched from the monitor thread
         self.start_realtime_updates()
-        self.start_email_scheduler()
+        self.root.after(self.STARTUP_DEFER_MS, self.finish_startup)
         
         # Initial log
         self.log_manager.log_system_event("System Start", "Temperature Monitor initialized")
         self.log_manager.log_system_event("Temperature Adjustment", 
                                          f"Adjustment value: -{self.temperature_adjustment}°C")
     
+    def finish_startup(self):
+        """Second startup stage: graph, alerting and the email scheduler."""
+        if self.startup_complete:
+            return
+        self.startup_complete = True
+        started = time.perf_counter()
+        
+        self.setup_graph()
+        
+        if not self.viewer_mode:
+            # Alert rules, email and log sinks; the window adds desktop and sound
+            from app.services.alerting import AlertService
+            alerts = AlertService(self.log_manager, self.email_config)
+            self.setup_alert_sinks(alerts)
+            self.alerts = alerts
+            self.configure_alerts()
+            self.start_email_scheduler()
+            self.start_metrics()
+        
+        print(f"✅ Graph and alerting loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+    
     def apply_temperature_adjustment(self, raw_temp):
         if raw_temp is None:
             return None
@@ -107,24 +154,43 @@ class TemperatureMonitor:
         return adjusted_temp
     
     def start_openhardware_monitor(self):
-        """Start OpenHardwareMonitor for temperature reading."""
+        """Start OpenHardwareMonitor and wait for sensors in the background (monitor thread)."""
+        backend = self.temp_reader.backend
+        if not backend.requires_openhardware_monitor:
+            # hwmon and psutil are readable as soon as the backend is initialized
+            if backend.is_available():
+                self.root.after(0, self.on_sensors_ready)
+            return
+        
         print("🚀 Initializing OHM...")
         success = self.temp_reader.run_openhardware_monitor()
         
         if success:
-            print("✅ OpenHardwareMonitor is ready")
-            time.sleep(3)
-            self.temp_reader.initialize_wmi()
-        else:
-            print("⚠️ Could not start OpenHardwareMonitor")
-            messagebox.showwarning(
-                "OpenHardwareMonitor Warning",
-                "OpenHardwareMonitor could not be started automatically.\n\n"
-                "Please ensure:\n"
-                "1. OpenHardwareMonitor.exe is in the same directory\n"
-                "2. Run it manually as Administrator\n\n"
-                "Download from: https://openhardwaremonitor.org/"
+            # Sensors come up asynchronously; the UI shows "warming up" meanwhile
+            self.temp_reader.start_readiness_probe(
+                on_ready=lambda probe: self.root.after(0, self.on_sensors_ready),
+                on_failed=lambda probe: self.root.after(0, self.on_sensors_failed, probe.failure_reason)
             )
+        else:
+            self.root.after(0, self.on_sensors_failed, "OpenHardwareMonitor.exe could not be launched")
+    
+    def on_sensors_ready(self):
+        """Called on the Tk thread once sensors are readable."""
+        print(f"✅ Sensors ready ({self.temp_reader.backend.name})")
+        self.log_manager.log_system_event("Sensors Ready", self.temp_reader.backend.name)
+    
+    def on_sensors_failed(self, reason):
+        """Called on the Tk thread when sensors did not come up."""
+        print("⚠️ Could not start OpenHardwareMonitor")
+        self.log_manager.log_system_event("Sensor Startup", f"Failed: {reason}")
+        messagebox.showwarning(
+            "OpenHardwareMonitor Warning",
+            "OpenHardwareMonitor could not be started automatically.\n\n"
+            "Please ensure:\n"
+            "1. OpenHardwareMonitor.exe is in the same directory\n"
+            "2. Run it manually as Administrator\n\n"
+            "Download from: https://openhardwaremonitor.org/"
+        )
     
     def setup_background(self):
         """Setup the responsive gradient background."""
@@ -209,12 +275,13 @@ class TemperatureMonitor:
     def update_theme(self):
         """Update the entire UI with new theme colors."""
         self.responsive_bg.update_theme(self.colors)
-        self.update_graph_theme()
         self.setup_modern_styles()
         self.setup_ui()
     
     def update_graph_theme(self):
         """Update matplotlib graph with current theme colors."""
+        import matplotlib.pyplot as plt
+        
         plt.rcParams['axes.facecolor'] = self.colors['card_bg']
         plt.rcParams['figure.facecolor'] = self.colors['card_bg']
         plt.rcParams['axes.edgecolor'] = self.colors['border']
@@ -223,20 +290,22 @@ class TemperatureMonitor:
         plt.rcParams['xtick.color'] = self.colors['text_secondary']
         plt.rcParams['ytick.color'] = self.colors['text_secondary']
         plt.rcParams['font.size'] = 9
-        
-        if hasattr(self, 'canvas'):
-            self.update_graph()
     
     def load_settings(self):
         """Load settings from JSON configuration file."""
         try:
-            if os.path.exists('temperature_monitor_settings.json'):
-                with open('temperature_monitor_settings.json', 'r') as f:
-                    settings = json.load(f)
-                    self.critical_temp = settings.get('critical_temp', 30)
-                    self.warning_temp = settings.get('warning_temp', 25)
-                    # Load temperature adjustment if it exists
-                    self.temperature_adjustment = settings.get('temperature_adjustment', 23.0)
+            settings = read_settings()
+            if settings is not None:
+                self.critical_temp = settings.get('critical_temp', 30)
+                self.warning_temp = settings.get('warning_temp', 25)
+                # Load temperature adjustment if it exists
+                self.temperature_adjustment = settings.get('temperature_adjustment', 23.0)
+                self.alert_hysteresis = settings.get('alert_hysteresis', self.alert_hysteresis)
+                self.alert_rules = settings.get('alert_rules', self.alert_rules)
+                self.max_fps = settings.get('max_fps', self.max_fps)
+                self.history_retention = settings.get('history_retention_seconds', self.history_retention)
+                self.metrics_port = settings.get('metrics_port', self.metrics_port)
+                self.metrics_host = settings.get('metrics_host', self.metrics_host)
         except Exception as e:
             print(f"Error loading settings: {e}")
     
@@ -246,9 +315,15 @@ class TemperatureMonitor:
             settings = {
                 'critical_temp': self.critical_temp,
                 'warning_temp': self.warning_temp,
-                'temperature_adjustment': self.temperature_adjustment
+                'temperature_adjustment': self.temperature_adjustment,
+                'alert_hysteresis': self.alert_hysteresis,
+                'alert_rules': self.alert_rules,
+                'max_fps': self.max_fps,
+                'history_retention_seconds': self.history_retention,
+                'metrics_port': self.metrics_port,
+                'metrics_host': self.metrics_host
             }
-            with open('temperature_monitor_settings.json', 'w') as f:
+            with open(SETTINGS_FILE, 'w') as f:
                 json.dump(settings, f, indent=4)
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -384,13 +459,15 @@ class TemperatureMonitor:
         graph_frame.columnconfigure(0, weight=1)
         graph_frame.rowconfigure(0, weight=1)
         
-        # Create matplotlib figure
-        self.update_graph_theme()
-        
-        self.fig, self.ax = plt.subplots(figsize=(10, 6))
-        self.fig.tight_layout(pad=4.0)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+        # The matplotlib figure is created by setup_graph() once startup completes
+        self.graph_frame = graph_frame
+        if self.startup_complete:
+            self.setup_graph()
+        else:
+            ttk.Label(graph_frame, text="Loading graph...",
+                     background=self.colors['card_bg'],
+                     foreground=self.colors['text_secondary'],
+                     font=("Segoe UI", 10)).grid(row=0, column=0)
         
         # Right column - Controls and Settings
         right_column = ttk.Frame(content_frame, style='Modern.TFrame')
@@ -475,10 +552,10 @@ class TemperatureMonitor:
                                   style='Secondary.TButton')
         sensor_button.grid(row=0, column=0, sticky='ew', padx=(0, 5))
         
-        email_button = ttk.Button(utils_row1, text="Test Email", 
-                                 command=self.send_test_email, 
-                                 style='Secondary.TButton')
-        email_button.grid(row=0, column=1, sticky='ew', padx=(5, 0))
+        self.test_email_button = ttk.Button(utils_row1, text="Test Email", 
+                                           command=self.send_test_email, 
+                                           style='Secondary.TButton')
+        self.test_email_button.grid(row=0, column=1, sticky='ew', padx=(5, 0))
         
         # Temperature Settings
         settings_frame = ttk.LabelFrame(right_column, text="TEMPERATURE SETTINGS", 
@@ -558,17 +635,47 @@ class TemperatureMonitor:
         
         self.root.update_idletasks()
     
+    def setup_graph(self):
+        """Create the matplotlib graph in graph_frame; matplotlib is imported here, on first use."""
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from app.ui.live_graph import LiveTemperatureGraph
+        
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
+        self.update_graph_theme()
+        
+        if self.fig is not None:
+            plt.close(self.fig)
+        self.fig, self.ax = plt.subplots(figsize=(10, 6))
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+        self.live_graph = LiveTemperatureGraph(self.fig, self.ax, self.canvas, self.colors,
+                                               self.temperature_adjustment,
+                                               self.warning_temp, self.critical_temp)
+        self.update_graph()
+    
     def show_live_log(self):
         """Show the Live Log window."""
+        from app.ui.live_log import LiveLogWindow
+        
         LiveLogWindow(self.root, self.log_manager, self.theme_manager, self.responsive_design)
     
     def start_realtime_updates(self):
         """Start real-time temperature updates in a separate thread."""
         self.is_monitoring = True
         self.update_time_display()
-        self.monitor_thread = threading.Thread(target=self.monitor_temperature, daemon=True)
+        target = self.view_collector_samples if self.viewer_mode else self.monitor_temperature
+        self.monitor_thread = threading.Thread(target=target, name="Monitor", daemon=True)
         self.monitor_thread.start()
     
+    def refresh_interval(self):
+        """Seconds between samples, from the Update Interval box (at least 1)."""
+        try:
+            return max(1, float(self.refresh_rate_var.get()))
+        except (ValueError, tk.TclError):
+            return 2
+    
     def start_email_scheduler(self):
         """Start the email scheduler in a separate thread."""
         self.email_thread = threading.Thread(target=self.email_scheduler, daemon=True)
@@ -597,11 +704,18 @@ class TemperatureMonitor:
         """
         Main monitoring loop for temperature reading.
         """
+        # Connecting to WMI and launching OpenHardwareMonitor happen here,
+        # not in __init__, so the window is up while they run
+        self.temp_reader.initialize_wmi()
+        self.start_openhardware_monitor()
+        
         while self.is_monitoring:
             try:
                 # Get raw temperature from hardware sensors
+                started = time.perf_counter()
                 raw_temp = self.temp_reader.get_primary_temperature()
                 temp_source = self.temp_reader.get_temperature_source()
+                read_seconds = time.perf_counter() - started
                 
                 if raw_temp is not None:
                     # APPLY TEMPERATURE ADJUSTMENT HERE
@@ -614,161 +728,143 @@ class TemperatureMonitor:
                     if adjusted_temp > self.max_temp:
                         self.max_temp = adjusted_temp
                     
-                    # Update display with adjusted temperature
-                    self.root.after(0, self.update_display, adjusted_temp, temp_source)
-                    
                     # Update history with adjusted temperature
-                    self.temp_history.append(adjusted_temp)
-                    self.time_history.append(time.time())
+                    self.history.append(time.time(), adjusted_temp)
                     
-                    # Log adjusted temperature
+                    # Mark the display dirty; the render scheduler redraws it
+                    self.render_scheduler.submit(adjusted_temp, temp_source)
+                    
+                    # Log adjusted temperature; alert lines come from the log sink
                     status = self.get_temperature_status(adjusted_temp)
-                    is_alert = status in ["Warning", "Critical"]
                     
                     self.log_manager.log_temperature(
                         temp=adjusted_temp,
                         source=temp_source,
-                        status=status,
-                        is_alert=is_alert
+                        status=status
                     )
                     
-                    # Handle alerts with adjusted temperature
-                    if self.alert_monitoring_active:
-                        self.handle_temperature_alert(adjusted_temp, temp_source, status)
+                    # Handle alerts with adjusted temperature (once alerting has loaded)
+                    if self.alert_monitoring_active and self.alerts is not None:
+                        self.alerts.evaluate(adjusted_temp, temp_source)
+                
+                elif self.temp_reader.is_warming_up:
+                    # OpenHardwareMonitor is still starting up
+                    self.render_scheduler.submit(None, temp_source)
                 
                 else:
                     # No temperature data
-                    self.root.after(0, self.update_display, None, "No sensor data")
+                    self.render_scheduler.submit(None, "No sensor data")
                     self.log_manager.log_system_event("Sensor Error", "No temperature data available")
                 
-                # Get refresh rate
-                try:
-                    refresh_delay = max(1, float(self.refresh_rate_var.get()))
-                except:
-                    refresh_delay = 2
+                self.record_metrics(started, read_seconds, self.apply_temperature_adjustment(raw_temp), temp_source)
                 
-                time.sleep(refresh_delay)
+                time.sleep(self.refresh_interval())
             
             except Exception as e:
                 print(f"Monitoring error: {e}")
                 self.log_manager.log_system_event("Monitoring Error", str(e))
                 time.sleep(5)
     
-    def handle_temperature_alert(self, adjusted_temp, source, status):
-        """Handle temperature alerts with 1-hour cooldown."""
-        current_time = time.time()
-        
-        if status == "Critical":
-            if current_time - self.last_critical_alert > self.warning_cooldown:
-                # Send desktop notification
-                self.root.after(0, self.send_desktop_notification,
-                              "🔥 CRITICAL TEMPERATURE ALERT!",
-                              f"Temperature: {adjusted_temp:.1f}°C\nSource: {source}",
-                              adjusted_temp)
-                
-                if self.log_manager.should_send_alert_email("CRITICAL", adjusted_temp):
-                    self.send_alert_email("CRITICAL", adjusted_temp, source)
+    def view_collector_samples(self):
+        """Viewer mode: follow the samples the collector writes instead of reading sensors."""
+        store = self.log_manager.sample_store
+        day = None
+        next_record = 0
+        
+        while self.is_monitoring:
+            try:
+                today = datetime.date.today()
+                if today != day:
+                    # Start with up to one history's worth of today's samples
+                    day = today
+                    next_record = max(0, store.record_count(day) - self.history.capacity)
                 
-                self.last_critical_alert = current_time
-        
-        elif status == "Warning":
-            if current_time - self.last_warning_alert > self.warning_cooldown:
-                # Send desktop notification
-                self.root.after(0, self.send_desktop_notification,
-                              "⚠️ HIGH TEMPERATURE WARNING",
-                              f"Temperature: {adjusted_temp:.1f}°C\nSource: {source}",
-                              adjusted_temp)
+                samples = store.read_new(day, next_record)
+                next_record += len(samples)
+                for epoch, temp, status, source_id in samples:
+                    self.history.append(epoch, temp)
+                    self.min_temp = min(self.min_temp, temp)
+                    self.max_temp = max(self.max_temp, temp)
                 
-                if self.log_manager.should_send_alert_email("WARNING", adjusted_temp):
-                    self.send_alert_email("WARNING", adjusted_temp, source)
+                if samples:
+                    epoch, temp, status, source_id = samples[-1]
+                    if source_id not in store.source_names():
+                        store.reload_sources()
+                    self.render_scheduler.submit(temp, store.source_names().get(source_id, "Collector"))
                 
-                self.last_warning_alert = current_time
-    
-    def send_desktop_notification(self, title, message, temp):
-        """Send system desktop notification using plyer."""
-        try:
-            notification.notify(
-                title=title,
-                message=message,
-                timeout=10,
-                app_name="Temperature Monitor"
-            )
-            print(f"Desktop notification sent: {title}")
+                time.sleep(self.refresh_interval())
             
-        except Exception as e:
-            print(f"Error sending desktop notification: {e}")
+            except Exception as e:
+                print(f"Viewer error: {e}")
+                time.sleep(5)
+    
+    def start_metrics(self):
+        """Serve metrics if 'metrics_port' is set in the settings file."""
+        if not self.metrics_port:
+            return
+        from app.services.metrics import MetricsExporter
         
-        # Play sound alert
         try:
-            winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
-        except:
-            pass
+            self.metrics = MetricsExporter(self.metrics_port, self.metrics_host)
+        except OSError as e:
+            print(f"❌ Could not start metrics endpoint: {e}")
+            self.log_manager.log_system_event("Metrics Error", f"Port {self.metrics_port}: {e}")
     
-    def send_alert_email(self, alert_type, adjusted_temp, source):
-        """Send alert email for critical/warning temperatures."""
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_config['sender_email']
-            msg['To'] = self.email_config['receiver_email']
-            
-            if alert_type == "CRITICAL":
-                msg['Subject'] = f"🚨 CRITICAL Temperature Alert - {adjusted_temp:.1f}°C"
-                color = "🔴"
-                urgency = "IMMEDIATE ACTION REQUIRED"
-            else:
-                msg['Subject'] = f"⚠️ Warning Temperature Alert - {adjusted_temp:.1f}°C"
-                color = "🟡"
-                urgency = "Monitor Closely"
-            
-            # Build email body
-            body = f"""
-{color} TEMPERATURE ALERT
-=====================================
-
-Alert Type: {alert_type} {color}
-Temperature: {adjusted_temp:.1f}°C
-Source: SERVER ROOM
-Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-Urgency: {urgency}
-
-Current Thresholds:
-• Warning: {self.warning_temp}°C
-• Critical: {self.critical_temp}°C
-
-Recommended Actions:
-1. Check cooling system
-2. Ensure proper ventilation
-3. Monitor temperature trends
-4. Consider reducing system load
-
-This is an automated alert from the Temperature Monitoring System.
-The system will continue to monitor and send updates every hour if the issue persists.
-
-Device: {os.environ.get('COMPUTERNAME', 'Unknown Device')}
-"""
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['sender_email'], self.email_config['sender_password'])
-            server.send_message(msg)
-            server.quit()
-            
-            print(f"✅ {alert_type} alert email sent")
-            self.log_manager.log_system_event(f"{alert_type} Alert Email", f"Sent for {adjusted_temp:.1f}°C")
-            
-            return True
+    def record_metrics(self, started, read_seconds, adjusted_temp, source):
+        """Time this sample and render a new metrics snapshot (monitor thread)."""
+        if self.metrics is None:
+            return
+        self.metrics.observe("read", read_seconds)
+        self.metrics.observe("total", time.perf_counter() - started)
+        self.metrics.update(adjusted_temp, source, self.get_temperature_status(adjusted_temp),
+                            self.temp_reader.last_sensors, self.alerts)
+    
+    def setup_alert_sinks(self, alerts):
+        """Add the desktop and sound notifiers; deadlines drop alerts too stale to be useful."""
+        alerts.event_bus.subscribe("desktop", self.send_desktop_notification,
+                                   topics=["alert", "recovery"], deadline=60)
+        alerts.event_bus.subscribe("sound", self.play_alert_sound, topics=["alert"], deadline=5)
+    
+    def configure_alerts(self):
+        """Compile the alert rules from the current thresholds and settings."""
+        if self.alerts is not None:
+            self.alerts.configure(self.warning_temp, self.critical_temp,
+                                  self.alert_hysteresis, self.alert_rules)
+    
+    def send_desktop_notification(self, event):
+        """Desktop sink: system notification using plyer."""
+        from plyer import notification
+        
+        if event.topic == "recovery":
+            title = "✅ TEMPERATURE BACK TO NORMAL"
+        elif event.data['level'] == "CRITICAL":
+            title = "🔥 CRITICAL TEMPERATURE ALERT!"
+        else:
+            title = "⚠️ HIGH TEMPERATURE WARNING"
+        
+        notification.notify(
+            title=title,
+            message=(f"{self.alerts.alert_status(event)}\n"
+                     f"Temperature: {event.data['temp']:.1f}°C\nSource: {event.data['source']}"),
+            timeout=10,
+            app_name="Temperature Monitor"
+        )
+        print(f"Desktop notification sent: {title}")
+    
+    def play_alert_sound(self, event):
+        """Sound sink."""
+        import winsound
         
-        except Exception as e:
-            print(f"❌ Error sending alert email: {e}")
-            self.log_manager.log_system_event("Email Error", f"Failed to send {alert_type} alert: {e}")
-            return False
+        winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
     
     def send_test_email(self):
-        """Send a harmless test email to verify email functionality."""
+        """Send a harmless test email in the background; the result is shown as a toast."""
+        if self.test_email_thread is not None and self.test_email_thread.is_alive():
+            return
+        
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        
         try:
             # Create a non-alarming test email
             msg = MIMEMultipart()
@@ -805,30 +901,48 @@ Device: {os.environ.get('COMPUTERNAME', 'Unknown Device')}
     """
             
             msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['sender_email'], self.email_config['sender_password'])
-            server.send_message(msg)
-            server.quit()
-            
-            # Show success message
-            messagebox.showinfo(
-                "Test Complete",
-                "✅ Test email sent successfully!\n\n"
-            )
-            
-            self.log_manager.log_system_event("System Test", "Harmless test email sent")
-            
-            return True
-            
+        
         except Exception as e:
-            error_msg = f"Failed to send test email: {str(e)}"
+            error_msg = f"Failed to create test email: {str(e)}"
             print(f"❌ {error_msg}")
             messagebox.showerror("Error", error_msg)
             self.log_manager.log_system_event("Test Email Error", str(e))
             return False
+        
+        # A fresh connection, so the test covers the whole handshake
+        self.test_email_button.config(state="disabled")
+        Toast(self.root, "Test Email", "📨 Sending test email...", self.colors)
+        self.test_email_thread = threading.Thread(target=self._run_test_email, args=(msg,),
+                                                  name="TestEmail", daemon=True)
+        self.test_email_thread.start()
+        return True
+    
+    def _run_test_email(self, msg):
+        """Background part of send_test_email."""
+        from app.services.mail_outbox import timed_send
+        
+        timings, failed_phase, error = timed_send(self.email_config, msg)
+        self.root.after(0, self.on_test_email_done, timings, failed_phase, error)
+    
+    def on_test_email_done(self, timings, failed_phase, error):
+        """Report the test email result on the UI thread."""
+        from app.services.mail_outbox import format_timings
+        
+        self.test_email_button.config(state="normal")
+        timing_text = format_timings(timings)
+        
+        if error is None:
+            print(f"✅ Test email sent ({timing_text})")
+            Toast(self.root, "✅ Test email sent", timing_text, self.colors, level="success")
+            self.log_manager.log_system_event("System Test", f"Harmless test email sent ({timing_text})")
+        else:
+            error_msg = f"Failed during {failed_phase}: {error}"
+            if timing_text:
+                error_msg += f"\n({timing_text})"
+            print(f"❌ Test email {error_msg}")
+            Toast(self.root, "❌ Test email failed", error_msg, self.colors, level="error",
+                  duration_ms=10000)
+            self.log_manager.log_system_event("Test Email Error", error_msg.replace("\n", " "))
     
     def email_scheduler(self):
         """Email scheduler for periodic reports (runs every hour)."""
@@ -867,69 +981,16 @@ Device: {os.environ.get('COMPUTERNAME', 'Unknown Device')}
             # Apply temperature adjustment
             adjusted_temp = self.apply_temperature_adjustment(raw_temp)
             
-            msg = MIMEMultipart()
-            msg['From'] = self.email_config['sender_email']
-            msg['To'] = self.email_config['receiver_email']
-            msg['Subject'] = f"Temperature Report - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            
-            # Build email body
-            body = f"""        
-            **TEMPERATURE MONITORING REPORT**
-**Nanox Philippines Inc. – Server Room**
-
-==================================================
-
-**TIMESTAMP**
-**{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}**
-
-==================================================
-
-**CURRENT STATUS**
-
-• **Temperature:** {adjusted_temp:.1f}°C *(Adjusted for room temperature)*
-• **Source:** {source} – SERVER ROOM
-• **Status:** **{self.get_temperature_status(adjusted_temp)}**
-
-==================================================
-
-**TEMPERATURE SUMMARY (PAST 1 HOUR)**
-
-• Minimum Temperature: {self.min_temp if self.min_temp != float('inf') else 'N/A':.1f}°C
-• Maximum Temperature: {self.max_temp if self.max_temp != float('-inf') else 'N/A':.1f}°C
-
----
-
-This is an **automated system-generated report** from the Temperature Monitoring System.
-
-No action is required unless a warning or critical status is indicated above.
-
----
-
-**IT Infrastructure Monitoring**
-Nanox Philippines Inc.
-"""
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['sender_email'], self.email_config['sender_password'])
-            server.send_message(msg)
-            server.quit()
-            
-            print(f"✅ Daily report sent at {datetime.datetime.now().strftime('%H:%M:%S')}")
-            self.log_manager.log_system_event("Daily Report", "Email report sent")
-            
-            return True
+            return self.alerts.send_report(adjusted_temp, source,
+                                           self.get_temperature_status(adjusted_temp),
+                                           self.min_temp, self.max_temp)
         
         except Exception as e:
-            print(f"❌ Error sending daily report: {e}")
-            self.log_manager.log_system_event("Report Error", f"Failed to send daily report: {e}")
+            print(f"❌ Error reading temperature for report: {e}")
             return False
     
     def update_display(self, adjusted_temp, source):
-        """Update the UI display with adjusted temperature data."""
+        """Render one dashboard frame; called by the render scheduler."""
         if adjusted_temp is not None:
             self.current_temp_var.set(f"{adjusted_temp:.1f}°C")
             self.source_var.set(source)
@@ -951,7 +1012,10 @@ Nanox Philippines Inc.
         else:
             self.current_temp_var.set("--°C")
             self.source_var.set(source)
-            self.status_var.set("No data")
+            if self.temp_reader.is_warming_up:
+                self.status_var.set("Sensors warming up...")
+            else:
+                self.status_var.set("No data")
             self.current_temp_display.config(foreground=self.colors['text_secondary'])
         
         # Update time
@@ -960,6 +1024,10 @@ Nanox Philippines Inc.
         
         # Update graph
         self.update_graph()
+        
+        # The first reading is on screen; load the rest
+        if adjusted_temp is not None and not self.startup_complete:
+            self.root.after_idle(self.finish_startup)
     
     def get_temperature_status(self, adjusted_temp):
         """Get temperature status string based on thresholds."""
@@ -974,68 +1042,12 @@ Nanox Philippines Inc.
     
     def update_graph(self):
         """Update the temperature history graph with adjusted temperatures."""
-        self.ax.clear()
-        
-        if len(self.temp_history) > 0:
-            # Convert time history to minutes
-            if len(self.time_history) > 0:
-                start_time = self.time_history[0]
-                time_minutes = [(t - start_time) / 60 for t in self.time_history]
-            else:
-                time_minutes = list(range(len(self.temp_history)))
-            
-            # Plot adjusted temperature history
-            self.ax.plot(time_minutes, self.temp_history, 
-                        color=self.colors['primary'], 
-                        linewidth=2, 
-                        marker='o',
-                        markersize=3,
-                        label="Temperature (°C)")
-            
-            # Add threshold lines
-            self.ax.axhline(y=self.warning_temp, color='yellow', linestyle='--', 
-                          alpha=0.6, label=f'Warning ({self.warning_temp}°C)')
-            self.ax.axhline(y=self.critical_temp, color='red', linestyle='--', 
-                          alpha=0.6, label=f'Critical ({self.critical_temp}°C)')
-            
-            # Labels and title
-            self.ax.set_xlabel('Time (Minutes)', fontsize=10, fontweight='bold')
-            self.ax.set_ylabel('Temperature (°C)', fontsize=10, fontweight='bold')
-            self.ax.set_title('Temperature History', fontsize=12, fontweight='bold', pad=20)
-            
-            # Legend
-            self.ax.legend(fontsize=9, framealpha=0.9)
-            
-            # Grid
-            self.ax.grid(True, alpha=0.2, linestyle='-')
-            
-            # Auto-adjust y-axis
-            if self.temp_history:
-                current_min = min(self.temp_history)
-                current_max = max(self.temp_history)
-                padding = max(2, (current_max - current_min) * 0.1)
-                self.ax.set_ylim(max(0, current_min - padding), current_max + padding)
-        
-        else:
-            # No data message
-            self.ax.text(0.5, 0.5, 'Collecting temperature data...', 
-                        horizontalalignment='center', verticalalignment='center',
-                        transform=self.ax.transAxes, fontsize=11,
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['hover']))
-            self.ax.set_xlim(0, 1)
-            self.ax.set_ylim(0, 1)
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
-        
-        # Add note about temperature adjustment
-        note_text = f"Note: Temperatures adjusted by -{self.temperature_adjustment}°C to match room temperature"
-        self.ax.text(0.5, -0.15, note_text, transform=self.ax.transAxes, 
-                    fontsize=8, color=self.colors['text_secondary'],
-                    horizontalalignment='center', verticalalignment='top',
-                    style='italic')
-        
-        self.fig.tight_layout(rect=[0, 0.05, 1, 0.95])
-        self.canvas.draw()
+        if self.live_graph is None:
+            return
+        samples = self.history.view()
+        self.live_graph.update(samples['time'], samples['temp'],
+                               self.warning_temp, self.critical_temp,
+                               temp_range=self.history.range())
     
     def start_alert_monitoring(self):
         """Start alert monitoring."""
@@ -1065,7 +1077,7 @@ Nanox Philippines Inc.
         if raw_temp is not None:
             # Apply temperature adjustment
             adjusted_temp = self.apply_temperature_adjustment(raw_temp)
-            self.update_display(adjusted_temp, source)
+            self.render_scheduler.submit(adjusted_temp, source)
     
     def show_sensor_info(self):
         """Show detailed sensor information in a popup window."""
@@ -1142,6 +1154,7 @@ SENSOR INFORMATION
             
             self.warning_temp = new_warning
             self.critical_temp = new_critical
+            self.configure_alerts()
             self.save_settings()
             
             self.log_manager.log_system_event("Settings Update", 
@@ -1157,5 +1170,11 @@ SENSOR INFORMATION
         self.is_monitoring = False
         
         self.log_manager.log_system_event("System Shutdown", "Temperature Monitor shutting down")
+        if self.metrics is not None:
+            self.metrics.close()
+        if self.alerts is not None:
+            self.alerts.close()
+        self.log_manager.close()
+        self.writer_lock.release()
         self.save_settings()
         self.root.destroy()
@@ -0,0 +1,166 @@
+import numpy as np
+from matplotlib.ticker import AutoLocator
+
+
+class LiveTemperatureGraph:
+    """Temperature history plot that updates in place.
+
+    The line, threshold lines, labels and notes are created once. Each new
+    sample only calls set_data on the line and blits it over a cached
+    background. A full redraw (which also reruns the tight layout) happens
+    only when the axis limits or thresholds change, on resize, or when a
+    new graph is built for a theme change.
+    """
+
+    # Extra room on the right so the x-axis limit changes only every so often
+    X_HEADROOM = 0.25
+    Y_PADDING_MIN = 2
+
+    def __init__(self, fig, ax, canvas, colors, temperature_adjustment,
+                 warning_temp, critical_temp):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.colors = colors
+        self.background = None
+        self.origin = None
+        self.full_draws = 0
+        self.blits = 0
+
+        self.fig.set_layout_engine('tight', rect=[0, 0.05, 1, 0.95])
+        self._create_artists(temperature_adjustment, warning_temp, critical_temp)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _create_artists(self, temperature_adjustment, warning_temp, critical_temp):
+        ax = self.ax
+        self.line, = ax.plot([], [],
+                             color=self.colors['primary'],
+                             linewidth=2,
+                             marker='o',
+                             markersize=3,
+                             label="Temperature (°C)",
+                             animated=True)
+
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
+        self.warning_line = ax.axhline(y=warning_temp, color='yellow', linestyle='--',
+                                       alpha=0.6, label=f'Warning ({warning_temp}°C)')
+        self.critical_line = ax.axhline(y=critical_temp, color='red', linestyle='--',
+                                        alpha=0.6, label=f'Critical ({critical_temp}°C)')
+
+        ax.set_xlabel('Time (Minutes)', fontsize=10, fontweight='bold')
+        ax.set_ylabel('Temperature (°C)', fontsize=10, fontweight='bold')
+        ax.set_title('Temperature History', fontsize=12, fontweight='bold', pad=20)
+        ax.grid(True, alpha=0.2, linestyle='-')
+        self.legend = ax.legend(fontsize=9, framealpha=0.9)
+
+        self.placeholder = ax.text(0.5, 0.5, 'Collecting temperature data...',
+                                   horizontalalignment='center', verticalalignment='center',
+                                   transform=ax.transAxes, fontsize=11,
+                                   bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['hover']))
+
+        note_text = f"Note: Temperatures adjusted by -{temperature_adjustment}°C to match room temperature"
+        ax.text(0.5, -0.15, note_text, transform=ax.transAxes,
+                fontsize=8, color=self.colors['text_secondary'],
+                horizontalalignment='center', verticalalignment='top',
+                style='italic')
+
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+    def _on_draw(self, event):
+        """After every full draw: cache the static background, then draw the line"""
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.line)
+
+    def _set_thresholds(self, warning_temp, critical_temp):
+        """Move the threshold lines; returns True if anything changed"""
+        if (warning_temp, critical_temp) == (self.warning_temp, self.critical_temp):
+            return False
+
+        self.warning_temp = warning_temp
+        self.critical_temp = critical_temp
+        self.warning_line.set_ydata([warning_temp, warning_temp])
+        self.critical_line.set_ydata([critical_temp, critical_temp])
+        self.warning_line.set_label(f'Warning ({warning_temp}°C)')
+        self.critical_line.set_label(f'Critical ({critical_temp}°C)')
+        self.legend = self.ax.legend(fontsize=9, framealpha=0.9)
+        return True
+
+    def _update_limits(self, x, y, temp_range=None):
+        """Widen or re-centre the axes only when the data leaves them"""
+        changed = False
+
+        x_min, x_max = self.ax.get_xlim()
+        data_x_min, data_x_max = float(x[0]), float(x[-1])
+        if data_x_min < x_min or data_x_max > x_max or data_x_min > x_min + (x_max - x_min) * self.X_HEADROOM:
+            span = max(data_x_max - data_x_min, 1.0)
+            self.ax.set_xlim(data_x_min, data_x_min + span * (1 + self.X_HEADROOM))
+            changed = True
+
+        if temp_range is None:
+            current_min, current_max = float(np.min(y)), float(np.max(y))
+        else:
+            current_min, current_max = temp_range
+        padding = max(self.Y_PADDING_MIN, (current_max - current_min) * 0.1)
+        y_min, y_max = self.ax.get_ylim()
+        wanted_min = max(0, current_min - padding)
+        wanted_max = current_max + padding
+        # Refit when data leaves the view or the view is far too loose
+        too_loose = (y_max - y_min) > 2 * (wanted_max - wanted_min)
+        if current_min < y_min or current_max > y_max or too_loose:
+            self.ax.set_ylim(wanted_min, wanted_max)
+            changed = True
+
+        return changed
+
+    def update(self, times, temps, warning_temp, critical_temp, temp_range=None):
+        """Show the latest history; redraws fully only when the layout changed.
+
+        temp_range is an optional precomputed (min, max) of temps.
+        """
+        needs_full_draw = self._set_thresholds(warning_temp, critical_temp)
+
+        if len(temps) == 0:
+            return
+
+        # Both are copies, so the caller's buffers may change after this
+        y = np.array(temps, dtype=np.float64)
+        if len(times) == len(temps):
+            t = np.asarray(times, dtype=np.float64)
+            if self.origin is None:
+                self.origin = t[0]
+            x = (t - self.origin) / 60
+        else:
+            x = np.arange(len(y), dtype=np.float64)
+
+        self.line.set_data(x, y)
+
+        if self.placeholder.get_visible():
+            self.placeholder.set_visible(False)
+            self.ax.xaxis.set_major_locator(AutoLocator())
+            self.ax.yaxis.set_major_locator(AutoLocator())
+            needs_full_draw = True
+
+        if self._update_limits(x, y, temp_range):
+            needs_full_draw = True
+
+        if needs_full_draw or self.background is None:
+            self.redraw()
+        else:
+            self.blit()
+
+    def redraw(self):
+        """Full draw (layout included); the draw_event handler re-caches the background"""
+        self.full_draws += 1
+        self.canvas.draw()
+        self.canvas.blit(self.fig.bbox)
+
+    def blit(self):
+        """Restore the cached background and redraw only the line"""
+        self.blits += 1
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.fig.bbox)
@@ -1,10 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import datetime
+import queue
+import threading
+from collections import deque
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import re
+import numpy as np
+
+from app.core.aggregation import (RESOLUTION_SECONDS, bucket_temperatures, local_utc_offset,
+                                  min_max_indices, parse_log_temperatures)
+from app.core.log_lines import LiveLogSource
+from app.ui.log_view import VirtualLogView
 
 class LiveLogWindow:
     """Live Log window for displaying real-time temperature logs"""
@@ -16,6 +24,7 @@ class LiveLogWindow:
         self.colors = self.theme_manager.get_theme()
         self.window = None
         self.is_running = True
+        self.log_source = LiveLogSource(self.log_manager)
         self.create_window()
     
     def create_window(self):
@@ -84,19 +93,18 @@ class LiveLogWindow:
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
         
-        # Create scrollable text area
-        self.log_text = scrolledtext.ScrolledText(
+        # Windowed view over every log line; only the visible rows are rendered
+        self.log_view = VirtualLogView(
             log_frame,
-            wrap=tk.WORD,
+            self.log_source,
             width=120,
             height=30,
             bg=text_bg,
             fg=self.colors['text_primary'],
             font=("Consolas", 9),
-            insertbackground=self.colors['text_primary'],
-            state='disabled'
+            insertbackground=self.colors['text_primary']
         )
-        self.log_text.grid(row=0, column=0, sticky='nsew')
+        self.log_view.grid(row=0, column=0, sticky='nsew')
         
         # Load existing logs
         self.refresh_log_display()
@@ -112,38 +120,24 @@ class LiveLogWindow:
         TimeRangeSearchWindow(self.window, self.log_manager, self.theme_manager, self.responsive_design)
     
     def refresh_log_display(self):
-        """Refresh the log display with current logs"""
-        logs = self.log_manager.get_all_logs()
-        
-        self.log_text.config(state='normal')
-        self.log_text.delete(1.0, tk.END)
-        
-        if logs:
-            for log_entry in logs[-1000:]:
-                self.log_text.insert(tk.END, log_entry + "\n")
-            
-            self.log_text.see(tk.END)
-        else:
-            self.log_text.insert(tk.END, "No logs available yet...\n")
-        
-        self.log_text.config(state='disabled')
+        """Re-index the log files and jump to the newest line"""
+        self.log_source.rebase()
+        self.log_view.scroll_to_end()
+        self.update_status()
     
     def update_live_log(self):
-        """Update the log display with new entries"""
+        """Pick up new records from memory; the view follows them while scrolled to the bottom"""
         if self.is_running and self.window.winfo_exists():
-            new_logs = self.log_manager.get_new_logs()
-            
-            if new_logs:
-                self.log_text.config(state='normal')
-                
-                for log_entry in new_logs:
-                    self.log_text.insert(tk.END, log_entry + "\n")
-                
-                self.log_text.see(tk.END)
-                self.log_text.config(state='disabled')
+            if self.log_source.refresh():
+                self.log_view.render()
+                self.update_status()
             
             self.window.after(1000, self.update_live_log)
     
+    def update_status(self):
+        """Show how many lines the view spans"""
+        self.status_var.set(f"Showing: Live Logs ({self.log_source.line_count:,} lines)")
+    
     def on_close(self):
         """Handle window close"""
         self.is_running = False
@@ -152,7 +146,12 @@ class LiveLogWindow:
 
 class TimeRangeSearchWindow:
     """Modal window for time range search and export"""
-    def __init__(self, parent, log_manager, theme_manager, responsive_design):
+    
+    # Results are streamed into the view this many lines per after() tick
+    RESULT_CHUNK_LINES = 2000
+    RESULT_POLL_MS = 50
+    
+    def __init__(self, parent, log_manager, theme_manager, responsive_design, result_cap=100000):
         self.parent = parent
         self.log_manager = log_manager
         self.theme_manager = theme_manager
@@ -160,6 +159,17 @@ class TimeRangeSearchWindow:
         self.colors = self.theme_manager.get_theme()
         self.window = None
         self.current_logs = []
+        
+        # Background search state
+        self.result_cap = result_cap
+        self.search_thread = None
+        self.search_cancel = threading.Event()
+        self.search_results = queue.Queue()
+        self.search_status = None
+        self.search_range = None
+        self.pending_lines = deque()
+        self.displayed_count = 0
+        
         self.create_window()
     
     def create_window(self):
@@ -317,10 +327,17 @@ class TimeRangeSearchWindow:
         action_frame.columnconfigure(0, weight=1)
         
         # Search button
-        search_button = ttk.Button(action_frame, text="Search Logs", 
-                                  command=self.search_logs,
-                                  style='Primary.TButton')
-        search_button.grid(row=0, column=0, sticky='w', padx=(0, 10))
+        self.search_button = ttk.Button(action_frame, text="Search Logs", 
+                                       command=self.search_logs,
+                                       style='Primary.TButton')
+        self.search_button.grid(row=0, column=0, sticky='w', padx=(0, 10))
+        
+        # Cancel button (active while a search is running)
+        self.cancel_button = ttk.Button(action_frame, text="Cancel", 
+                                       command=self.cancel_search,
+                                       style='Secondary.TButton',
+                                       state="disabled")
+        self.cancel_button.grid(row=0, column=3, sticky='w', padx=(10, 0))
         
         # Export button
         self.export_button = ttk.Button(action_frame, text="Export Results", 
@@ -347,6 +364,10 @@ class TimeRangeSearchWindow:
                                 font=("Segoe UI", 9))
         results_label.pack(anchor='w')
         
+        # Search progress (days scanned)
+        self.search_progress = ttk.Progressbar(info_frame, mode='determinate', length=300)
+        self.search_progress.pack(anchor='w', pady=(5, 0))
+        
         # Main content area
         content_frame = ttk.Frame(self.window, style='Modern.TFrame')
         content_frame.grid(row=2, column=0, sticky='nsew', padx=15, pady=(0, 15))
@@ -397,55 +418,188 @@ class TimeRangeSearchWindow:
         self.end_time_var.set("23:59")
     
     def search_logs(self):
-        """Search logs for the selected time range"""
+        """Start a background search for the selected time range"""
+        if self.search_thread is not None and self.search_thread.is_alive():
+            return
+        
+        start_datetime_str = f"{self.start_date_var.get()} {self.start_time_var.get()}"
+        end_datetime_str = f"{self.end_date_var.get()} {self.end_time_var.get()}"
+        
+        # Validate datetime
         try:
-            start_datetime_str = f"{self.start_date_var.get()} {self.start_time_var.get()}"
-            end_datetime_str = f"{self.end_date_var.get()} {self.end_time_var.get()}"
+            start_datetime = datetime.datetime.strptime(start_datetime_str, "%Y-%m-%d %H:%M")
+            end_datetime = datetime.datetime.strptime(end_datetime_str, "%Y-%m-%d %H:%M")
             
-            # Validate datetime
-            try:
-                start_datetime = datetime.datetime.strptime(start_datetime_str, "%Y-%m-%d %H:%M")
-                end_datetime = datetime.datetime.strptime(end_datetime_str, "%Y-%m-%d %H:%M")
+            if start_datetime > end_datetime:
+                messagebox.showerror("Error", "Start time cannot be after end time")
+                return
+            
+        except ValueError:
+            messagebox.showerror("Error", "Invalid datetime format")
+            return
+        
+        # Reset results; a fresh queue and event keep a finished worker from leaking in
+        self.current_logs = []
+        self.pending_lines.clear()
+        self.displayed_count = 0
+        self.search_status = None
+        self.search_results = queue.Queue()
+        self.search_cancel = threading.Event()
+        self.search_range = (start_datetime_str, end_datetime_str, start_datetime, end_datetime)
+        
+        self.log_text.config(state='normal')
+        self.log_text.delete(1.0, tk.END)
+        self.log_text.config(state='disabled')
+        
+        self.export_button.config(state="disabled")
+        self.graph_button.config(state="disabled")
+        self.search_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        
+        total_days = (end_datetime.date() - start_datetime.date()).days + 1
+        self.search_progress.config(maximum=total_days, value=0)
+        self.results_var.set("Searching...")
+        
+        self.search_thread = threading.Thread(target=self._search_worker,
+                                              args=(start_datetime, end_datetime,
+                                                    self.search_cancel, self.search_results),
+                                              name="LogSearch",
+                                              daemon=True)
+        self.search_thread.start()
+        self.window.after(self.RESULT_POLL_MS, self._poll_search_results)
+    
+    def _search_worker(self, start_datetime, end_datetime, cancel, results):
+        """Read the range day by day and queue the matches for the Tk thread"""
+        found = 0
+        try:
+            days = self.log_manager.iter_logs_for_time_range(start_datetime, end_datetime)
+            for days_done, (day, day_logs) in enumerate(days, 1):
+                if cancel.is_set():
+                    results.put(('done', 'cancelled'))
+                    return
                 
-                if start_datetime > end_datetime:
-                    messagebox.showerror("Error", "Start time cannot be after end time")
+                if found + len(day_logs) > self.result_cap:
+                    results.put(('lines', day_logs[:self.result_cap - found], days_done))
+                    results.put(('done', 'capped'))
                     return
                 
-            except ValueError:
-                messagebox.showerror("Error", "Invalid datetime format")
+                found += len(day_logs)
+                results.put(('lines', day_logs, days_done))
+            
+            results.put(('done', 'complete'))
+        except Exception as e:
+            results.put(('error', str(e)))
+    
+    def _poll_search_results(self):
+        """Move queued results into the view, one chunk per tick"""
+        try:
+            if not self.window.winfo_exists():
                 return
+        except tk.TclError:
+            return
+        
+        while True:
+            try:
+                item = self.search_results.get_nowait()
+            except queue.Empty:
+                break
+            
+            if self.search_cancel.is_set():
+                # Queued before the worker saw the cancel; Cancel keeps only what is shown
+                continue
             
-            # Get logs for the time range
-            self.current_logs = self.log_manager.get_logs_for_time_range(start_datetime, end_datetime)
+            if item[0] == 'lines':
+                _, day_logs, days_done = item
+                self.current_logs.extend(day_logs)
+                self.pending_lines.extend(day_logs)
+                self.search_progress.config(value=days_done)
+            else:
+                self.search_status = item
+        
+        if self.pending_lines:
+            count = min(self.RESULT_CHUNK_LINES, len(self.pending_lines))
+            chunk = [self.pending_lines.popleft() for _ in range(count)]
             
-            # Clear and update log display
             self.log_text.config(state='normal')
-            self.log_text.delete(1.0, tk.END)
+            self.log_text.insert(tk.END, "\n".join(chunk) + "\n")
+            self.log_text.config(state='disabled')
             
-            if self.current_logs:
-                for log_entry in self.current_logs:
-                    self.log_text.insert(tk.END, log_entry + "\n")
-                
-                self.log_text.see(1.0)
-                
-                # Update results info
-                log_count = len(self.current_logs)
-                self.results_var.set(f"Found {log_count} log entries from {start_datetime_str} to {end_datetime_str}")
-                
-                # Enable export and graph buttons
-                self.export_button.config(state="normal")
-                self.graph_button.config(state="normal")
+            self.displayed_count += count
+            self.results_var.set(f"Searching... {len(self.current_logs)} log entries found")
+        
+        if self.search_status is None or self.pending_lines:
+            self.window.after(self.RESULT_POLL_MS, self._poll_search_results)
+        else:
+            self.finish_search(self.search_status)
+    
+    def cancel_search(self):
+        """Stop the running search, keeping the results shown so far"""
+        self.search_cancel.set()
+        self.pending_lines.clear()
+        del self.current_logs[self.displayed_count:]
+        self.search_status = ('done', 'cancelled')
+    
+    def finish_search(self, status):
+        """Show the outcome once the worker is done and every result is displayed"""
+        self.search_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        
+        if status[0] == 'error':
+            self.results_var.set("Search failed")
+            messagebox.showerror("Search Error", f"Failed to search logs: {status[1]}")
+            return
+        
+        outcome = status[1]
+        start_datetime_str, end_datetime_str, start_datetime, end_datetime = self.search_range
+        log_count = len(self.current_logs)
+        
+        if outcome == 'complete':
+            self.search_progress.config(value=self.search_progress.cget('maximum'))
+        
+        if self.current_logs:
+            self.log_text.see(1.0)
             
+            # Update results info
+            if outcome == 'capped':
+                results_text = (f"Showing the first {log_count} log entries (result cap) "
+                                f"from {start_datetime_str} to {end_datetime_str}")
+            elif outcome == 'cancelled':
+                results_text = f"Search cancelled after {log_count} log entries"
             else:
-                self.log_text.insert(tk.END, "No logs found for the specified time range.\n")
-                self.results_var.set("No logs found for the specified time range")
-                self.export_button.config(state="disabled")
-                self.graph_button.config(state="disabled")
+                results_text = f"Found {log_count} log entries from {start_datetime_str} to {end_datetime_str}"
             
-            self.log_text.config(state='disabled')
+            summary_text = self.get_range_summary(start_datetime, end_datetime)
+            if summary_text:
+                results_text += f" | {summary_text}"
+            self.results_var.set(results_text)
+            
+            # Enable export and graph buttons
+            self.export_button.config(state="normal")
+            self.graph_button.config(state="normal")
         
-        except Exception as e:
-            messagebox.showerror("Search Error", f"Failed to search logs: {str(e)}")
+        elif outcome == 'cancelled':
+            self.results_var.set("Search cancelled")
+        
+        else:
+            self.log_text.config(state='normal')
+            self.log_text.insert(tk.END, "No logs found for the specified time range.\n")
+            self.log_text.config(state='disabled')
+            self.results_var.set("No logs found for the specified time range")
+    
+    def get_range_summary(self, start_datetime, end_datetime):
+        """Min/avg/max over the range from the rollup pyramid, or None if it is not covered"""
+        rollups = self.log_manager.rollups
+        start_epoch = start_datetime.timestamp()
+        if rollups is None or not rollups.covers(start_epoch):
+            return None
+        
+        # The end minute is inclusive
+        summary = rollups.summary(start_epoch, end_datetime.timestamp() + 60)
+        if summary is None:
+            return None
+        
+        mean, minimum, maximum, sample_count, rows_read = summary
+        return f"Min {minimum:.1f}°C · Avg {mean:.1f}°C · Max {maximum:.1f}°C ({sample_count} samples)"
     
     def show_enhanced_graph(self):
         """Show the enhanced graph view"""
@@ -461,7 +615,9 @@ class TimeRangeSearchWindow:
             end_datetime = datetime.datetime.strptime(end_datetime_str, "%Y-%m-%d %H:%M")
             
             EnhancedGraphWindow(self.window, start_datetime, end_datetime, self.current_logs, 
-                              self.theme_manager, self.responsive_design)
+                              self.theme_manager, self.responsive_design,
+                              sample_store=self.log_manager.sample_store,
+                              rollups=self.log_manager.rollups)
         
         except Exception as e:
             messagebox.showerror("Graph Error", f"Failed to generate graph: {str(e)}")
@@ -492,17 +648,24 @@ class TimeRangeSearchWindow:
     
     def on_close(self):
         """Handle window close"""
+        self.search_cancel.set()
         self.window.destroy()
 
 
 class EnhancedGraphWindow:
     """Enhanced graph window with adjustable time resolution"""
     
-    def __init__(self, parent, start_datetime, end_datetime, logs, theme_manager, responsive_design):
+    # Above this many plotted points the line is drawn without markers
+    MAX_MARKER_POINTS = 500
+    
+    def __init__(self, parent, start_datetime, end_datetime, logs, theme_manager, responsive_design,
+                 sample_store=None, rollups=None):
         self.parent = parent
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
         self.logs = logs
+        self.sample_store = sample_store
+        self.rollups = rollups
         self.theme_manager = theme_manager
         self.responsive_design = responsive_design
         self.colors = self.theme_manager.get_theme()
@@ -587,47 +750,49 @@ class EnhancedGraphWindow:
         self.window.protocol("WM_DELETE_WINDOW", self.window.destroy)
     
     def parse_temperature_data(self):
-        """Parse temperature data from logs"""
-        temperature_entries = []
-        
-        for log_entry in self.logs:
-            # Try to extract temperature using regex
-            temp_match = re.search(r'(\d+\.?\d*)\s*°C', log_entry)
-            if temp_match:
-                try:
-                    # Extract timestamp
-                    timestamp_str = log_entry.split(']')[0][1:]
-                    timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                    
-                    temperature = float(temp_match.group(1))
-                    temperature_entries.append({
-                        'timestamp': timestamp,
-                        'temperature': temperature,
-                        'log_entry': log_entry
-                    })
-                except Exception:
-                    continue
-        
-        return temperature_entries
-    
-    def setup_graph(self, parent):
-        """Setup the matplotlib graph"""
-        temperature_entries = self.parse_temperature_data()
+        """Load (epochs, temperatures) arrays, preferring the binary sample store over log text"""
+        covered_dates = set()
+        parts = []
+        if self.sample_store is not None:
+            covered_dates = self.sample_store.covered_dates(self.start_datetime, self.end_datetime)
+            if covered_dates:
+                samples = self.sample_store.load_range(self.start_datetime, self.end_datetime)
+                parts.append((samples['epoch'].astype(np.float64), samples['temp'].astype(np.float64)))
         
-        if not temperature_entries:
-            self.show_no_data_message(parent)
-            return
+        # Days recorded before the sample store existed are parsed from the logs
+        covered_days = {date.strftime('%Y-%m-%d') for date in covered_dates}
+        log_epochs, log_temps = parse_log_temperatures(
+            log_entry for log_entry in self.logs if log_entry[1:11] not in covered_days)
         
-        # Sort by timestamp
-        temperature_entries.sort(key=lambda x: x['timestamp'])
+        if len(log_epochs):
+            parts.append((log_epochs, log_temps))
         
-        # Get data based on resolution
-        dates, temperatures = self.get_data_by_resolution(temperature_entries)
+        if not parts:
+            return np.empty(0), np.empty(0)
+        
+        epochs = np.concatenate([part[0] for part in parts])
+        temps = np.concatenate([part[1] for part in parts])
         
+        # Sort by timestamp
+        order = np.argsort(epochs, kind='stable')
+        return epochs[order], temps[order]
+    
+    def setup_graph(self, parent):
+        """Setup the matplotlib graph"""
         # Create figure
         self.fig, self.ax = plt.subplots(figsize=(12, 6))
         self.fig.patch.set_facecolor(self.colors['card_bg'])
         
+        # Get data based on resolution
+        bucket_epochs, mean, minimum, maximum, counts = self.load_graph_data()
+        
+        if len(bucket_epochs) == 0:
+            plt.close(self.fig)
+            self.show_no_data_message(parent)
+            return
+        
+        dates = self.to_plot_dates(bucket_epochs)
+        
         # Set colors based on theme
         if self.colors['background'] == '#0f172a':
             text_color = 'white'
@@ -638,8 +803,14 @@ class EnhancedGraphWindow:
             grid_color = '#e2e8f0'
             line_color = '#2563eb'
         
-        # Plot graph
-        self.ax.plot(dates, temperatures, marker='o', color=line_color, 
+        # Min/max band for aggregated resolutions
+        if self.resolution_var.get() != "all":
+            self.ax.fill_between(dates, minimum, maximum, color=line_color,
+                                 alpha=0.2, linewidth=0, label="Min / Max")
+        
+        # Plot graph; markers only while individual points can be told apart
+        marker = 'o' if len(dates) <= self.MAX_MARKER_POINTS else None
+        self.ax.plot(dates, mean, marker=marker, color=line_color, 
                     linewidth=2, markersize=4, label="Temperature (°C)")
         
         # Add threshold lines (example values)
@@ -671,14 +842,13 @@ class EnhancedGraphWindow:
             spine.set_color(text_color)
         
         # Format x-axis based on time range
-        self.format_x_axis(dates)
+        self.format_x_axis(bucket_epochs)
         
         # Auto-adjust y-axis
-        if temperatures:
-            min_temp = min(temperatures)
-            max_temp = max(temperatures)
-            padding = (max_temp - min_temp) * 0.1 if max_temp > min_temp else 2
-            self.ax.set_ylim(min_temp - padding, max_temp + padding)
+        min_temp = float(minimum.min())
+        max_temp = float(maximum.max())
+        padding = (max_temp - min_temp) * 0.1 if max_temp > min_temp else 2
+        self.ax.set_ylim(min_temp - padding, max_temp + padding)
         
         plt.tight_layout()
         
@@ -687,21 +857,13 @@ class EnhancedGraphWindow:
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
         self.canvas.draw()
     
-    def get_data_by_resolution(self, temperature_entries):
-        """Get data aggregated by selected resolution"""
+    def get_effective_resolution(self):
+        """Selected resolution, with "auto" resolved from the time range"""
         resolution = self.resolution_var.get()
         
-        if resolution == "all":
-            # Return all data points
-            dates = [entry['timestamp'] for entry in temperature_entries]
-            temps = [entry['temperature'] for entry in temperature_entries]
-            return dates, temps
-        
-        # Calculate time range
-        time_range = self.end_datetime - self.start_datetime
-        
         # Auto-detect best resolution
         if resolution == "auto":
+            time_range = self.end_datetime - self.start_datetime
             if time_range.total_seconds() <= 3600:  # 1 hour or less
                 resolution = "10min"
             elif time_range.total_seconds() <= 86400:  # 1 day or less
@@ -709,42 +871,60 @@ class EnhancedGraphWindow:
             else:
                 resolution = "1hour"
         
-        # Group data by resolution
-        grouped_data = {}
-        
-        for entry in temperature_entries:
-            timestamp = entry['timestamp']
-            temp = entry['temperature']
-            
-            # Determine time bucket
-            if resolution == "10min":
-                bucket_minutes = (timestamp.minute // 10) * 10
-                bucket_time = timestamp.replace(minute=bucket_minutes, second=0, microsecond=0)
-            elif resolution == "30min":
-                bucket_minutes = (timestamp.minute // 30) * 30
-                bucket_time = timestamp.replace(minute=bucket_minutes, second=0, microsecond=0)
-            elif resolution == "1hour":
-                bucket_time = timestamp.replace(minute=0, second=0, microsecond=0)
-            elif resolution == "1day":
-                bucket_time = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            # Add to bucket
-            if bucket_time not in grouped_data:
-                grouped_data[bucket_time] = {'temps': [], 'count': 0}
-            
-            grouped_data[bucket_time]['temps'].append(temp)
-            grouped_data[bucket_time]['count'] += 1
-        
-        # Calculate averages
-        dates = []
-        temps = []
-        
-        for bucket_time, data in sorted(grouped_data.items()):
-            if data['temps']:
-                dates.append(bucket_time)
-                temps.append(sum(data['temps']) / len(data['temps']))
+        return resolution
+    
+    def load_graph_data(self):
+        """
+        (bucket_epochs, mean, min, max, count) arrays for the selected resolution.
+        Aggregated resolutions come from the rollup pyramid when it covers the range.
+        """
+        resolution = self.get_effective_resolution()
+        start_epoch = self.start_datetime.timestamp()
+        
+        if resolution != "all" and self.rollups is not None and self.rollups.covers(start_epoch):
+            # The end minute is inclusive
+            end_epoch = self.end_datetime.timestamp() + 60
+            return self.rollups.buckets(start_epoch, end_epoch, RESOLUTION_SECONDS[resolution])
+        
+        epochs, temps = self.parse_temperature_data()
+        if len(epochs) == 0:
+            empty = np.empty(0)
+            return empty, empty, empty, empty, np.empty(0, dtype=np.int64)
+        return self.get_data_by_resolution(epochs, temps)
+    
+    def get_data_by_resolution(self, epochs, temps):
+        """
+        Aggregate sorted samples by the selected resolution.
+        Returns (bucket_epochs, mean, min, max, count) arrays.
+        """
+        resolution = self.get_effective_resolution()
         
-        return dates, temps
+        if resolution == "all":
+            # Every sample, thinned to the lowest/highest per pixel column
+            keep = min_max_indices(epochs, temps, self.plot_pixel_width())
+            epochs, temps = epochs[keep], temps[keep]
+            return epochs, temps, temps, temps, np.ones(len(temps), dtype=np.int64)
+        
+        # Buckets follow local wall-clock time (offset taken at the first sample)
+        utc_offset = local_utc_offset(epochs[0])
+        return bucket_temperatures(epochs, temps, RESOLUTION_SECONDS[resolution], utc_offset)
+    
+    def plot_pixel_width(self):
+        """Width of the plot area in pixels"""
+        width = self.ax.get_window_extent().width
+        try:
+            # Use the real window width once it is on screen
+            width = max(width, self.window.winfo_width() * 0.8)
+        except tk.TclError:
+            pass
+        return int(width)
+    
+    def to_plot_dates(self, epochs):
+        """Convert epoch seconds to naive local datetime64 values for matplotlib"""
+        if len(epochs) == 0:
+            return np.empty(0, dtype='datetime64[s]')
+        utc_offset = local_utc_offset(epochs[0])
+        return (np.asarray(epochs, dtype=np.int64) + utc_offset).astype('datetime64[s]')
     
     def get_resolution_text(self):
         """Get text description of current resolution"""
@@ -761,16 +941,16 @@ class EnhancedGraphWindow:
         
         return resolutions.get(resolution, "")
     
-    def format_x_axis(self, dates):
+    def format_x_axis(self, epochs):
         """Format x-axis based on date range"""
-        if not dates:
+        if len(epochs) == 0:
             return
         
-        time_range = dates[-1] - dates[0]
+        time_range = epochs[-1] - epochs[0]
         
-        if time_range.total_seconds() <= 86400:  # 1 day or less
+        if time_range <= 86400:  # 1 day or less
             date_format = mdates.DateFormatter('%H:%M\n%m/%d')
-        elif time_range.total_seconds() <= 604800:  # 1 week or less
+        elif time_range <= 604800:  # 1 week or less
             date_format = mdates.DateFormatter('%m/%d\n%H:00')
         else:
             date_format = mdates.DateFormatter('%Y-%m-%d')
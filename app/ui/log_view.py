@@ -0,0 +1,113 @@
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+
+class VirtualLogView:
+    """Read-only log view that renders only the rows on screen.
+
+    The Text widget only ever holds one screenful of lines. They are fetched
+    from a line source (anything with line_count and get_lines(first,
+    count), e.g. LogLineIndex), so memory does not grow with the log and
+    scrolling through millions of lines stays instant. While scrolled to the
+    bottom, the view follows the tail as new lines arrive.
+    """
+
+    WHEEL_LINES = 3
+
+    def __init__(self, parent, source, **text_options):
+        self.source = source
+        self.first_line = 0
+        self.follow_tail = True
+        self.empty_message = "No logs available yet..."
+        self._rendered = None
+        self._line_height = None
+
+        self.frame = ttk.Frame(parent, style='Modern.TFrame')
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self.text = tk.Text(self.frame, wrap=tk.NONE, state='disabled', **text_options)
+        self.text.grid(row=0, column=0, sticky='nsew')
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+
+        x_scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.text.xview)
+        x_scrollbar.grid(row=1, column=0, sticky='ew')
+        self.text.config(xscrollcommand=x_scrollbar.set)
+
+        # The Text never scrolls by itself; every vertical move goes through scroll_to()
+        self.text.bind('<Configure>', lambda event: self.render())
+        self.text.bind('<MouseWheel>', self.on_mousewheel)
+        self.text.bind('<Button-4>', lambda event: self.scroll_by(-self.WHEEL_LINES))
+        self.text.bind('<Button-5>', lambda event: self.scroll_by(self.WHEEL_LINES))
+        self.text.bind('<Prior>', lambda event: self.scroll_by(-self.visible_rows()))
+        self.text.bind('<Next>', lambda event: self.scroll_by(self.visible_rows()))
+        self.text.bind('<Up>', lambda event: self.scroll_by(-1))
+        self.text.bind('<Down>', lambda event: self.scroll_by(1))
+        self.text.bind('<Control-Home>', lambda event: self.scroll_to(0))
+        self.text.bind('<Control-End>', lambda event: self.scroll_to_end())
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def visible_rows(self):
+        """Number of whole rows that fit in the widget"""
+        height = self.text.winfo_height()
+        if height <= 1:
+            # Not laid out yet
+            return int(self.text.cget('height'))
+        if self._line_height is None:
+            self._line_height = max(1, tkfont.Font(font=self.text.cget('font')).metrics('linespace'))
+        return max(1, height // self._line_height)
+
+    def max_first_line(self):
+        return max(0, self.source.line_count - self.visible_rows())
+
+    def scroll_to(self, first_line):
+        self.first_line = min(max(0, int(first_line)), self.max_first_line())
+        self.follow_tail = self.first_line >= self.max_first_line()
+        self.render()
+        return "break"
+
+    def scroll_by(self, lines):
+        return self.scroll_to(self.first_line + lines)
+
+    def scroll_to_end(self):
+        self.follow_tail = True
+        self.render()
+        return "break"
+
+    def on_mousewheel(self, event):
+        # Windows/macOS report multiples of 120 per notch
+        notches = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        return self.scroll_by(notches * self.WHEEL_LINES)
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * self.source.line_count)
+        elif action == 'scroll':
+            step = self.visible_rows() if unit == 'pages' else 1
+            self.scroll_by(int(amount) * step)
+
+    def render(self):
+        """Draw the rows at first_line (or the tail when following it)"""
+        total = self.source.line_count
+        rows = self.visible_rows()
+        if self.follow_tail:
+            self.first_line = max(0, total - rows)
+
+        lines = self.source.get_lines(self.first_line, rows) if total else [self.empty_message]
+
+        if lines != self._rendered:
+            self.text.config(state='normal')
+            self.text.delete(1.0, tk.END)
+            self.text.insert(tk.END, "\n".join(lines))
+            self.text.config(state='disabled')
+            self._rendered = lines
+
+        if total:
+            self.scrollbar.set(self.first_line / total, min(1.0, (self.first_line + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
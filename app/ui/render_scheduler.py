@@ -0,0 +1,83 @@
+import threading
+import time
+import tkinter as tk
+
+
+class RenderScheduler:
+    """Merges UI refresh requests into at most max_fps frames per second.
+
+    Any thread can call submit() with the newest display state. That only
+    stores the state and marks the view dirty. One Tk timer then renders the
+    latest state, so samples that arrive between frames share a single
+    redraw. Rendering pauses while the window is minimised or withdrawn, and
+    the newest state is drawn once when the window is shown again.
+    """
+
+    def __init__(self, root, render, max_fps=4):
+        self.root = root
+        self.render = render
+        self.max_fps = max_fps
+        self.frames = 0
+        self.coalesced = 0
+        self._state = None
+        self._dirty = False
+        self._scheduled = False
+        self._paused = False
+        self._last_frame = 0.0
+        self._lock = threading.Lock()
+
+        self.root.bind('<Map>', self._on_map, add='+')
+
+    def submit(self, *state):
+        """Record the newest state; renders on the next free frame slot"""
+        with self._lock:
+            if self._dirty:
+                self.coalesced += 1
+            self._state = state
+            self._dirty = True
+            if self._scheduled or self._paused:
+                return
+            self._scheduled = True
+
+        self._schedule_frame()
+
+    def _schedule_frame(self):
+        frame_interval = 1.0 / max(self.max_fps, 0.1)
+        delay = self._last_frame + frame_interval - time.monotonic()
+        self.root.after(max(0, int(delay * 1000)), self._render_frame)
+
+    def _is_hidden(self):
+        try:
+            return self.root.state() in ('iconic', 'withdrawn') or not self.root.winfo_viewable()
+        except tk.TclError:
+            # Window is being destroyed
+            return True
+
+    def _render_frame(self):
+        if self._is_hidden():
+            with self._lock:
+                self._scheduled = False
+                self._paused = True
+            return
+
+        with self._lock:
+            state = self._state
+            self._dirty = False
+            self._scheduled = False
+
+        self._last_frame = time.monotonic()
+        self.frames += 1
+        self.render(*state)
+
+    def _on_map(self, event):
+        # Child widgets share the root's bindtag; only the root window matters
+        if event.widget is not self.root:
+            return
+
+        with self._lock:
+            self._paused = False
+            if not self._dirty or self._scheduled:
+                return
+            self._scheduled = True
+
+        self._schedule_frame()
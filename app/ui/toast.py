@@ -0,0 +1,64 @@
+import tkinter as tk
+
+
+class Toast:
+    """Small borderless message in the bottom-right corner of a window.
+
+    It does not take focus or block the UI and closes itself after
+    duration_ms, or when clicked. Only one toast is shown per parent; a new
+    one replaces the previous.
+    """
+
+    DURATION_MS = 6000
+    MARGIN = 24
+    WRAP_LENGTH = 360
+
+    _current = {}
+
+    def __init__(self, parent, title, message, colors, level="info", duration_ms=None):
+        self.parent = parent
+        previous = self._current.get(parent)
+        if previous is not None:
+            previous.close()
+        self._current[parent] = self
+
+        accent = {"success": colors['success'], "error": colors['error'],
+                  "warning": colors['warning']}.get(level, colors['primary'])
+
+        self.window = tk.Toplevel(parent)
+        self.window.overrideredirect(True)
+        self.window.attributes('-topmost', True)
+        self.window.configure(bg=accent)
+
+        body = tk.Frame(self.window, bg=colors['surface'], padx=14, pady=10)
+        body.pack(fill=tk.BOTH, expand=True, padx=(4, 1), pady=1)
+
+        tk.Label(body, text=title, bg=colors['surface'], fg=colors['text_primary'],
+                 font=("Segoe UI", 10, "bold"), anchor='w', justify='left').pack(fill=tk.X)
+        tk.Label(body, text=message, bg=colors['surface'], fg=colors['text_secondary'],
+                 font=("Segoe UI", 9), anchor='w', justify='left',
+                 wraplength=self.WRAP_LENGTH).pack(fill=tk.X, pady=(4, 0))
+
+        for widget in (self.window, body, *body.winfo_children()):
+            widget.bind('<Button-1>', lambda event: self.close())
+
+        self._place()
+        self._timer = self.window.after(duration_ms or self.DURATION_MS, self.close)
+
+    def _place(self):
+        """Bottom-right corner of the parent window"""
+        self.window.update_idletasks()
+        width = self.window.winfo_reqwidth()
+        height = self.window.winfo_reqheight()
+        x = self.parent.winfo_rootx() + self.parent.winfo_width() - width - self.MARGIN
+        y = self.parent.winfo_rooty() + self.parent.winfo_height() - height - self.MARGIN
+        self.window.geometry(f"+{max(0, x)}+{max(0, y)}")
+
+    def close(self):
+        if self._current.get(self.parent) is self:
+            del self._current[self.parent]
+        try:
+            self.window.after_cancel(self._timer)
+            self.window.destroy()
+        except tk.TclError:
+            pass
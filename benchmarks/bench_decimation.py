@@ -0,0 +1,113 @@
+"""Render-time and peak-fidelity benchmark for long-range graph decimation.
+
+Builds a synthetic month of samples with a handful of short critical
+spikes, then plots it three ways on the Agg backend:
+
+* every point with markers (the old "all" resolution),
+* the old 5-minute picks (version2 ``filter_5_minute_intervals``),
+* min/max per pixel column (``min_max_indices``).
+
+For each it reports the number of plotted points, render time and how many
+spikes are still visible at their true peak. Two spikes that land in the
+same pixel column draw as one, so min/max can report one short.
+
+    python benchmarks/bench_decimation.py [--days 30] [--interval 2]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from app.core.aggregation import min_max_indices
+
+SPIKE_COUNT = 20
+SPIKE_SECONDS = 30
+SPIKE_TEMP = 38.0
+FIGSIZE = (12, 6)
+
+
+def make_data(days, interval, seed=7):
+    rng = np.random.default_rng(seed)
+    epochs = 1_700_000_000 + np.arange(0, days * 86400, interval, dtype=np.float64)
+    temps = 22 + 2 * np.sin(epochs / 86400 * 2 * np.pi) + rng.normal(0, 0.2, len(epochs))
+
+    spike_starts = rng.choice(len(epochs) - SPIKE_SECONDS, SPIKE_COUNT, replace=False)
+    spikes = []
+    for start in spike_starts:
+        end = start + max(1, SPIKE_SECONDS // interval)
+        temps[start:end] = SPIKE_TEMP
+        spikes.append((epochs[start], epochs[end - 1]))
+    return epochs, temps.astype(np.float32), spikes
+
+
+def five_minute_indices(epochs):
+    """The old version2 picker: first sample, then one every >= 300 s, plus the last"""
+    keep = [0]
+    last = epochs[0]
+    for i in range(1, len(epochs)):
+        if epochs[i] - last >= 300:
+            keep.append(i)
+            last = epochs[i]
+    if keep[-1] != len(epochs) - 1:
+        keep.append(len(epochs) - 1)
+    return np.array(keep)
+
+
+def spikes_kept(epochs, temps, spikes):
+    kept = 0
+    for start, end in spikes:
+        lo = np.searchsorted(epochs, start, side='left')
+        hi = np.searchsorted(epochs, end, side='right')
+        if hi > lo and temps[lo:hi].max() >= SPIKE_TEMP:
+            kept += 1
+    return kept
+
+
+def render(epochs, temps, marker):
+    fig, ax = plt.subplots(figsize=FIGSIZE)
+    start = time.perf_counter()
+    ax.plot(epochs, temps, marker=marker, linewidth=2, markersize=4)
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - start
+    plt.close(fig)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--interval", type=int, default=2, help="seconds between samples")
+    args = parser.parse_args()
+
+    epochs, temps, spikes = make_data(args.days, args.interval)
+    print(f"{len(epochs):,} samples over {args.days} days, {SPIKE_COUNT} spikes of {SPIKE_SECONDS}s\n")
+
+    fig, ax = plt.subplots(figsize=FIGSIZE)
+    fig.canvas.draw()
+    pixel_width = int(ax.get_window_extent().width)
+    plt.close(fig)
+
+    variants = [("all points + markers", lambda: np.arange(len(epochs)), 'o'),
+                ("5-minute picks", lambda: five_minute_indices(epochs), 'o'),
+                (f"min/max per pixel ({pixel_width}px)", lambda: min_max_indices(epochs, temps, pixel_width), None)]
+
+    print(f"{'method':<30} {'points':>10} {'select':>10} {'render':>10} {'spikes kept':>12}")
+    for label, select, marker in variants:
+        start = time.perf_counter()
+        keep = select()
+        select_time = time.perf_counter() - start
+        render_time = render(epochs[keep], temps[keep], marker)
+        kept = spikes_kept(epochs[keep], temps[keep], spikes)
+        print(f"{label:<30} {len(keep):>10,} {select_time * 1000:>8.1f}ms {render_time * 1000:>8.1f}ms "
+              f"{kept:>7}/{SPIKE_COUNT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Frame-time benchmark: redraw-everything graph vs LiveTemperatureGraph.
+
+Feeds one sample per frame into a 100-point history (like the main window)
+and times the old ``ax.clear()`` + replot + tight_layout + draw cycle against
+the persistent-artist graph that blits the line over a cached background.
+Uses the Agg backend, so no display is needed.
+
+    python benchmarks/bench_live_graph.py [--frames 300]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from app.core.theme import ThemeManager
+from app.ui.live_graph import LiveTemperatureGraph
+
+WARNING_TEMP = 25
+CRITICAL_TEMP = 30
+ADJUSTMENT = 20.0
+
+
+def samples(frames, start=1_700_000_000):
+    for i in range(frames):
+        yield start + i * 2, 22 + 1.5 * math.sin(i / 15) + (i % 7) * 0.05
+
+
+def legacy_frame(fig, ax, colors, temp_history, time_history):
+    """The pre-blitting TemperatureMonitor.update_graph"""
+    ax.clear()
+    start_time = time_history[0]
+    time_minutes = [(t - start_time) / 60 for t in time_history]
+    ax.plot(time_minutes, temp_history, color=colors['primary'], linewidth=2,
+            marker='o', markersize=3, label="Temperature (°C)")
+    ax.axhline(y=WARNING_TEMP, color='yellow', linestyle='--', alpha=0.6, label=f'Warning ({WARNING_TEMP}°C)')
+    ax.axhline(y=CRITICAL_TEMP, color='red', linestyle='--', alpha=0.6, label=f'Critical ({CRITICAL_TEMP}°C)')
+    ax.set_xlabel('Time (Minutes)', fontsize=10, fontweight='bold')
+    ax.set_ylabel('Temperature (°C)', fontsize=10, fontweight='bold')
+    ax.set_title('Temperature History', fontsize=12, fontweight='bold', pad=20)
+    ax.legend(fontsize=9, framealpha=0.9)
+    ax.grid(True, alpha=0.2, linestyle='-')
+    current_min = min(temp_history)
+    current_max = max(temp_history)
+    padding = max(2, (current_max - current_min) * 0.1)
+    ax.set_ylim(max(0, current_min - padding), current_max + padding)
+    ax.text(0.5, -0.15, f"Note: Temperatures adjusted by -{ADJUSTMENT}°C to match room temperature",
+            transform=ax.transAxes, fontsize=8, color=colors['text_secondary'],
+            horizontalalignment='center', verticalalignment='top', style='italic')
+    fig.tight_layout(rect=[0, 0.05, 1, 0.95])
+    fig.canvas.draw()
+
+
+def run(label, frame_func, frames):
+    temp_history = deque(maxlen=100)
+    time_history = deque(maxlen=100)
+    frame_times = []
+    for timestamp, temp in samples(frames):
+        temp_history.append(temp)
+        time_history.append(timestamp)
+        start = time.perf_counter()
+        frame_func(time_history, temp_history)
+        frame_times.append(time.perf_counter() - start)
+
+    frame_times.sort()
+    mean = sum(frame_times) / len(frame_times)
+    p95 = frame_times[int(len(frame_times) * 0.95) - 1]
+    print(f"{label:<26} mean {mean * 1000:7.2f} ms   p95 {p95 * 1000:7.2f} ms   max {frame_times[-1] * 1000:7.2f} ms")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    colors = ThemeManager().get_theme()
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    legacy = run("ax.clear() + full redraw",
+                 lambda times, temps: legacy_frame(fig, ax, colors, temps, times), args.frames)
+    plt.close(fig)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    graph = LiveTemperatureGraph(fig, ax, fig.canvas, colors, ADJUSTMENT, WARNING_TEMP, CRITICAL_TEMP)
+    fig.canvas.draw()
+    live = run("set_data + blit",
+               lambda times, temps: graph.update(times, temps, WARNING_TEMP, CRITICAL_TEMP), args.frames)
+    plt.close(fig)
+
+    print(f"\n{graph.blits} blitted frames, {graph.full_draws} full redraws "
+          f"(axis limits changed); speed-up {legacy / live:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
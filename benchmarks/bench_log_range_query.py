@@ -0,0 +1,104 @@
+"""Benchmark: full-scan vs indexed time-range log queries.
+
+Writes a synthetic archive of one-second temperature logs (one .logs file
+and .idx sidecar per day), then times the legacy strptime scan against
+LogManager.get_logs_for_time_range for a few typical windows.
+
+    python benchmarks/bench_log_range_query.py            # one year (~2 GB)
+    python benchmarks/bench_log_range_query.py --days 7
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.logger import LogManager
+from app.core.log_index import LogIndex
+
+
+def legacy_query(log_manager, start_datetime, end_datetime):
+    """The pre-index implementation: read every day in full, strptime each line"""
+    logs = []
+    current_date = start_datetime.date()
+    while current_date <= end_datetime.date():
+        log_file = os.path.join(log_manager.daily_logs_dir,
+                                f"temperature_logs_{current_date.strftime('%Y-%m-%d')}.logs")
+        if os.path.exists(log_file):
+            for log_entry in log_manager._read_log_file_with_encoding(log_file):
+                try:
+                    timestamp_str = log_entry.split(']')[0][1:]
+                    log_datetime = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+                    if start_datetime <= log_datetime <= end_datetime:
+                        logs.append(log_entry)
+                except ValueError:
+                    continue
+        current_date += datetime.timedelta(days=1)
+    return logs
+
+
+def write_archive(logs_dir, first_day, days):
+    for day in range(days):
+        date = first_day + datetime.timedelta(days=day)
+        path = os.path.join(logs_dir, f"temperature_logs_{date.strftime('%Y-%m-%d')}.logs")
+        stamp = datetime.datetime.combine(date, datetime.time())
+        with open(path, 'w', encoding='utf-8') as f:
+            for second in range(86400):
+                ts = (stamp + datetime.timedelta(seconds=second)).strftime("%Y-%m-%d %H:%M:%S")
+                temp = 22.0 + (second % 600) / 100.0
+                f.write(f"[{ts}] 📊 {temp:.1f}°C (Source: Storage (2 devices), Status: Normal)\n")
+        LogIndex(path).build()
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="log_range_bench_")
+    previous_cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            log_manager = LogManager()
+
+        first_day = datetime.date(2025, 1, 1)
+        print(f"Writing {args.days} day(s) of one-second logs to {workdir} ...")
+        write_archive(log_manager.daily_logs_dir, first_day, args.days)
+
+        mid = datetime.datetime.combine(first_day + datetime.timedelta(days=args.days // 2),
+                                        datetime.time(12, 0))
+        queries = [
+            ("10 minutes", mid, mid + datetime.timedelta(minutes=10)),
+            ("1 hour", mid, mid + datetime.timedelta(hours=1)),
+            ("24 hours", mid, mid + datetime.timedelta(hours=24)),
+        ]
+
+        print(f"{'window':<12} {'legacy':>12} {'indexed':>12} {'speedup':>9}  lines")
+        for label, start, end in queries:
+            legacy_time, legacy_logs = timed(legacy_query, log_manager, start, end)
+            indexed_time, indexed_logs = timed(log_manager.get_logs_for_time_range, start, end)
+            assert legacy_logs == indexed_logs, f"{label}: results differ"
+            print(f"{label:<12} {legacy_time * 1000:10.1f}ms {indexed_time * 1000:10.1f}ms "
+                  f"{legacy_time / indexed_time:8.1f}x  {len(indexed_logs)}")
+
+        log_manager.close()
+    finally:
+        os.chdir(previous_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
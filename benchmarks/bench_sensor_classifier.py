@@ -0,0 +1,76 @@
+"""Micro-benchmark: legacy keyword scans vs SensorClassifier.
+
+Runs 10k synthetic sensors through the old per-category ``any(...)`` checks
+and through the compiled, memoised classifier (cold and warm cache).
+
+    python benchmarks/bench_sensor_classifier.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.sensor_classifier import SensorClassifier, STORAGE, GPU, CPU, OTHER
+
+SENSOR_COUNT = 10000
+
+
+def legacy_classify(sensor_name, parent_name):
+    """The pre-classifier logic from StorageTemperatureReader"""
+    keywords = SensorClassifier.CATEGORY_KEYWORDS
+    sensor_lower = sensor_name.lower()
+    parent_lower = parent_name.lower() if parent_name else ""
+
+    def matches(category):
+        return (any(keyword in parent_lower for keyword in keywords[category]) or
+                any(keyword in sensor_lower for keyword in keywords[category]))
+
+    if "temperature" in sensor_lower and matches(STORAGE):
+        return STORAGE
+    if ("temperature" in sensor_lower or "temp" in sensor_lower) and matches(GPU):
+        return GPU
+    if ("temperature" in sensor_lower or "temp" in sensor_lower) and matches(CPU):
+        return CPU
+    return OTHER
+
+
+def make_sensors(count, seed=1):
+    rng = random.Random(seed)
+    names = ["Temperature", "Temp", "CPU Core #{}", "CPU Package", "GPU Core",
+             "Drive Temperature", "Mainboard", "Temperature #{}"]
+    parents = ["Samsung SSD 970 EVO", "WDC WD10EZEX", "Intel Core i7-9700K",
+               "AMD Ryzen 7 5800X", "NVIDIA GeForce RTX 3080", "Radeon RX Vega 64",
+               "Intel SSD 660p", "ITE IT8688E", "Generic Hard Disk", None]
+    sensors = []
+    for i in range(count):
+        name = rng.choice(names).format(rng.randint(1, 16))
+        parent = rng.choice(parents)
+        sensors.append((name, parent, f"/sensor/{i}/temperature/0"))
+    return sensors
+
+
+def timed(label, func, sensors):
+    start = time.perf_counter()
+    results = [func(*sensor) for sensor in sensors]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:8.2f} ms  ({elapsed / len(sensors) * 1e6:6.2f} µs/sensor)")
+    return results
+
+
+def main():
+    sensors = make_sensors(SENSOR_COUNT)
+    classifier = SensorClassifier()
+
+    print(f"Classifying {SENSOR_COUNT} synthetic sensors")
+    legacy = timed("legacy any() scans", lambda n, p, i: legacy_classify(n, p), sensors)
+    cold = timed("classifier (cold cache)", classifier.classify, sensors)
+    warm = timed("classifier (warm cache)", classifier.classify, sensors)
+
+    assert legacy == cold == warm, "classifier disagrees with legacy logic"
+    print("✅ Results identical to legacy classification")
+
+
+if __name__ == "__main__":
+    main()
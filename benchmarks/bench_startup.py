@@ -0,0 +1,176 @@
+"""Startup benchmark: import time and time to the first reading, with budgets.
+
+Part 1 runs ``python -X importtime -c "import app.temperature_monitor"`` in
+fresh interpreters, reports the median cumulative import time and the
+heaviest modules, and checks that the modules loaded after the first reading
+(matplotlib, smtplib, email, plyer, winsound) stay out of the import.
+
+Part 2 starts the GUI in a fresh process (in a scratch directory, so logs and
+settings go there) and times the window, the first dashboard frame, the
+first reading and the end of the deferred startup stage. It needs a display;
+without one it is skipped. The first reading also needs sensors.
+
+Exits with status 1 if anything is over budget, so it can gate a CI job.
+
+    python benchmarks/bench_startup.py [--runs 5] [--import-budget-ms 350]
+                                       [--first-frame-budget-ms 1500]
+                                       [--first-reading-budget-ms 3000]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Must not be imported before the first reading is on screen
+DEFERRED_MODULES = ("matplotlib", "smtplib", "email", "plyer", "winsound")
+
+
+def run_importtime():
+    """{module: (self_us, cumulative_us)} for one cold import of app.temperature_monitor"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app.temperature_monitor"],
+                            capture_output=True, text=True, env=env, cwd=tempfile.gettempdir())
+    if result.returncode != 0:
+        sys.exit(f"import failed:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def bench_imports(runs, budget_ms):
+    totals = []
+    for _ in range(runs):
+        modules = run_importtime()
+        totals.append(modules["app.temperature_monitor"][1] / 1000)
+
+    median = statistics.median(totals)
+    print(f"import app.temperature_monitor   median {median:7.1f} ms   "
+          f"min {min(totals):7.1f} ms   max {max(totals):7.1f} ms   budget {budget_ms} ms")
+
+    print("\nHeaviest imports (cumulative, last run):")
+    heaviest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in heaviest[1:9]:
+        print(f"  {cumulative_us / 1000:7.1f} ms  {name}")
+
+    loaded = sorted({name.split(".")[0] for name in modules} & set(DEFERRED_MODULES))
+    ok = median <= budget_ms
+    if loaded:
+        print(f"\n❌ Loaded at import, should be deferred: {', '.join(loaded)}")
+        ok = False
+    return ok
+
+
+def child(timeout):
+    """Run the GUI until the deferred stage is done; prints event timestamps as JSON"""
+    import tkinter as tk
+    from app.temperature_monitor import TemperatureMonitor
+
+    events = {'imported': time.time()}
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(json.dumps({'error': f"no display ({e})"}))
+        return
+
+    class TimedMonitor(TemperatureMonitor):
+        def update_display(self, adjusted_temp, source):
+            super().update_display(adjusted_temp, source)
+            events.setdefault('first_frame', time.time())
+            if adjusted_temp is not None:
+                events.setdefault('first_reading', time.time())
+
+        def finish_startup(self):
+            super().finish_startup()
+            events.setdefault('startup_complete', time.time())
+
+    monitor = TimedMonitor(root)
+    events['window'] = time.time()
+
+    def poll():
+        done = 'first_reading' in events and 'startup_complete' in events
+        if done or time.time() - events['imported'] > timeout:
+            monitor.on_closing()
+            return
+        root.after(20, poll)
+
+    root.after(20, poll)
+    root.mainloop()
+    print(json.dumps(events))
+
+
+def bench_first_reading(timeout, frame_budget_ms, reading_budget_ms):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    with tempfile.TemporaryDirectory() as scratch:
+        launched = time.time()
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", "--timeout", str(timeout)],
+                                capture_output=True, text=True, env=env, cwd=scratch)
+    lines = result.stdout.strip().splitlines()
+    try:
+        events = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        print(f"\nGUI startup failed:\n{result.stderr[-2000:]}")
+        return False
+
+    if 'error' in events:
+        print(f"\nTime to first reading: skipped, {events['error']}")
+        return True
+
+    print("\nGUI startup (from process launch):")
+    for key, label in (('imported', "modules imported"), ('window', "window built"),
+                       ('first_frame', "first frame"), ('first_reading', "first reading"),
+                       ('startup_complete', "graph + alerting loaded")):
+        if key in events:
+            print(f"  {label:<24} {(events[key] - launched) * 1000:8.1f} ms")
+        else:
+            print(f"  {label:<24}      n/a")
+
+    ok = True
+    first_frame_ms = (events.get('first_frame', launched + timeout) - launched) * 1000
+    if first_frame_ms > frame_budget_ms:
+        print(f"❌ First frame after {first_frame_ms:.0f} ms, budget {frame_budget_ms} ms")
+        ok = False
+    if 'first_reading' in events:
+        first_reading_ms = (events['first_reading'] - launched) * 1000
+        if first_reading_ms > reading_budget_ms:
+            print(f"❌ First reading after {first_reading_ms:.0f} ms, budget {reading_budget_ms} ms")
+            ok = False
+    else:
+        print("  (no sensor reading; only the first frame was checked)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=350)
+    parser.add_argument("--first-frame-budget-ms", type=float, default=1500)
+    parser.add_argument("--first-reading-budget-ms", type=float, default=3000)
+    parser.add_argument("--timeout", type=float, default=15, help="seconds to wait for the first reading")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.timeout)
+        return
+
+    ok = bench_imports(args.runs, args.import_budget_ms)
+    ok = bench_first_reading(args.timeout, args.first_frame_budget_ms, args.first_reading_budget_ms) and ok
+    print("\n✅ Within budget" if ok else "\n❌ Over budget")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from app.core.aggregation import bucket_temperatures, combine_buckets, parse_log_temperatures
+
+
+def loop_buckets(epochs, temps, bucket_seconds, utc_offset=0):
+    """Reference: the same buckets built one sample at a time"""
+    buckets = {}
+    for epoch, temp in zip(epochs, temps):
+        start = (epoch + utc_offset) // bucket_seconds * bucket_seconds - utc_offset
+        buckets.setdefault(start, []).append(temp)
+    starts = sorted(buckets)
+    return (starts,
+            [sum(buckets[s]) / len(buckets[s]) for s in starts],
+            [min(buckets[s]) for s in starts],
+            [max(buckets[s]) for s in starts],
+            [len(buckets[s]) for s in starts])
+
+
+def assert_same(actual, wanted):
+    assert list(actual[0]) == wanted[0]
+    assert list(actual[4]) == wanted[4]
+    for got, expected in zip(actual[1:4], wanted[1:4]):
+        np.testing.assert_allclose(got, expected, rtol=1e-12)
+
+
+def random_samples(count, seed):
+    rng = random.Random(seed)
+    epochs = sorted(rng.randrange(1_700_000_000, 1_700_000_000 + 86400 * 2) for _ in range(count))
+    temps = [round(rng.uniform(15, 35), 1) for _ in range(count)]
+    return epochs, temps
+
+
+@pytest.mark.parametrize("bucket_seconds, utc_offset", [(60, 0), (600, 3600), (3600, -18000), (86400, 19800)])
+def test_bucket_temperatures_matches_a_loop(bucket_seconds, utc_offset):
+    epochs, temps = random_samples(2000, bucket_seconds)
+    assert_same(bucket_temperatures(epochs, temps, bucket_seconds, utc_offset),
+                loop_buckets(epochs, temps, bucket_seconds, utc_offset))
+
+
+def test_empty_input_gives_empty_arrays():
+    for result in (bucket_temperatures([], [], 600),
+                   combine_buckets([], [], [], [], [], 600)):
+        assert [len(array) for array in result] == [0] * 5
+        assert result[4].dtype == np.int64
+
+
+def test_single_sample_buckets():
+    epochs = [0, 700, 1400, 1450]
+    temps = [20.0, 21.5, 22.0, 24.0]
+    bucket_epochs, mean, low, high, counts = bucket_temperatures(epochs, temps, 600)
+    assert list(bucket_epochs) == [0, 600, 1200]
+    assert list(counts) == [1, 1, 2]
+    assert list(mean) == [20.0, 21.5, 23.0]
+    assert list(low) == [20.0, 21.5, 22.0] and list(high) == [20.0, 21.5, 24.0]
+
+    # One sample in total
+    assert_same(bucket_temperatures([125], [19.5], 60), ([120], [19.5], [19.5], [19.5], [1]))
+
+
+@pytest.mark.parametrize("fine, coarse", [(60, 600), (600, 3600), (3600, 86400)])
+def test_combine_buckets_matches_bucketing_the_raw_samples(fine, coarse):
+    epochs, temps = random_samples(3000, coarse)
+    combined = combine_buckets(*bucket_temperatures(epochs, temps, fine, 3600), coarse, 3600)
+    assert_same(combined, loop_buckets(epochs, temps, coarse, 3600))
+
+
+def test_parse_log_temperatures_skips_events_and_unparsable_lines():
+    lines = [
+        "[2026-03-01 10:00:00] 📊 22.5°C (Source: CPU Package, Status: Normal)",
+        "[2026-03-01 10:00:02] 🔧 Settings Update: threshold 30°C",
+        "[2026-03-01 10:00:04] ⚠️ Warning: 26°C (Source: CPU Package)",
+        "[not a timestamp] 📊 23.0°C",
+        "[2026-03-01 10:00:06] no reading here",
+    ]
+    epochs, temps = parse_log_temperatures(lines)
+    base = datetime.datetime(2026, 3, 1, 10, 0, 0).timestamp()
+    assert list(epochs) == [base, base + 4]
+    assert list(temps) == [22.5, 26.0]
@@ -0,0 +1,106 @@
+from app.core.alert_rules import AlertEngine, threshold_rules
+
+
+def run(engine, temps, start=0, step=2):
+    """(time, kind, rule name) for every transition over a series of samples"""
+    events = []
+    for i, temp in enumerate(temps):
+        timestamp = start + i * step
+        for kind, rule, value in engine.evaluate(timestamp, temp):
+            events.append((timestamp, kind, rule.name))
+    return events
+
+
+def test_jump_to_critical_raises_one_alert():
+    engine = AlertEngine.compile(threshold_rules(25, 30))
+    events = run(engine, [22, 22, 31, 31, 31])
+    assert [(kind, name) for _, kind, name in events] == [("alert", "Critical")]
+
+
+def test_warning_that_escalates_is_replaced_by_critical():
+    engine = AlertEngine.compile(threshold_rules(25, 30))
+    events = run(engine, [22, 26, 31, 31, 27, 22])
+    assert [(kind, name) for _, kind, name in events] == [
+        ("alert", "Warning"),
+        ("alert", "Critical"),
+        ("recovery", "Critical"),
+        ("alert", "Warning"),
+        ("recovery", "Warning"),
+    ]
+
+
+def test_critical_excursion_repeats_and_recovers_once():
+    engine = AlertEngine.compile(threshold_rules(25, 30, repeat_seconds=60))
+    events = run(engine, [31] * 40 + [20], step=2)
+    assert [(kind, name) for _, kind, name in events] == [
+        ("alert", "Critical"),
+        ("repeat", "Critical"),
+        ("recovery", "Critical"),
+    ]
+
+
+def test_hysteresis_keeps_alert_until_clear_level():
+    engine = AlertEngine.compile(threshold_rules(25, 30, hysteresis=1.0))
+    events = run(engine, [26, 24.5, 24.2, 23.9])
+    assert [(kind, name) for _, kind, name in events] == [("alert", "Warning"), ("recovery", "Warning")]
+
+
+def test_rate_rule_fires_on_a_fast_rise_and_clears_at_half_the_rise():
+    engine = AlertEngine.compile([{'name': "Rising", 'type': "rate", 'rise': 3, 'within_seconds': 60}])
+    rule = engine.rules[0]
+    assert rule.clear_at == 1.5
+
+    # Rise over the last 60 s: 0, 0, 1, 2, 3.5, 3.5, 3.5, 2.5, 2.5, 1.5, 0
+    events = run(engine, [20, 20, 21, 22, 23.5, 23.5, 23.5, 23.5, 23.5, 23.5, 23.5], step=10)
+    # 1.5 at t=90 is not below the clear level; the low of 22 leaves the window at t=100
+    assert events == [(40, "alert", "Rising"), (100, "recovery", "Rising")]
+
+
+def test_rate_rule_ignores_a_slow_rise():
+    engine = AlertEngine.compile([{'name': "Rising", 'type': "rate", 'rise': 3, 'within_seconds': 60}])
+    # +10 °C over ten minutes, but never more than 1.5 °C within a minute
+    assert run(engine, [20 + 0.5 * i for i in range(21)], step=20) == []
+
+
+def test_for_seconds_needs_the_condition_to_hold():
+    engine = AlertEngine.compile([{'name': "Hot", 'above': 27, 'for_seconds': 300}])
+    # A dip at t=180 restarts the clock; the alert comes 300 s after t=240
+    events = run(engine, [28, 28, 28, 26, 28, 28, 28, 28, 28, 28], step=60)
+    assert events == [(540, "alert", "Hot")]
+
+
+def test_debounce_samples_on_raise_and_clear():
+    engine = AlertEngine.compile([{'name': "Hot", 'above': 27, 'debounce_samples': 3}])
+    events = run(engine, [28, 28, 20, 28, 28, 28, 20, 20, 28, 20, 20, 20])
+    # Two samples are not enough either way; a reading above the clear level resets the count
+    assert events == [(10, "alert", "Hot"), (22, "recovery", "Hot")]
+
+
+def test_rate_rule_can_suppress_a_threshold_rule():
+    engine = AlertEngine.compile([
+        {'name': "Spike", 'type': "rate", 'level': "CRITICAL", 'rise': 3, 'within_seconds': 60},
+        {'name': "Hot", 'above': 25, 'suppressed_by': "Spike"},
+    ])
+    events = run(engine, [20, 20, 26, 26, 26, 26, 26, 26, 26, 26, 20], step=10)
+    # Hot stays quiet while Spike fires and takes over on the sample Spike clears
+    assert events == [
+        (20, "alert", "Spike"),
+        (80, "recovery", "Spike"),
+        (80, "alert", "Hot"),
+        (100, "recovery", "Hot"),
+    ]
+
+
+def test_reconfigure_keeps_firing_state_by_rule_name():
+    engine = AlertEngine.compile(threshold_rules(25, 30))
+    assert run(engine, [31]) == [(0, "alert", "Critical")]
+
+    # New thresholds: Critical is still firing, so no second alert
+    engine = AlertEngine.compile(threshold_rules(24, 29), previous=engine)
+    assert [rule.name for rule in engine.firing()] == ["Critical"]
+    assert run(engine, [31, 31], start=2) == []
+    assert run(engine, [20], start=6) == [(6, "recovery", "Critical")]
+
+    # A rule that did not exist before starts in OK
+    engine = AlertEngine.compile(threshold_rules(25, 30) + [{'name': "Hot", 'above': 27}], previous=engine)
+    assert engine.firing() == []
@@ -0,0 +1,110 @@
+import threading
+import time
+
+from app.core.event_bus import EventBus
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class BlockingHandler:
+    """Records events; each call waits until the gate opens"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.seen = []
+
+    def __call__(self, event):
+        self.entered.set()
+        self.gate.wait(5)
+        self.seen.append(event.data['n'])
+
+
+def test_slow_sink_does_not_block_publisher_or_fast_sink():
+    bus = EventBus()
+    slow = BlockingHandler()
+    fast = []
+    bus.subscribe("slow", slow)
+    bus.subscribe("fast", lambda event: fast.append(event.data['n']))
+
+    started = time.monotonic()
+    for n in range(10):
+        bus.publish("alert", n=n)
+    assert time.monotonic() - started < 0.5
+
+    assert wait_for(lambda: len(fast) == 10)
+    assert fast == list(range(10))
+    assert slow.seen == []
+
+    slow.gate.set()
+    bus.close()
+    assert slow.seen == list(range(10))
+    assert bus.stats()['slow']['delivered'] == bus.stats()['fast']['delivered'] == 10
+
+
+def test_full_queue_drops_the_oldest_events():
+    bus = EventBus()
+    slow = BlockingHandler()
+    sink = bus.subscribe("slow", slow, queue_size=3)
+
+    bus.publish("alert", n=0)
+    assert slow.entered.wait(5)
+    for n in range(1, 6):
+        bus.publish("alert", n=n)
+
+    stats = sink.stats()
+    assert stats['queued'] == 3 and stats['dropped'] == 2
+
+    slow.gate.set()
+    bus.close()
+    # Event 0 was already being handled; 1 and 2 were dropped
+    assert slow.seen == [0, 3, 4, 5]
+    assert sink.stats()['delivered'] == 4
+
+
+def test_deadline_expires_waiting_events_and_counts_late_ones():
+    bus = EventBus()
+    slow = BlockingHandler()
+    sink = bus.subscribe("slow", slow, deadline=0.05)
+
+    bus.publish("alert", n=0)
+    assert slow.entered.wait(5)
+    bus.publish("alert", n=1)
+    bus.publish("alert", n=2)
+    time.sleep(0.15)
+    slow.gate.set()
+    bus.close()
+
+    stats = sink.stats()
+    assert slow.seen == [0]
+    assert stats['delivered'] == 1 and stats['late'] == 1
+    assert stats['expired'] == 2
+    assert stats['max_latency'] >= 0.15
+
+
+def test_topics_filter_and_failing_handler_do_not_stop_the_sink():
+    bus = EventBus()
+    seen = []
+
+    def handler(event):
+        if event.data['n'] == 1:
+            raise RuntimeError("mail server down")
+        seen.append(event.data['n'])
+
+    sink = bus.subscribe("mail", handler, topics=["alert"])
+    for n in range(4):
+        bus.publish("alert", n=n)
+    bus.publish("report", n=99)
+    bus.close()
+
+    assert seen == [0, 2, 3]
+    stats = sink.stats()
+    assert stats['failed'] == 1 and stats['delivered'] == 3 and stats['queued'] == 0
+    assert bus.published == 5
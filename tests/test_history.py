@@ -0,0 +1,46 @@
+import threading
+
+from app.core.history import TemperatureHistory
+
+
+def test_capacity_follows_the_sample_interval():
+    assert TemperatureHistory.for_retention(3600, 2.0).capacity == 1800
+    assert TemperatureHistory.for_retention(3600, 10).capacity == 360
+    assert TemperatureHistory.for_retention(5, 10).capacity == 1
+
+
+def test_min_max_follow_the_retained_window():
+    history = TemperatureHistory(3)
+    assert history.range() == (None, None)
+
+    for t, temp in enumerate([22.0, 30.0, 21.0, 25.0, 24.0, 23.0]):
+        history.append(t, temp)
+
+    assert list(history.temps) == [25.0, 24.0, 23.0]
+    assert history.range() == (23.0, 25.0)
+    assert (history.min, history.max) == (23.0, 25.0)
+
+
+def test_range_is_consistent_while_another_thread_appends():
+    history = TemperatureHistory(50)
+    stop = threading.Event()
+    errors = []
+
+    def append():
+        t = 0
+        while not stop.is_set():
+            history.append(t, 20.0 + t % 7)
+            t += 1
+
+    writer = threading.Thread(target=append)
+    writer.start()
+    try:
+        for _ in range(20000):
+            low, high = history.range()
+            if low is not None and not 20.0 <= low <= high <= 26.0:
+                errors.append((low, high))
+    finally:
+        stop.set()
+        writer.join()
+
+    assert errors == []
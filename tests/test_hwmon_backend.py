@@ -0,0 +1,107 @@
+import os
+import threading
+
+import pytest
+
+from app.services.sensor_backends import LinuxHwmonBackend
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "pread"), reason="needs os.pread")
+
+
+def add_chip(root, hwmon, chip, inputs, model=None):
+    """Fake /sys/class/hwmon/<hwmon>; inputs maps index -> (millidegrees, label or None)"""
+    chip_dir = root / hwmon
+    chip_dir.mkdir()
+    (chip_dir / "name").write_text(chip + "\n")
+    if model:
+        (chip_dir / "device").mkdir()
+        (chip_dir / "device" / "model").write_text(model + "\n")
+    for index, (millidegrees, label) in inputs.items():
+        (chip_dir / f"temp{index}_input").write_text(f"{millidegrees}\n")
+        if label:
+            (chip_dir / f"temp{index}_label").write_text(label + "\n")
+    return chip_dir
+
+
+def by_name(readings):
+    return {reading['name']: reading for reading in readings}
+
+
+def test_reads_labels_values_and_identifiers(tmp_path):
+    add_chip(tmp_path, "hwmon0", "coretemp", {1: (45000, "Package id 0"), 2: (41500, None), 3: (0, "Core 1")})
+    add_chip(tmp_path, "hwmon1", "nvme", {1: (38850, "Composite")}, model="Samsung SSD 970")
+
+    backend = LinuxHwmonBackend(root=str(tmp_path))
+    try:
+        assert backend.initialize(verbose=False)
+        readings = by_name(backend.read_sensors())
+    finally:
+        backend.close()
+
+    # A 0 reading (sensor asleep) is skipped
+    assert set(readings) == {"Package id 0 Temperature", "Temperature #2", "Composite Temperature"}
+    assert readings["Package id 0 Temperature"]['value'] == 45.0
+    assert readings["Package id 0 Temperature"]['identifier'] == "/hwmon0/coretemp/temperature/1"
+    assert readings["Temperature #2"]['value'] == 41.5
+    assert readings["Composite Temperature"]['parent'] == "Samsung SSD 970 (nvme)"
+
+
+def test_cached_descriptors_see_new_values(tmp_path):
+    chip_dir = add_chip(tmp_path, "hwmon0", "k10temp", {1: (50000, "Tctl")})
+    backend = LinuxHwmonBackend(root=str(tmp_path))
+    try:
+        backend.initialize(verbose=False)
+        assert backend.read_sensors()[0]['value'] == 50.0
+        (chip_dir / "temp1_input").write_text("53250\n")
+        assert backend.read_sensors()[0]['value'] == 53.25
+    finally:
+        backend.close()
+
+
+def test_rescan_picks_up_new_devices(tmp_path):
+    add_chip(tmp_path, "hwmon0", "coretemp", {1: (45000, "Package id 0")})
+    backend = LinuxHwmonBackend(root=str(tmp_path), rescan_interval=0)
+    try:
+        backend.initialize(verbose=False)
+        assert len(backend.read_sensors()) == 1
+        add_chip(tmp_path, "hwmon1", "drivetemp", {1: (35000, None)})
+        assert len(backend.read_sensors()) == 2
+    finally:
+        backend.close()
+
+
+def test_rescans_while_another_thread_reads(tmp_path):
+    expected = {}
+    for chip in range(4):
+        inputs = {index: (20000 + chip * 1000 + index * 100, f"Sensor {chip}.{index}") for index in range(1, 6)}
+        add_chip(tmp_path, f"hwmon{chip}", f"chip{chip}", inputs)
+        expected.update({f"{label} Temperature": millidegrees / 1000 for millidegrees, label in inputs.values()})
+
+    backend = LinuxHwmonBackend(root=str(tmp_path))
+    backend.initialize(verbose=False)
+    stop = threading.Event()
+    errors = []
+
+    def poll():
+        while not stop.is_set():
+            try:
+                readings = {reading['name']: reading['value'] for reading in backend.read_sensors()}
+            except Exception as e:
+                errors.append(e)
+                return
+            # A closed or reused descriptor would drop or swap values
+            if readings != expected:
+                errors.append(readings)
+                return
+
+    reader = threading.Thread(target=poll)
+    reader.start()
+    try:
+        for _ in range(200):
+            backend.initialize(verbose=False)
+    finally:
+        stop.set()
+        reader.join()
+        backend.close()
+
+    assert errors == []
@@ -0,0 +1,94 @@
+import queue
+import threading
+from collections import deque
+
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("matplotlib")
+
+from app.ui.live_log import TimeRangeSearchWindow
+
+
+class FakeWidget:
+    def __init__(self):
+        self.inserted = []
+        self.options = {'maximum': 1}
+
+    def config(self, **options):
+        self.options.update(options)
+
+    def cget(self, name):
+        return self.options[name]
+
+    def insert(self, index, text):
+        self.inserted.append(text)
+
+
+class FakeWindow:
+    def __init__(self):
+        self.scheduled = []
+
+    def winfo_exists(self):
+        return True
+
+    def after(self, ms, callback, *args):
+        self.scheduled.append(callback)
+
+
+class FakeVar:
+    def set(self, value):
+        self.value = value
+
+
+def make_search():
+    """A search window's result state without any Tk widgets"""
+    search = TimeRangeSearchWindow.__new__(TimeRangeSearchWindow)
+    search.window = FakeWindow()
+    search.log_text = FakeWidget()
+    search.search_progress = FakeWidget()
+    search.results_var = FakeVar()
+    search.current_logs = []
+    search.pending_lines = deque()
+    search.displayed_count = 0
+    search.search_status = None
+    search.search_results = queue.Queue()
+    search.search_cancel = threading.Event()
+    search.finished = []
+    search.finish_search = search.finished.append
+    return search
+
+
+def lines(day, count):
+    return [f"[2026-03-0{day} 10:00:00] 📊 22.0°C line {i}" for i in range(count)]
+
+
+def test_results_queued_before_cancel_are_not_shown():
+    search = make_search()
+    search.search_results.put(('lines', lines(1, 1500), 1))
+    search.search_results.put(('lines', lines(2, 1500), 2))
+    search._poll_search_results()
+    assert search.displayed_count == TimeRangeSearchWindow.RESULT_CHUNK_LINES
+
+    # The worker queues more before it notices the cancel
+    search.search_results.put(('lines', lines(3, 1500), 3))
+    search.search_results.put(('done', 'complete'))
+    search.cancel_search()
+    search._poll_search_results()
+
+    assert len(search.current_logs) == TimeRangeSearchWindow.RESULT_CHUNK_LINES
+    assert len(search.log_text.inserted) == 1
+    assert search.finished == [('done', 'cancelled')]
+
+
+def test_results_stream_in_chunks_until_done():
+    search = make_search()
+    search.search_results.put(('lines', lines(1, 2500), 1))
+    search.search_results.put(('done', 'complete'))
+
+    search._poll_search_results()
+    assert search.finished == []
+    search._poll_search_results()
+
+    assert search.displayed_count == len(search.current_logs) == 2500
+    assert search.finished == [('done', 'complete')]
@@ -0,0 +1,65 @@
+import datetime
+import os
+
+from app.core.log_index import LogIndex
+from app.core.log_record import LogRecord
+from app.core.logger import LogManager
+
+
+def write_log(path, stamps):
+    with open(path, 'wb') as f:
+        for stamp in stamps:
+            f.write(f"[{stamp}] 🔧 Test: line\n".encode('utf-8'))
+
+
+def lines_in(path, start, end):
+    index = LogIndex.load(path)
+    first, last = index.byte_range(start, end)
+    with open(path, 'rb') as f:
+        f.seek(first)
+        data = f.read() if last is None else f.read(last - first)
+    return [line for line in data.decode('utf-8').splitlines()
+            if start <= LogIndex.minute_of(line) <= end]
+
+
+def test_ordered_log_seeks_to_minutes(tmp_path):
+    path = str(tmp_path / "temperature_logs_2026-01-02.logs")
+    write_log(path, [f"2026-01-02 00:{m:02d}:00" for m in range(10)])
+    index = LogIndex.load(path)
+    assert index.ordered
+    assert index.byte_range(3, 4)[0] > 0
+    assert len(lines_in(path, 3, 4)) == 2
+
+
+def test_line_from_before_midnight_does_not_hide_the_day(tmp_path):
+    path = str(tmp_path / "temperature_logs_2026-01-02.logs")
+    write_log(path, ["2026-01-01 23:59:59"] + [f"2026-01-02 00:{m:02d}:00" for m in range(10)])
+    assert len(lines_in(path, 3, 4)) == 2
+
+    # The fallback is persisted in the sidecar
+    assert not LogIndex.load(path).ordered
+
+
+def test_poisoned_sidecar_is_rebuilt(tmp_path):
+    path = str(tmp_path / "temperature_logs_2026-01-02.logs")
+    write_log(path, ["2026-01-01 23:59:59"] + [f"2026-01-02 00:{m:02d}:00" for m in range(10)])
+    # What an older writer left behind: only the out-of-order first minute
+    with open(path + LogIndex.SUFFIX, 'wb') as f:
+        f.write(LogIndex.RECORD.pack(1439, 0))
+    assert len(lines_in(path, 3, 4)) == 2
+
+
+def test_record_goes_to_the_file_of_its_own_day(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = LogManager()
+    yesterday = datetime.datetime.combine(datetime.date.today() - datetime.timedelta(days=1),
+                                          datetime.time(23, 59, 59)).timestamp()
+    manager._log(LogRecord(yesterday, LogRecord.SYSTEM, source="Test", message="late line"))
+    manager.log_system_event("Test", "today")
+    manager.close()
+
+    assert os.path.basename(manager.log_file_for(yesterday)) in os.listdir(manager.daily_logs_dir)
+    with open(manager.log_file_for(yesterday), encoding='utf-8') as f:
+        assert "late line" in f.read()
+    with open(manager.get_current_log_file(), encoding='utf-8') as f:
+        assert "late line" not in f.read()
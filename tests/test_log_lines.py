@@ -0,0 +1,164 @@
+import pytest
+
+from app.core.log_lines import LiveLogSource, LogLineIndex
+from app.core.log_record import LogRecord, LogRing
+
+
+def write_day(tmp_path, day, lines, partial=""):
+    path = tmp_path / f"temperature_logs_2026-03-0{day}.logs"
+    with open(path, 'ab') as f:
+        f.write("".join(line + "\n" for line in lines).encode('utf-8') + partial.encode('utf-8'))
+    return str(path)
+
+
+def day_lines(day, count):
+    # Varying lengths and a multi-byte character, so offsets are not regular
+    return [f"[2026-03-0{day} 10:00:00] 📊 {20 + i % 7}.{i % 10}°C line {i}" + "x" * (i % 5)
+            for i in range(count)]
+
+
+@pytest.mark.parametrize("stride, chunk", [(LogLineIndex.STRIDE, LogLineIndex.SCAN_CHUNK), (4, 97)])
+def test_lookups_at_checkpoint_boundaries(tmp_path, stride, chunk):
+    lines = day_lines(1, 3 * stride + 5)
+    write_day(tmp_path, 1, lines)
+    index = LogLineIndex(str(tmp_path))
+    index.STRIDE = stride
+    index.SCAN_CHUNK = chunk
+    assert index.refresh()
+    assert index.line_count == len(lines)
+
+    for first in (0, 1, stride - 1, stride, stride + 1, 2 * stride - 1, 2 * stride, 3 * stride, len(lines) - 1):
+        for count in (1, 2, stride + 1):
+            assert index.get_lines(first, count) == lines[first:first + count], (first, count)
+    assert index.get_lines(len(lines), 5) == []
+    assert index.get_lines(-1, 5) == []
+
+
+def test_lines_continue_across_daily_files(tmp_path):
+    first_day, second_day = day_lines(1, 300), day_lines(2, 10)
+    write_day(tmp_path, 1, first_day)
+    write_day(tmp_path, 2, second_day)
+    index = LogLineIndex(str(tmp_path))
+    index.refresh()
+
+    everything = first_day + second_day
+    assert index.line_count == 310
+    assert index.get_lines(295, 10) == everything[295:305]
+    assert index.get_lines(300, 50) == second_day
+
+
+def test_refresh_counts_a_partial_line_once_it_is_complete(tmp_path):
+    lines = day_lines(1, 6)
+    path = write_day(tmp_path, 1, lines[:5], partial=lines[5][:10])
+    index = LogLineIndex(str(tmp_path))
+    index.STRIDE = 4
+    index.refresh()
+    assert index.line_count == 5
+    assert index.refresh() is False
+
+    with open(path, 'ab') as f:
+        f.write((lines[5][10:] + "\n").encode('utf-8'))
+    assert index.refresh() is True
+    assert index.get_lines(0, 10) == lines
+    # The checkpoint for line 4 was taken in the first scan
+    assert index.get_lines(4, 2) == lines[4:6]
+
+
+def test_refresh_stops_at_the_end_position(tmp_path):
+    first_day = day_lines(1, 10)
+    path = write_day(tmp_path, 1, first_day)
+    write_day(tmp_path, 2, day_lines(2, 3))
+    end_offset = sum(len((line + "\n").encode('utf-8')) for line in first_day[:7])
+
+    index = LogLineIndex(str(tmp_path))
+    index.refresh(end=(path, end_offset))
+    assert index.line_count == 7
+    assert index.get_lines(0, 20) == first_day[:7]
+
+    index.refresh()
+    assert index.line_count == 13
+
+
+class FakeLogManager:
+    """Ring plus one daily file, written on demand like the LogManager writer thread"""
+
+    def __init__(self, logs_dir, capacity=20, read_only=False):
+        self.daily_logs_dir = str(logs_dir)
+        self.read_only = read_only
+        self.log_buffer = LogRing(capacity)
+        self.path = str(logs_dir / "temperature_logs_2026-03-01.logs")
+        self.lines = []
+        self._written = (0, self.path, 0)
+
+    def log(self, n):
+        record = LogRecord(1772359200 + n, LogRecord.TEMPERATURE, temp=20.0 + n % 10,
+                           source=f"sensor {n}", status="Normal")
+        self.log_buffer.append(record)
+        self.lines.append(record.format())
+
+    def write(self):
+        """Write every logged line to the file"""
+        seq, path, offset = self._written
+        data = "".join(line + "\n" for line in self.lines[seq:]).encode('utf-8')
+        with open(self.path, 'ab') as f:
+            f.write(data)
+        self._written = (len(self.lines), self.path, offset + len(data))
+
+    def written_position(self):
+        return self._written
+
+
+def test_live_source_joins_the_file_and_the_ring_without_gaps(tmp_path):
+    manager = FakeLogManager(tmp_path)
+    for n in range(5):
+        manager.log(n)
+    manager.write()
+    for n in range(5, 8):
+        manager.log(n)
+
+    source = LiveLogSource(manager)
+    assert source.index.line_count == 5 and len(source.records) == 3
+    assert source.get_lines(0, 100) == manager.lines
+    assert source.get_lines(4, 2) == manager.lines[4:6]
+
+    manager.log(8)
+    assert source.refresh() is True
+    assert source.refresh() is False
+    assert source.get_lines(0, 100) == manager.lines
+
+
+def test_live_source_rebases_before_the_ring_drops_unseen_records(tmp_path):
+    manager = FakeLogManager(tmp_path, capacity=8)
+    source = LiveLogSource(manager)
+
+    # More than the ring holds, all written to disk meanwhile
+    for n in range(30):
+        manager.log(n)
+    manager.write()
+    assert source.refresh() is True
+    assert source.line_count == 30
+    assert source.get_lines(0, 100) == manager.lines
+
+    # Past half the ring's capacity the source moves onto the file
+    for n in range(30, 35):
+        manager.log(n)
+    manager.write()
+    source.refresh()
+    assert source.records == []
+    assert source.get_lines(28, 10) == manager.lines[28:35]
+
+
+def test_read_only_source_follows_the_files(tmp_path):
+    writer = FakeLogManager(tmp_path)
+    for n in range(3):
+        writer.log(n)
+    writer.write()
+
+    viewer = FakeLogManager(tmp_path, read_only=True)
+    source = LiveLogSource(viewer)
+    assert source.get_lines(0, 10) == writer.lines
+
+    writer.log(3)
+    writer.write()
+    assert source.refresh() is True
+    assert source.get_lines(3, 1) == writer.lines[3:]
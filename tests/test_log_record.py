@@ -0,0 +1,53 @@
+from app.core.log_record import LogRecord, LogRing
+
+
+def record(n):
+    return LogRecord(1772359200 + n, LogRecord.TEMPERATURE, temp=20.0 + n, source="CPU", status="Normal")
+
+
+def temps(records):
+    return [int(r.temp - 20) for r in records]
+
+
+def test_since_before_the_ring_fills():
+    ring = LogRing(5)
+    assert [ring.append(record(n)) for n in range(3)] == [0, 1, 2]
+    new, complete = ring.since(1)
+    assert temps(new) == [1, 2] and complete
+    assert ring.since(3) == ([], True)
+    assert ring.since(10) == ([], True)
+
+
+def test_since_after_wraparound():
+    ring = LogRing(5)
+    for n in range(12):
+        ring.append(record(n))
+    assert len(ring) == 5 and ring.total == 12
+
+    # Sequence numbers 7..11 are held
+    new, complete = ring.since(7)
+    assert temps(new) == [7, 8, 9, 10, 11] and complete
+    new, complete = ring.since(10)
+    assert temps(new) == [10, 11] and complete
+    new, complete = ring.since(6)
+    assert temps(new) == [7, 8, 9, 10, 11] and not complete
+    new, complete = ring.since(0)
+    assert temps(new) == [7, 8, 9, 10, 11] and not complete
+    assert ring.since(12) == ([], True)
+
+
+def test_latest_returns_the_newest_oldest_first():
+    ring = LogRing(4)
+    for n in range(6):
+        ring.append(record(n))
+    assert temps(ring.latest(2)) == [4, 5]
+    assert temps(ring.latest(10)) == [2, 3, 4, 5]
+
+
+def test_format_matches_the_log_file_lines():
+    line = record(0).format()
+    assert line.endswith("📊 20.0°C (Source: CPU, Status: Normal)")
+    alert = LogRecord(1772359200, LogRecord.ALERT, temp=31.25, source="CPU", status="CRITICAL").format()
+    assert alert.endswith("⚠️ CRITICAL: 31.2°C (Source: CPU)")
+    system = LogRecord(1772359200, LogRecord.SYSTEM, source="System Start", message="ready").format()
+    assert system.endswith("🔧 System Start: ready")
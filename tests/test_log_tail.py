@@ -0,0 +1,78 @@
+from app.core.log_tail import LogTailer
+
+
+def make_tailer(tmp_path, name="day1.logs"):
+    current = {'path': str(tmp_path / name)}
+    return LogTailer(lambda: current['path']), current
+
+
+def append(path, text):
+    with open(path, 'ab') as f:
+        f.write(text.encode('utf-8'))
+
+
+def test_partial_last_line_waits_for_its_newline(tmp_path):
+    tailer, current = make_tailer(tmp_path)
+    append(current['path'], "line 1\nline 2\nline")
+    assert tailer.read_new() == ["line 1", "line 2"]
+    assert tailer.read_new() == []
+
+    append(current['path'], " 3 °C\n")
+    assert tailer.read_new() == ["line 3 °C"]
+    assert tailer.offset == len("line 1\nline 2\nline 3 °C\n".encode('utf-8'))
+
+
+def test_split_multibyte_character_is_not_garbled(tmp_path):
+    tailer, current = make_tailer(tmp_path)
+    data = "22.0°C\n".encode('utf-8')
+    with open(current['path'], 'wb') as f:
+        f.write(data[:5])
+    assert tailer.read_new() == []
+    with open(current['path'], 'ab') as f:
+        f.write(data[5:])
+    assert tailer.read_new() == ["22.0°C"]
+
+
+def test_rollover_finishes_the_old_file_first(tmp_path):
+    tailer, current = make_tailer(tmp_path)
+    old_path = current['path']
+    append(old_path, "23:59:58\n")
+    assert tailer.read_new() == ["23:59:58"]
+
+    # Late lines in yesterday's file, including one without a newline
+    append(old_path, "23:59:59\nlast")
+    current['path'] = str(tmp_path / "day2.logs")
+    append(current['path'], "00:00:01\n00:00:0")
+
+    assert tailer.read_new() == ["23:59:59", "last", "00:00:01"]
+    assert tailer.path == current['path']
+    append(current['path'], "2\n")
+    assert tailer.read_new() == ["00:00:02"]
+
+
+def test_rollover_to_a_file_not_created_yet(tmp_path):
+    tailer, current = make_tailer(tmp_path)
+    append(current['path'], "a\n")
+    assert tailer.read_new() == ["a"]
+    current['path'] = str(tmp_path / "day2.logs")
+    assert tailer.read_new() == []
+    append(current['path'], "b\n")
+    assert tailer.read_new() == ["b"]
+
+
+def test_seek_to_end_skips_existing_lines(tmp_path):
+    tailer, current = make_tailer(tmp_path)
+    append(current['path'], "old\n")
+    tailer.seek_to_end()
+    assert tailer.read_new() == []
+    append(current['path'], "new\r\n\n")
+    assert tailer.read_new() == ["new"]
+
+
+def test_truncated_file_is_read_from_the_start(tmp_path):
+    tailer, current = make_tailer(tmp_path)
+    append(current['path'], "first line\nsecond line\n")
+    assert len(tailer.read_new()) == 2
+    with open(current['path'], 'wb') as f:
+        f.write(b"replaced\n")
+    assert tailer.read_new() == ["replaced"]
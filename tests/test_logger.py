@@ -0,0 +1,34 @@
+import queue
+import threading
+import time
+
+from app.core.logger import LogManager
+
+
+def test_flush_gives_up_when_the_queue_stays_full(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(LogManager, "QUEUE_SIZE", 4)
+    manager = LogManager()
+    try:
+        # Stall the writer in the middle of a write (a slow disk)
+        manager._file_lock.acquire()
+        manager.log_system_event("Test", "stalls the writer")
+        stalled = threading.Event()
+        manager._write_queue.put(stalled)
+        while not manager._write_queue.empty():
+            time.sleep(0.01)
+        try:
+            while True:
+                manager._write_queue.put_nowait(threading.Event())
+        except queue.Full:
+            pass
+
+        started = time.monotonic()
+        assert manager.flush(timeout=0.2) is False
+        assert time.monotonic() - started < 1.0
+    finally:
+        manager._file_lock.release()
+
+    assert manager.flush(timeout=5.0) is True
+    assert stalled.is_set()
+    manager.close()
@@ -0,0 +1,197 @@
+import os
+import smtplib
+import socket
+import threading
+import time
+import warnings
+from email.message import EmailMessage
+
+import pytest
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    asyncore = pytest.importorskip("asyncore")
+    smtpd = pytest.importorskip("smtpd")
+
+from app.services import mail_outbox
+from app.services.mail_outbox import MailOutbox
+
+
+class FakeChannel(smtpd.SMTPChannel):
+    def smtp_RCPT(self, arg):
+        if arg and "refused" in arg:
+            self.push("550 5.1.1 No such user")
+            return
+        super().smtp_RCPT(arg)
+
+
+class FakeSMTPServer(smtpd.SMTPServer):
+    """Plain SMTP server on localhost; replies[i] answers the i-th DATA (None accepts)"""
+
+    channel_class = FakeChannel
+
+    def __init__(self, replies=()):
+        super().__init__(("127.0.0.1", 0), None, decode_data=False)
+        self.port = self.socket.getsockname()[1]
+        self.replies = list(replies)
+        self.connections = 0
+        self.messages = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while not self._stop.is_set():
+            asyncore.loop(timeout=0.02, count=1)
+
+    def handle_accepted(self, conn, addr):
+        self.connections += 1
+        super().handle_accepted(conn, addr)
+
+    def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+        reply = self.replies.pop(0) if self.replies else None
+        if reply is None:
+            self.messages.append(data)
+        return reply
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        asyncore.close_all()
+
+
+def plain_smtp(config, timings=None):
+    # The fake server has no STARTTLS or AUTH
+    return smtplib.SMTP(config['smtp_server'], config['smtp_port'], timeout=5)
+
+
+def make_message(subject, to="admin@example.com"):
+    msg = EmailMessage()
+    msg['From'] = "monitor@example.com"
+    msg['To'] = to
+    msg['Subject'] = subject
+    msg.set_content("Temperature report")
+    return msg
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    monkeypatch.setattr(mail_outbox, "open_smtp", plain_smtp)
+    monkeypatch.setattr(MailOutbox, "RETRY_INITIAL", 0.05)
+    servers = []
+
+    def start(replies=()):
+        server = FakeSMTPServer(replies)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def make_outbox(tmp_path, port, results=None):
+    config = {'smtp_server': "127.0.0.1", 'smtp_port': port}
+    on_result = None if results is None else (lambda *result: results.append(result))
+    return MailOutbox(config, str(tmp_path / "outbox"), on_result)
+
+
+def queued_files(tmp_path):
+    return [name for name in os.listdir(tmp_path / "outbox") if name.endswith(".eml")]
+
+
+def test_messages_share_one_connection_without_the_kind_header(tmp_path, smtp_server):
+    server = smtp_server()
+    outbox = make_outbox(tmp_path, server.port)
+    try:
+        for i in range(3):
+            outbox.send(make_message(f"Report {i}"), kind="Report")
+        assert wait_for(lambda: outbox.sent == 3)
+    finally:
+        outbox.close()
+
+    assert server.connections == 1
+    assert len(server.messages) == 3
+    assert all(b"X-Monitor-Kind" not in data for data in server.messages)
+    assert queued_files(tmp_path) == []
+
+
+def test_temporary_rejection_is_retried(tmp_path, smtp_server):
+    server = smtp_server(replies=["451 4.3.0 Try again later"])
+    results = []
+    outbox = make_outbox(tmp_path, server.port, results)
+    try:
+        outbox.send(make_message("Alert"), kind="Alert")
+        assert wait_for(lambda: outbox.sent == 1)
+    finally:
+        outbox.close()
+
+    assert len(server.messages) == 1
+    assert outbox.failed == 0
+    (_, error, permanent), (_, done, _) = results
+    assert error.smtp_code == 451 and not permanent
+    assert done is None
+
+
+def test_permanent_rejection_moves_message_to_failed(tmp_path, smtp_server):
+    server = smtp_server(replies=["554 5.7.1 Message rejected"])
+    results = []
+    outbox = make_outbox(tmp_path, server.port, results)
+    try:
+        outbox.send(make_message("Alert"), kind="Alert")
+        assert wait_for(lambda: outbox.failed == 1)
+    finally:
+        outbox.close()
+
+    assert server.messages == []
+    assert queued_files(tmp_path) == []
+    assert len(os.listdir(tmp_path / "outbox" / "failed")) == 1
+    assert results == [("Alert", results[0][1], True)]
+
+
+def test_refused_recipients_are_permanent(tmp_path, smtp_server):
+    server = smtp_server()
+    results = []
+    outbox = make_outbox(tmp_path, server.port, results)
+    try:
+        outbox.send(make_message("Alert", to="refused@example.com"), kind="Alert")
+        assert wait_for(lambda: outbox.failed == 1)
+    finally:
+        outbox.close()
+
+    assert isinstance(results[0][1], smtplib.SMTPRecipientsRefused)
+    assert results[0][2] is True
+    assert len(os.listdir(tmp_path / "outbox" / "failed")) == 1
+
+
+def test_unsent_mail_is_delivered_after_a_restart(tmp_path, smtp_server):
+    # Nothing listens on this port, so the first outbox keeps retrying
+    outbox = make_outbox(tmp_path, free_port())
+    outbox.send(make_message("Report"), kind="Report")
+    outbox.close()
+    assert len(queued_files(tmp_path)) == 1
+
+    server = smtp_server()
+    outbox = make_outbox(tmp_path, server.port)
+    try:
+        assert wait_for(lambda: outbox.sent == 1)
+    finally:
+        outbox.close()
+
+    assert len(server.messages) == 1
+    assert queued_files(tmp_path) == []
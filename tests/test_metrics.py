@@ -0,0 +1,30 @@
+import urllib.request
+
+from app.services.metrics import MetricsExporter
+
+
+def scrape(exporter):
+    host, port = exporter.address
+    with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+        return response.read().decode('utf-8')
+
+
+def test_identical_drives_get_separate_series():
+    sensors = {'storage': [
+        {'name': "Temperature", 'value': 35.0, 'parent': "Samsung SSD 970 EVO", 'identifier': "/hdd/0/temperature/0"},
+        {'name': "Temperature", 'value': 38.0, 'parent': "Samsung SSD 970 EVO", 'identifier': "/hdd/1/temperature/0"},
+    ]}
+    exporter = MetricsExporter(0)
+    try:
+        exporter.update(15.0, "Samsung SSD 970 EVO", "Normal", sensors)
+        lines = [line for line in scrape(exporter).splitlines()
+                 if line.startswith("room_temperature_sensor_celsius{")]
+    finally:
+        exporter.close()
+
+    assert lines == [
+        'room_temperature_sensor_celsius{sensor="Temperature",identifier="/hdd/0/temperature/0",'
+        'parent="Samsung SSD 970 EVO",category="storage"} 35.0',
+        'room_temperature_sensor_celsius{sensor="Temperature",identifier="/hdd/1/temperature/0",'
+        'parent="Samsung SSD 970 EVO",category="storage"} 38.0',
+    ]
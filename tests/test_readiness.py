@@ -0,0 +1,155 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import readiness
+from app.services.readiness import SensorReadinessProbe
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeBackend:
+    name = "Fake"
+
+    def __init__(self, ready_on_attempt=None, requires_openhardware_monitor=True):
+        self.ready_on_attempt = ready_on_attempt
+        self.requires_openhardware_monitor = requires_openhardware_monitor
+        self.attempts = 0
+
+    def initialize(self, verbose=True):
+        self.attempts += 1
+        return self.ready_on_attempt is not None and self.attempts >= self.ready_on_attempt
+
+    def is_available(self):
+        return True
+
+
+class FakeProcess:
+    """poll() reports the exit code from the given call on"""
+
+    def __init__(self, exits_on_poll, returncode=1):
+        self.exits_on_poll = exits_on_poll
+        self.polls = 0
+        self.returncode = None
+        self._code = returncode
+
+    def poll(self):
+        self.polls += 1
+        if self.polls >= self.exits_on_poll:
+            self.returncode = self._code
+        return self.returncode
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(readiness, "time", clock)
+    return clock
+
+
+def probe_for(backend, process=None):
+    results = []
+    probe = SensorReadinessProbe(SimpleNamespace(backend=backend), process=process,
+                                 on_ready=lambda probe: results.append("ready"),
+                                 on_failed=lambda probe: results.append(probe.failure_reason))
+    return probe, results
+
+
+def test_backoff_doubles_up_to_four_seconds_and_times_out_at_thirty(clock):
+    probe, results = probe_for(FakeBackend())
+    probe._run()
+
+    assert clock.sleeps == [0.25, 0.5, 1.0, 2.0, 4.0, 4.0, 4.0, 4.0, 4.0, 4.0, 2.25]
+    assert sum(clock.sleeps) == 30.0
+    assert probe.state == SensorReadinessProbe.FAILED
+    assert probe.attempts == 12
+    assert results == ["Sensors not ready after 30s"]
+    assert probe.wait(0) is False
+
+
+def test_ready_as_soon_as_the_backend_initializes(clock):
+    probe, results = probe_for(FakeBackend(ready_on_attempt=4))
+    assert probe.is_warming_up
+    probe._run()
+
+    assert clock.sleeps == [0.25, 0.5, 1.0]
+    assert probe.state == SensorReadinessProbe.READY and not probe.is_warming_up
+    assert probe.attempts == 4
+    assert results == ["ready"]
+
+
+def test_exited_process_fails_without_waiting_for_the_timeout(clock):
+    process = FakeProcess(exits_on_poll=3, returncode=5)
+    probe, results = probe_for(FakeBackend(), process)
+    probe._run()
+
+    assert clock.sleeps == [0.25, 0.5]
+    assert probe.state == SensorReadinessProbe.FAILED
+    assert results == ["OpenHardwareMonitor exited (code 5)"]
+
+
+def test_probe_thread_reports_through_wait(clock):
+    probe, results = probe_for(FakeBackend(ready_on_attempt=1))
+    assert probe.start().wait(5) is True
+    # Callbacks run after wait() is released
+    probe._thread.join(5)
+    assert results == ["ready"]
+
+
+class FakeReader:
+    def __init__(self, backend):
+        self.backend = backend
+        self.probes = 0
+
+    def run_openhardware_monitor(self):
+        return True
+
+    def start_readiness_probe(self, on_ready=None, on_failed=None):
+        self.probes += 1
+
+
+class FakeLog:
+    def __init__(self):
+        self.events = []
+
+    def log_system_event(self, event, details):
+        self.events.append((event, details))
+
+
+@pytest.mark.parametrize("requires_ohm, probes", [(False, 0), (True, 1)])
+def test_collector_probes_only_for_openhardware_monitor(requires_ohm, probes):
+    from app.collector import Collector
+
+    collector = SimpleNamespace(temp_reader=FakeReader(FakeBackend(requires_openhardware_monitor=requires_ohm)),
+                                log_manager=FakeLog())
+    Collector.start_sensors(collector)
+
+    assert collector.temp_reader.probes == probes
+    if not requires_ohm:
+        assert collector.log_manager.events == [("Sensors Ready", "Fake")]
+
+
+@pytest.mark.parametrize("requires_ohm, probes", [(False, 0), (True, 1)])
+def test_window_probes_only_for_openhardware_monitor(requires_ohm, probes):
+    pytest.importorskip("tkinter")
+    from app.temperature_monitor import TemperatureMonitor
+
+    scheduled = []
+    window = SimpleNamespace(temp_reader=FakeReader(FakeBackend(requires_openhardware_monitor=requires_ohm)),
+                             root=SimpleNamespace(after=lambda ms, callback, *args: scheduled.append(callback)))
+    window.on_sensors_ready = "ready"
+    TemperatureMonitor.start_openhardware_monitor(window)
+
+    assert window.temp_reader.probes == probes
+    assert scheduled == ([] if requires_ohm else ["ready"])
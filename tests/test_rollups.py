@@ -0,0 +1,147 @@
+import datetime
+import json
+
+import numpy as np
+import pytest
+
+from app.core.aggregation import bucket_temperatures
+from app.core.rollups import RollupStore
+from app.core.sample_store import SampleStore
+
+START = int(datetime.datetime(2026, 3, 1, 0, 0, 0).timestamp()) + 13
+STEP = 7
+
+
+def add_samples(store, start, count):
+    """Samples every STEP seconds from start; returns their (epochs, float32 temps)"""
+    epochs = start + STEP * np.arange(count)
+    temps = (22 + 4 * np.sin(np.arange(count) / 300.0) + (np.arange(count) % 11) * 0.1).astype(np.float32)
+    for epoch, temp in zip(epochs, temps):
+        store.append(float(temp), "CPU Package", timestamp=int(epoch))
+    store.flush()
+    return epochs, temps.astype(np.float64)
+
+
+def expected(epochs, temps, start, end, width, utc_offset):
+    mask = (epochs >= start) & (epochs < end)
+    return bucket_temperatures(epochs[mask], temps[mask], width, utc_offset)
+
+
+def assert_buckets_equal(actual, wanted):
+    assert np.array_equal(actual[0], wanted[0])
+    assert np.array_equal(actual[4], wanted[4])
+    np.testing.assert_allclose(actual[1], wanted[1], rtol=1e-5)
+    np.testing.assert_allclose(actual[2], wanted[2], rtol=1e-6)
+    np.testing.assert_allclose(actual[3], wanted[3], rtol=1e-6)
+
+
+@pytest.fixture
+def store(tmp_path):
+    sample_store = SampleStore(str(tmp_path / "samples"))
+    # Three days of samples
+    epochs, temps = add_samples(sample_store, START, 3 * 86400 // STEP)
+    yield sample_store, epochs, temps
+    sample_store.close()
+
+
+def test_summary_counts_only_samples_inside_the_range(tmp_path, store):
+    sample_store, epochs, temps = store
+    rollups = RollupStore(str(tmp_path / "rollups"), sample_store)
+    rollups.update(now=epochs[-1] + 600)
+
+    # Mid-minute edges, a span covering every level
+    start, end = START + 3600 * 5 + 37, START + 86400 * 2 + 3600 * 7 + 23
+    mask = (epochs >= start) & (epochs < end)
+    mean, low, high, count, rows_read = rollups.summary(start, end)
+
+    assert count == int(mask.sum())
+    assert low == pytest.approx(temps[mask].min())
+    assert high == pytest.approx(temps[mask].max())
+    assert mean == pytest.approx(temps[mask].mean(), rel=1e-6)
+    # Most of the range comes from coarse rows, not raw samples
+    assert rows_read < 200
+
+
+@pytest.mark.parametrize("width", [60, 600, 3600, 86400])
+def test_buckets_match_raw_aggregation(tmp_path, store, width):
+    sample_store, epochs, temps = store
+    rollups = RollupStore(str(tmp_path / "rollups"), sample_store)
+    rollups.update(now=epochs[-1] + 600)
+
+    start, end = START + 1234, START + 86400 * 2 + 4321
+    assert_buckets_equal(rollups.buckets(start, end, width),
+                         expected(epochs, temps, start, end, width, rollups.utc_offset))
+
+
+def test_minutes_not_rolled_up_yet_come_from_raw_samples(tmp_path, store):
+    sample_store, epochs, temps = store
+    rollups = RollupStore(str(tmp_path / "rollups"), sample_store)
+    # Roll up only the first two days
+    rollups.update(now=START + 2 * 86400)
+
+    start, end = START + 86400 + 17, int(epochs[-1]) + 1
+    rows = rollups.rows(start, end)
+    assert int(rows['count'].sum()) == int(((epochs >= start) & (epochs < end)).sum())
+    assert_buckets_equal(rollups.buckets(start, end, 3600),
+                         expected(epochs, temps, start, end, 3600, rollups.utc_offset))
+
+
+def test_incremental_update_matches_a_rebuild(tmp_path, store):
+    sample_store, epochs, temps = store
+    rollups = RollupStore(str(tmp_path / "rollups"), sample_store)
+    # "now" is just after the newest sample, so its minute is still open
+    assert rollups.update(now=epochs[-1] + 1) > 0
+
+    # New samples after the first update, some in that open minute
+    more_epochs, more_temps = add_samples(sample_store, int(epochs[-1]) + STEP, 5000)
+    now = more_epochs[-1] + 1
+    assert rollups.update(now=now) > 0
+    assert rollups.update(now=now) == 0
+
+    rebuilt = RollupStore(str(tmp_path / "rebuilt"), sample_store)
+    rebuilt.rebuild(str(tmp_path), now=now)
+    for name, _ in RollupStore.LEVELS:
+        assert np.array_equal(rollups._read(name), rebuilt._read(name)), name
+        assert rollups.processed_until[name] == rebuilt.processed_until[name]
+
+
+def test_state_survives_a_restart_and_drops_rows_after_it(tmp_path, store):
+    sample_store, epochs, temps = store
+    rollups = RollupStore(str(tmp_path / "rollups"), sample_store)
+    rollups.update(now=epochs[-1] + 60)
+    minutes = rollups._read("1min")
+
+    # A crash after writing rows but before saving state.json
+    unsaved = minutes[-3:].copy()
+    unsaved['epoch'] = rollups.processed_until["1min"] + 60 * np.arange(3)
+    with open(rollups.file_for_level("1min"), 'ab') as f:
+        f.write(unsaved.tobytes())
+
+    reopened = RollupStore(str(tmp_path / "rollups"), sample_store)
+    with open(reopened.state_path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    assert state['processed_until'] == rollups.processed_until
+    assert reopened.processed_until == rollups.processed_until
+    assert reopened.covered_from == rollups.covered_from
+    assert np.array_equal(reopened._read("1min"), minutes)
+    assert reopened.update(now=epochs[-1] + 60) == 0
+
+
+def test_rebuild_reads_days_without_samples_from_the_text_logs(tmp_path):
+    sample_store = SampleStore(str(tmp_path / "samples"))
+    day = datetime.datetime(2026, 2, 27)
+    epochs = int(day.timestamp()) + 30 + 45 * np.arange(500)
+    temps = 20 + (np.arange(500) % 13) * 0.5
+    with open(tmp_path / "temperature_logs_2026-02-27.logs", 'w', encoding='utf-8') as f:
+        for epoch, temp in zip(epochs, temps):
+            timestamp = datetime.datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+            f.write(f"[{timestamp}] 📊 {temp:.1f}°C (Source: CPU Package, Status: Normal)\n")
+        f.write(f"[{timestamp}] 🔧 System Shutdown: 99.0°C is not a reading\n")
+
+    rollups = RollupStore(str(tmp_path / "rollups"), sample_store)
+    rollups.rebuild(str(tmp_path), now=int(day.timestamp()) + 86400)
+    # Whole minutes: a log-only day has no raw samples for partial edge minutes
+    start, end = int(day.timestamp()) + 600 + 60, int(day.timestamp()) + 6 * 3600 - 120
+    assert_buckets_equal(rollups.buckets(start, end, 600),
+                         expected(epochs.astype(np.float64), temps, start, end, 600, rollups.utc_offset))
+    sample_store.close()
@@ -0,0 +1,83 @@
+import datetime
+import json
+
+import numpy as np
+
+from app.core.sample_store import SampleStore
+
+MIDNIGHT = datetime.datetime(2026, 3, 2)
+EPOCH = int(MIDNIGHT.timestamp())
+
+
+def test_records_are_packed_eleven_bytes_each(tmp_path):
+    store = SampleStore(str(tmp_path))
+    store.append(21.5, "CPU Package", "Warning", timestamp=EPOCH + 5)
+    store.append(22.25, "Samsung SSD", "Critical", timestamp=EPOCH + 7)
+    store.flush()
+
+    path = store.file_for_date(MIDNIGHT.date())
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert SampleStore.RECORD.size == 11 and len(data) == 22
+    assert SampleStore.RECORD.unpack(data[:11]) == (EPOCH + 5, 21.5, 1, 0)
+    assert SampleStore.RECORD.unpack(data[11:]) == (EPOCH + 7, 22.25, 2, 1)
+
+    with open(tmp_path / "sources.json", 'r', encoding='utf-8') as f:
+        assert json.load(f) == {"CPU Package": 0, "Samsung SSD": 1}
+    store.close()
+
+
+def test_sources_survive_a_restart(tmp_path):
+    store = SampleStore(str(tmp_path))
+    store.append(20.0, "CPU Package", timestamp=EPOCH)
+    store.append(20.0, "GPU Core", timestamp=EPOCH + 1)
+    store.close()
+
+    reopened = SampleStore(str(tmp_path))
+    assert reopened.source_names() == {0: "CPU Package", 1: "GPU Core"}
+    assert reopened.source_id("GPU Core") == 1
+    assert reopened.source_id("Drive") == 2
+
+
+def test_load_range_spans_midnight(tmp_path):
+    store = SampleStore(str(tmp_path))
+    epochs = EPOCH - 30 + 10 * np.arange(7)  # 23:59:30 .. 00:00:30
+    for i, epoch in enumerate(epochs):
+        store.append(20.0 + i, "CPU Package", timestamp=int(epoch))
+
+    # Unflushed samples are visible to load_range
+    samples = store.load_range(MIDNIGHT - datetime.timedelta(seconds=20),
+                               MIDNIGHT + datetime.timedelta(seconds=20))
+    assert list(samples['epoch']) == list(epochs[1:6])
+    assert list(samples['temp']) == [21.0, 22.0, 23.0, 24.0, 25.0]
+
+    assert len(store.load_day((MIDNIGHT - datetime.timedelta(days=1)).date())) == 3
+    assert len(store.load_day(MIDNIGHT.date())) == 4
+    assert store.dates() == [(MIDNIGHT - datetime.timedelta(days=1)).date(), MIDNIGHT.date()]
+    assert list(store.iter_range(MIDNIGHT, MIDNIGHT + datetime.timedelta(seconds=10))) == [
+        (EPOCH, 23.0, 0, 0), (EPOCH + 10, 24.0, 0, 0)]
+    store.close()
+
+
+def test_read_new_follows_the_file_and_ignores_a_partial_record(tmp_path):
+    store = SampleStore(str(tmp_path))
+    day = MIDNIGHT.date()
+    for i in range(3):
+        store.append(20.0 + i, "CPU Package", timestamp=EPOCH + i)
+    store.flush()
+
+    first = store.read_new(day)
+    assert [record[:2] for record in first] == [(EPOCH, 20.0), (EPOCH + 1, 21.0), (EPOCH + 2, 22.0)]
+
+    # A writer caught in the middle of a record
+    with open(store.file_for_date(day), 'ab') as f:
+        f.write(SampleStore.RECORD.pack(EPOCH + 3, 23.0, 0, 0)[:6])
+    assert store.read_new(day, len(first)) == []
+    assert store.record_count(day) == 3
+    assert len(store.load_day(day)) == 3
+
+    with open(store.file_for_date(day), 'ab') as f:
+        f.write(SampleStore.RECORD.pack(EPOCH + 3, 23.0, 0, 0)[6:])
+    assert store.read_new(day, len(first)) == [(EPOCH + 3, 23.0, 0, 0)]
+    assert store.read_new(datetime.date(2020, 1, 1)) == []
+    store.close()
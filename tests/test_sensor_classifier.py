@@ -0,0 +1,42 @@
+from app.services.sensor_classifier import SensorClassifier, STORAGE, GPU, CPU, OTHER
+
+
+def test_categories_in_priority_order():
+    classifier = SensorClassifier()
+    assert classifier.classify("Temperature", "Samsung SSD 970 EVO") == STORAGE
+    assert classifier.classify("GPU Core", "NVIDIA GeForce RTX 3080") == OTHER
+    assert classifier.classify("GPU Temp", "NVIDIA GeForce RTX 3080") == GPU
+    assert classifier.classify("CPU Package Temp", "Intel Core i7-9700K") == CPU
+    # "amd" is both a GPU and a CPU keyword; GPU is checked first
+    assert classifier.classify("Temperature", "AMD Ryzen 7 5800X") == GPU
+
+
+def test_storage_needs_a_temperature_name():
+    classifier = SensorClassifier()
+    # "intel ssd" is a storage keyword, but "Temp" only qualifies for GPU/CPU
+    assert classifier.classify("Temp", "Intel SSD 660p") == CPU
+    assert classifier.classify("Temperature", "Intel SSD 660p") == STORAGE
+
+
+def test_keywords_do_not_match_across_the_two_names():
+    classifier = SensorClassifier()
+    # "m." + "2" would only form "m.2" if the names were joined
+    assert classifier.classify("Temperature m.", "2") == OTHER
+    assert classifier.classify("Temperature", "M.2 Drive") == STORAGE
+
+
+def test_amd_hwmon_chips_are_cpu_sensors():
+    classifier = SensorClassifier()
+    assert classifier.classify("Tctl Temperature", "k10temp", "/hwmon1/k10temp/temperature/1") == CPU
+    assert classifier.classify("Tdie Temperature", "zenpower", "/hwmon2/zenpower/temperature/2") == CPU
+
+
+def test_results_are_cached_per_sensor():
+    classifier = SensorClassifier()
+    assert classifier.classify("Temperature", "Generic Hard Disk", "/hdd/0/temperature/0") == STORAGE
+
+    # A cached sensor is not matched again
+    classifier._checks = []
+    assert classifier.classify("Temperature", "Generic Hard Disk", "/hdd/0/temperature/0") == STORAGE
+    classifier.clear_cache()
+    assert classifier.classify("Temperature", "Generic Hard Disk", "/hdd/0/temperature/0") == OTHER
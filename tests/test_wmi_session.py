@@ -0,0 +1,97 @@
+import threading
+
+from app.services.sensor_backends import WMISensorBackend
+
+
+class FakeProperty:
+    def __init__(self, values, key):
+        self._values = values
+        self._key = key
+
+    @property
+    def Value(self):
+        return self._values[self._key]
+
+
+class FakeOleObject:
+    def __init__(self, values, key):
+        self._values = values
+        self._key = key
+
+    def Properties_(self, name):
+        assert name == 'Value'
+        return FakeProperty(self._values, self._key)
+
+
+class FakeSensor:
+    """Like a wmi 1.5.1 object: Value is the first value read and never changes"""
+
+    SensorType = "Temperature"
+
+    def __init__(self, values, key):
+        self.Name = key
+        self.Parent = "/hdd/0"
+        self.Identifier = f"/hdd/0/temperature/{key}"
+        self.Value = values[key]
+        self.ole_object = FakeOleObject(values, key)
+        self.refreshes = 0
+
+    def Refresh_(self):
+        self.refreshes += 1
+
+
+class FakeWMI:
+    """Stands in for the wmi module; counts connections and enumerations"""
+
+    def __init__(self):
+        self.values = {'Drive A': 40.0, 'Drive B': 42.0}
+        self.connects = 0
+        self.enumerations = 0
+        self.threads = set()
+
+    def WMI(self, namespace=None):
+        self.connects += 1
+        self.threads.add(threading.get_ident())
+        return self
+
+    def Sensor(self, SensorType=None):
+        self.enumerations += 1
+        return [FakeSensor(self.values, key) for key in self.values]
+
+
+def readings(backend):
+    return {sensor['name']: sensor['value'] for sensor in backend.read_sensors()}
+
+
+def test_polls_reuse_connection_and_see_new_values():
+    wmi = FakeWMI()
+    backend = WMISensorBackend(wmi_module=wmi)
+    assert backend.initialize(verbose=False)
+
+    assert readings(backend) == {'Drive A': 40.0, 'Drive B': 42.0}
+    wmi.values['Drive A'] = 47.5
+    assert readings(backend) == {'Drive A': 47.5, 'Drive B': 42.0}
+    wmi.values['Drive B'] = 39.0
+    assert readings(backend) == {'Drive A': 47.5, 'Drive B': 39.0}
+
+    assert wmi.connects == 1
+    assert wmi.enumerations == 1
+
+
+def test_each_thread_gets_its_own_connection():
+    wmi = FakeWMI()
+    backend = WMISensorBackend(wmi_module=wmi)
+    backend.initialize(verbose=False)
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(readings(backend)))
+    worker.start()
+    worker.join()
+
+    assert results == [{'Drive A': 40.0, 'Drive B': 42.0}]
+    assert wmi.connects == 2
+    assert len(wmi.threads) == 2
+
+    # The first thread keeps using its own connection
+    readings(backend)
+    assert wmi.connects == 2
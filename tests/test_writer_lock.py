@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+from app.core.writer_lock import WriterLock
+
+HOLD_LOCK = """
+import sys
+from app.core.writer_lock import WriterLock
+lock = WriterLock(sys.argv[1])
+print(lock.acquire(), flush=True)
+sys.stdin.read()
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_second_writer_is_refused_until_the_first_releases(tmp_path):
+    first = WriterLock(str(tmp_path))
+    second = WriterLock(str(tmp_path))
+
+    assert first.acquire()
+    assert first.acquire()
+    assert not second.acquire()
+
+    first.release()
+    assert second.acquire()
+    second.release()
+
+
+def test_lock_is_held_against_other_processes(tmp_path):
+    holder = subprocess.Popen([sys.executable, "-c", HOLD_LOCK, str(tmp_path)],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=ROOT)
+    try:
+        assert holder.stdout.readline().strip() == "True"
+        assert not WriterLock(str(tmp_path)).acquire()
+    finally:
+        holder.stdin.close()
+        holder.wait()
+
+    # The OS drops the lock when the holder exits
+    lock = WriterLock(str(tmp_path))
+    assert lock.acquire()
+    lock.release()
+
+
+def test_rollup_rebuild_refuses_while_logs_are_being_written(tmp_path, capsys):
+    from app.core.rollups import main
+
+    lock = WriterLock(str(tmp_path))
+    assert lock.acquire()
+    try:
+        assert main(["rebuild", "--logs-dir", str(tmp_path)]) == 1
+    finally:
+        lock.release()
+    assert "stop it first" in capsys.readouterr().out
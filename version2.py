@@ -23,6 +23,7 @@ import sys
 import traceback
 import ctypes
 import tkinter.filedialog as filedialog
+from types import MappingProxyType
 
 
 class ResponsiveDesign:
@@ -264,7 +265,7 @@ class LogManager:
     def __init__(self):
         self.daily_logs_dir = "Daily logs"
         self.current_log_file = None
-        self.log_buffer = []
+        self.log_buffer = deque(maxlen=5000)
         self.last_log_index = 0
         self.setup_logging()
     
@@ -1143,15 +1144,16 @@ class SearchResultModal:
         
         temperature_entries.sort(key=lambda x: x['timestamp'])
         
-        # Condition 3: Filter to show only every 5 minutes interval for cleaner graph
-        filtered_entries = self.filter_5_minute_intervals(temperature_entries)
+        self.fig = plt.figure(figsize=(12, 6))
+        self.fig.patch.set_facecolor(self.colors['card_bg'])
+        
+        # Thin to the lowest/highest reading per pixel column so spikes stay visible
+        pixel_width = int(self.fig.get_figwidth() * self.fig.dpi * 0.8)
+        filtered_entries = self.decimate_for_width(temperature_entries, pixel_width)
         
         dates = [entry['timestamp'] for entry in filtered_entries]
         temperatures = [entry['temperature'] for entry in filtered_entries]
         
-        self.fig = plt.figure(figsize=(12, 6))
-        self.fig.patch.set_facecolor(self.colors['card_bg'])
-        
         if self.colors['background'] == '#0f172a':
             text_color = 'white'
             grid_color = '#2d3748'
@@ -1161,15 +1163,15 @@ class SearchResultModal:
             grid_color = '#e2e8f0'
             line_color = '#2563eb'
         
-        # Plot graph with filtered data (every 5 minutes)
-        plt.plot(dates, temperatures, marker='o', label="Temperature (°C)", 
+        # Plot graph with the thinned data; markers only while points can be told apart
+        marker = 'o' if len(dates) <= 500 else None
+        plt.plot(dates, temperatures, marker=marker, label="Temperature (°C)", 
                 color=line_color, linewidth=2, markersize=6)
         
         plt.xlabel("Date and Time", color=text_color, fontsize=12)
         plt.ylabel("Temperature (°C)", color=text_color, fontsize=12)
         
-        # Add note about 5-minute intervals
-        plt.title(f"Temperature History (5-minute intervals): {self.start_datetime.strftime('%Y-%m-%d %H:%M')} to {self.end_datetime.strftime('%Y-%m-%d %H:%M')}", 
+        plt.title(f"Temperature History: {self.start_datetime.strftime('%Y-%m-%d %H:%M')} to {self.end_datetime.strftime('%Y-%m-%d %H:%M')}", 
                  color=text_color, fontsize=14, fontweight='bold', pad=15)
         
         plt.legend(fontsize=11, framealpha=0.9)
@@ -1264,7 +1266,7 @@ class SearchResultModal:
         if filtered_entries:
             total_points = len(temperature_entries)
             filtered_points = len(filtered_entries)
-            ax.annotate(f'Showing {filtered_points} of {total_points} data points\n(5-minute intervals)',
+            ax.annotate(f'Showing {filtered_points} of {total_points} data points\n(min/max per pixel)',
                        xy=(0.02, 0.98), xycoords='axes fraction',
                        bbox=dict(boxstyle='round,pad=0.3', facecolor='lightblue', alpha=0.7),
                        fontsize=8,
@@ -1275,33 +1277,69 @@ class SearchResultModal:
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
     
-    def filter_5_minute_intervals(self, temperature_entries):
-        """Filter temperature entries to show only every 5 minutes interval"""
-        if not temperature_entries:
-            return []
-        
-        filtered_entries = []
-        last_selected_time = None
-        
-        for entry in temperature_entries:
-            current_time = entry['timestamp']
-            
-            # Select first entry
-            if last_selected_time is None:
-                filtered_entries.append(entry)
-                last_selected_time = current_time
-            # Check if 5 minutes have passed since last selected entry
-            elif (current_time - last_selected_time).total_seconds() >= 300:  # 300 seconds = 5 minutes
-                filtered_entries.append(entry)
-                last_selected_time = current_time
+    def decimate_for_width(self, temperature_entries, pixel_width):
+        """Keep the first, last, lowest and highest entry of each pixel column"""
+        if len(temperature_entries) <= 2 * pixel_width + 2:
+            return temperature_entries
+        
+        first_time = temperature_entries[0]['timestamp']
+        span = (temperature_entries[-1]['timestamp'] - first_time).total_seconds() or 1
+        
+        keep = {0, len(temperature_entries) - 1}
+        current_column = None
+        lowest = highest = None
+        
+        for i, entry in enumerate(temperature_entries):
+            column = min(int((entry['timestamp'] - first_time).total_seconds() / span * pixel_width),
+                         pixel_width - 1)
+            if column != current_column:
+                if current_column is not None:
+                    keep.update((lowest, highest))
+                current_column = column
+                lowest = highest = i
+            else:
+                if entry['temperature'] < temperature_entries[lowest]['temperature']:
+                    lowest = i
+                if entry['temperature'] > temperature_entries[highest]['temperature']:
+                    highest = i
+        keep.update((lowest, highest))
+        
+        filtered_entries = [temperature_entries[i] for i in sorted(keep)]
+        print(f"📊 Graph data: {len(temperature_entries)} total entries -> {len(filtered_entries)} entries (min/max per pixel)")
+        return filtered_entries
+
+class SensorSnapshot:
+    """Immutable result of one sensor scan, shared by the monitor, UI, logger and alerts"""
+    __slots__ = ('devices', 'max_temp', 'max_device', 'avg_temp', 'timestamp')
+    
+    def __init__(self, devices=None, timestamp=None):
+        devices = dict(devices) if devices else {}
         
-        # Always include the last entry
-        if filtered_entries and temperature_entries:
-            if filtered_entries[-1] != temperature_entries[-1]:
-                filtered_entries.append(temperature_entries[-1])
+        object.__setattr__(self, 'devices', MappingProxyType(devices))
+        object.__setattr__(self, 'timestamp', timestamp if timestamp is not None else time.time())
         
-        print(f"📊 Graph data: {len(temperature_entries)} total entries -> {len(filtered_entries)} entries (5-min intervals)")
-        return filtered_entries
+        if devices:
+            max_device = max(devices, key=devices.get)
+            object.__setattr__(self, 'max_device', max_device)
+            object.__setattr__(self, 'max_temp', devices[max_device])
+            object.__setattr__(self, 'avg_temp', sum(devices.values()) / len(devices))
+        else:
+            object.__setattr__(self, 'max_device', None)
+            object.__setattr__(self, 'max_temp', None)
+            object.__setattr__(self, 'avg_temp', None)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("SensorSnapshot is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("SensorSnapshot is immutable")
+    
+    def __bool__(self):
+        return bool(self.devices)
+    
+    def __repr__(self):
+        return (f"SensorSnapshot(devices={dict(self.devices)!r}, max_temp={self.max_temp!r}, "
+                f"avg_temp={self.avg_temp!r}, timestamp={self.timestamp!r})")
 
 class StorageTemperatureReader:
     def __init__(self):
@@ -1566,24 +1604,25 @@ class StorageTemperatureReader:
         
         return storage_temps if storage_temps else None
     
-    def get_average_storage_temperature(self):
-        storage_temps = self.get_storage_temperatures()
-        if storage_temps:
-            avg_temp = sum(storage_temps.values()) / len(storage_temps)
-            print(f"📈 Average storage temperature: {avg_temp:.1f}°C")
-            return avg_temp
-        else:
-            return None
+    def get_snapshot(self):
+        """Scan the sensors once and return a SensorSnapshot for this cycle"""
+        snapshot = SensorSnapshot(self.get_storage_temperatures())
+        
+        if snapshot:
+            print(f"🔥 Hottest storage: {snapshot.max_device} at {snapshot.max_temp:.1f}°C")
+            print(f"📈 Average storage temperature: {snapshot.avg_temp:.1f}°C")
+        
+        return snapshot
     
-    def get_max_storage_temperature(self):
-        storage_temps = self.get_storage_temperatures()
-        if storage_temps:
-            max_temp = max(storage_temps.values())
-            max_device = max(storage_temps, key=storage_temps.get)
-            print(f"🔥 Hottest storage: {max_device} at {max_temp:.1f}°C")
-            return max_temp
-        else:
-            return None
+    def get_average_storage_temperature(self, snapshot=None):
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        return snapshot.avg_temp
+    
+    def get_max_storage_temperature(self, snapshot=None):
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        return snapshot.max_temp
     
     def get_detailed_sensor_info(self):
         if not self.wmi_available:
@@ -1650,6 +1689,7 @@ class TemperatureMonitor:
         self.max_temp = float('-inf')
         
         self.storage_temperatures = {}
+        self.current_snapshot = SensorSnapshot()
         
         self.temp_reader = StorageTemperatureReader()
         
@@ -2254,8 +2294,9 @@ class TemperatureMonitor:
             msg['To'] = self.email_config['receiver_email']
             msg['Subject'] = f"Storage Temperature Report - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             
-            current_temps = self.storage_temperatures
-            current_max = self.temp_reader.get_max_storage_temperature()
+            snapshot = self.current_snapshot
+            current_temps = snapshot.devices
+            current_max = snapshot.max_temp
             
             actions = []
             if current_max is not None:
@@ -2585,9 +2626,11 @@ No response is required unless immediate action is indicated above.
         
         while self.is_monitoring:
             try:
-                self.storage_temperatures = self.temp_reader.get_storage_temperatures()
-                max_temp = self.temp_reader.get_max_storage_temperature()
-                avg_temp = self.temp_reader.get_average_storage_temperature()
+                snapshot = self.temp_reader.get_snapshot()
+                self.current_snapshot = snapshot
+                self.storage_temperatures = snapshot.devices
+                max_temp = snapshot.max_temp
+                avg_temp = snapshot.avg_temp
                 cpu_percent, memory_percent = self.get_system_info()
                 
                 if max_temp is not None:
@@ -2708,9 +2751,11 @@ No response is required unless immediate action is indicated above.
         messagebox.showinfo("Alerts Disabled", "Storage temperature alert monitoring is now inactive.")
     
     def manual_refresh(self):
-        self.storage_temperatures = self.temp_reader.get_storage_temperatures()
-        max_temp = self.temp_reader.get_max_storage_temperature()
-        avg_temp = self.temp_reader.get_average_storage_temperature()
+        snapshot = self.temp_reader.get_snapshot()
+        self.current_snapshot = snapshot
+        self.storage_temperatures = snapshot.devices
+        max_temp = snapshot.max_temp
+        avg_temp = snapshot.avg_temp
         cpu_percent, memory_percent = self.get_system_info()
         if max_temp is not None:
             self.update_display(max_temp, avg_temp, cpu_percent, memory_percent, 